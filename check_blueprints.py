@@ -1,5 +1,8 @@
 import unreal
 
+# Collect output and emit it as a single Output Log entry at the end
+out = []
+
 # Check if Blueprints were created
 bp_paths = [
     '/Game/Imported/teal_chair_Blueprint',
@@ -7,34 +10,53 @@ bp_paths = [
     '/Game/Imported/table_Blueprint'
 ]
 
-unreal.log("\n=== Checking for Blueprints ===")
+# Query the asset registry once for all Blueprints in the folder instead of
+# issuing a does_asset_exist + load_asset round-trip per path
+registry = unreal.AssetRegistryHelpers.get_asset_registry()
+bp_filter = unreal.ARFilter(
+    package_paths=['/Game/Imported'],
+    recursive_paths=False,
+    class_paths=[unreal.TopLevelAssetPath('/Script/Engine', 'Blueprint')]
+)
+found = {str(data.package_name): data for data in registry.get_assets(bp_filter)}
+
+# Resolve the component class once rather than per lookup
+SMC = unreal.StaticMeshComponent
+
+out.append("\n=== Checking for Blueprints ===")
 for bp_path in bp_paths:
-    if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
-        bp = unreal.EditorAssetLibrary.load_asset(bp_path)
-        unreal.log(f"✓ Found: {bp_path}")
-        unreal.log(f"  Type: {type(bp).__name__}")
+    asset_data = found.get(bp_path)
+    if asset_data:
+        bp = asset_data.get_asset()
+        out.append(f"✓ Found: {bp_path}")
+        out.append(f"  Type: {bp.__class__.__name__}")
         
         # Try to get component count
         try:
             bp_class = bp.generated_class()
             if bp_class:
                 cdo = unreal.get_default_object(bp_class)
-                components = cdo.get_components_by_class(unreal.StaticMeshComponent)
-                unreal.log(f"  Components: {len(components)} StaticMeshComponents")
+                components = cdo.get_components_by_class(SMC)
+                out.append(f"  Components: {len(components)} StaticMeshComponents")
                 for i, comp in enumerate(components[:5]):  # Show first 5
-                    mesh = comp.get_editor_property("static_mesh")
+                    mesh = comp.static_mesh
                     if mesh:
-                        unreal.log(f"    {i+1}. {comp.get_name()}: {mesh.get_name()}")
+                        out.append(f"    {i+1}. {comp.get_name()}: {mesh.get_name()}")
         except Exception as e:
-            unreal.log(f"  Error checking components: {e}")
+            out.append(f"  Error checking components: {e}")
     else:
-        unreal.log(f"✗ Not found: {bp_path}")
+        out.append(f"✗ Not found: {bp_path}")
 
-unreal.log("\n=== Checking spawned actors in level ===")
+out.append("\n=== Checking spawned actors in level ===")
 all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-for actor in all_actors:
+# Match labels in native code rather than looping over every actor in Python
+contains = unreal.EditorScriptingStringMatchType.CONTAINS
+chairs = unreal.EditorFilterLibrary.by_actor_label(all_actors, 'chair', contains)
+tables = unreal.EditorFilterLibrary.by_actor_label(all_actors, 'table', contains)
+for actor in list(chairs) + [a for a in tables if a not in chairs]:
     label = actor.get_actor_label()
-    if 'chair' in label.lower() or 'table' in label.lower():
-        unreal.log(f"Actor: {label} ({type(actor).__name__})")
-        components = actor.get_components_by_class(unreal.StaticMeshComponent)
-        unreal.log(f"  Components: {len(components)}")
+    out.append(f"Actor: {label} ({type(actor).__name__})")
+    components = actor.get_components_by_class(SMC)
+    out.append(f"  Components: {len(components)}")
+
+unreal.log("\n".join(out))
@@ -1,5 +1,8 @@
 import unreal
 
+# Collect output and emit it as a single Output Log entry at the end
+out = []
+
 # Check what assets were imported
 folders = [
     '/Game/Imported/teal_chair',
@@ -7,20 +10,24 @@ folders = [
     '/Game/Imported/table'
 ]
 
+# Classify from asset registry metadata - no need to load (deserialize) each asset
+registry = unreal.AssetRegistryHelpers.get_asset_registry()
+
 for folder in folders:
-    unreal.log(f"\n=== Checking {folder} ===")
+    out.append(f"\n=== Checking {folder} ===")
     if unreal.EditorAssetLibrary.does_directory_exist(folder):
-        assets = unreal.EditorAssetLibrary.list_assets(folder, recursive=False)
-        unreal.log(f"Total assets: {len(assets)}")
+        asset_datas = registry.get_assets_by_path(folder, recursive=False)
+        out.append(f"Total assets: {len(asset_datas)}")
         
-        meshes = []
-        for asset_path in assets:
-            asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-            asset_type = type(asset).__name__
-            unreal.log(f"  - {asset_path.split('/')[-1]}: {asset_type}")
-            if isinstance(asset, unreal.StaticMesh):
-                meshes.append(asset)
+        mesh_count = 0
+        for asset_data in asset_datas:
+            asset_type = str(asset_data.asset_class_path.asset_name)
+            out.append(f"  - {asset_data.asset_name}: {asset_type}")
+            if asset_type == 'StaticMesh':
+                mesh_count += 1
         
-        unreal.log(f"StaticMesh count: {len(meshes)}")
+        out.append(f"StaticMesh count: {mesh_count}")
     else:
-        unreal.log(f"Folder doesn't exist")
+        out.append(f"Folder doesn't exist")
+
+unreal.log("\n".join(out))
@@ -1,5 +1,8 @@
 import unreal
 
+# Collect output and emit it as a single Output Log entry at the end
+out = []
+
 # Check what's REALLY in the folders with full detail
 folders = [
     '/Game/Imported/teal_chair',
@@ -7,54 +10,67 @@ folders = [
     '/Game/Imported/table'
 ]
 
+MATERIAL_CLASSES = {'Material', 'MaterialInstanceConstant', 'MaterialInstanceDynamic'}
+MAX_SHOW = 5  # Materials/textures listed per folder
+
+# Classify from asset registry metadata - no need to load (deserialize) each asset
+registry = unreal.AssetRegistryHelpers.get_asset_registry()
+
 for folder in folders:
-    unreal.log(f"\n{'='*60}")
-    unreal.log(f"Folder: {folder}")
-    unreal.log(f"{'='*60}")
+    out.append(f"\n{'='*60}")
+    out.append(f"Folder: {folder}")
+    out.append(f"{'='*60}")
     
     if not unreal.EditorAssetLibrary.does_directory_exist(folder):
-        unreal.log("✗ Folder doesn't exist")
+        out.append("✗ Folder doesn't exist")
         continue
     
-    assets = unreal.EditorAssetLibrary.list_assets(folder, recursive=False)
-    unreal.log(f"Total assets in folder: {len(assets)}")
+    asset_datas = registry.get_assets_by_path(folder, recursive=False)
+    out.append(f"Total assets in folder: {len(asset_datas)}")
     
+    # Materials and textures only keep a short preview; the rest are counted
     meshes = []
-    materials = []
-    textures = []
+    mat_preview = []
+    mat_count = 0
+    tex_preview = []
+    tex_count = 0
     other = []
     
-    for asset_path in assets:
-        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-        asset_name = asset_path.split('/')[-1]
-        asset_type = type(asset).__name__
+    for asset_data in asset_datas:
+        asset_type = str(asset_data.asset_class_path.asset_name)
         
-        if isinstance(asset, unreal.StaticMesh):
-            meshes.append(asset_name)
-        elif isinstance(asset, unreal.Material) or isinstance(asset, unreal.MaterialInstance):
-            materials.append(asset_name)
-        elif isinstance(asset, unreal.Texture2D):
-            textures.append(asset_name)
+        if asset_type == 'StaticMesh':
+            meshes.append(str(asset_data.asset_name))
+        elif asset_type in MATERIAL_CLASSES:
+            mat_count += 1
+            if len(mat_preview) < MAX_SHOW:
+                mat_preview.append(str(asset_data.asset_name))
+        elif asset_type == 'Texture2D':
+            tex_count += 1
+            if len(tex_preview) < MAX_SHOW:
+                tex_preview.append(str(asset_data.asset_name))
         else:
-            other.append(f"{asset_name} ({asset_type})")
+            other.append(f"{asset_data.asset_name} ({asset_type})")
     
-    unreal.log(f"\nStaticMeshes ({len(meshes)}):")
+    out.append(f"\nStaticMeshes ({len(meshes)}):")
     for mesh in meshes:
-        unreal.log(f"  - {mesh}")
+        out.append(f"  - {mesh}")
     
-    unreal.log(f"\nMaterials ({len(materials)}):")
-    for mat in materials[:5]:  # Show first 5
-        unreal.log(f"  - {mat}")
-    if len(materials) > 5:
-        unreal.log(f"  ... and {len(materials)-5} more")
+    out.append(f"\nMaterials ({mat_count}):")
+    for mat in mat_preview:
+        out.append(f"  - {mat}")
+    if mat_count > MAX_SHOW:
+        out.append(f"  ... and {mat_count - MAX_SHOW} more")
     
-    unreal.log(f"\nTextures ({len(textures)}):")
-    for tex in textures[:5]:  # Show first 5
-        unreal.log(f"  - {tex}")
-    if len(textures) > 5:
-        unreal.log(f"  ... and {len(textures)-5} more")
+    out.append(f"\nTextures ({tex_count}):")
+    for tex in tex_preview:
+        out.append(f"  - {tex}")
+    if tex_count > MAX_SHOW:
+        out.append(f"  ... and {tex_count - MAX_SHOW} more")
     
     if other:
-        unreal.log(f"\nOther ({len(other)}):")
+        out.append(f"\nOther ({len(other)}):")
         for o in other:
-            unreal.log(f"  - {o}")
+            out.append(f"  - {o}")
+
+unreal.log("\n".join(out))
@@ -1,16 +1,34 @@
 import unreal
 
+# Collect output and emit it as a single Output Log entry at the end
+out = []
+
 bp_paths = [
     '/Game/Imported/teal_chair_Blueprint',
     '/Game/Imported/white_chair_Blueprint',
     '/Game/Imported/table_Blueprint'
 ]
 
+# Resolve which Blueprints exist with one asset registry query
+registry = unreal.AssetRegistryHelpers.get_asset_registry()
+bp_filter = unreal.ARFilter(
+    package_paths=['/Game/Imported'],
+    recursive_paths=False,
+    class_paths=[unreal.TopLevelAssetPath('/Script/Engine', 'Blueprint')]
+)
+found = {str(data.package_name): data for data in registry.get_assets(bp_filter)}
+
+existing = [path for path in bp_paths if path in found]
 for path in bp_paths:
-    if unreal.EditorAssetLibrary.does_asset_exist(path):
-        unreal.EditorAssetLibrary.delete_asset(path)
-        unreal.log(f"✓ Deleted {path}")
-    else:
-        unreal.log(f"Not found: {path}")
+    if path not in found:
+        out.append(f"Not found: {path}")
+
+# Delete in a single call (one transaction / content browser refresh)
+if existing:
+    unreal.EditorAssetLibrary.delete_loaded_assets([found[path].get_asset() for path in existing])
+    for path in existing:
+        out.append(f"✓ Deleted {path}")
+
+out.append("✓ All Blueprints deleted, ready to test SubobjectDataSubsystem")
 
-unreal.log("✓ All Blueprints deleted, ready to test SubobjectDataSubsystem")
+unreal.log("\n".join(out))
@@ -7,19 +7,141 @@ Useful for updating existing projects with latest code.
 Usage:
     python deploy.py <target_project_path>
     python deploy.py "C:/Users/cwood/Documents/Unreal Projects/Test1"
+    python deploy.py --no-link <target_project_path>
 """
 
+import os
 import sys
 import shutil
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 
-def deploy_to_project(target_project_path: str):
+# Bytecode caches are rebuilt by the editor and never deployed
+_IGNORE = shutil.ignore_patterns('__pycache__', '*.pyc')
+
+
+def _is_current(src, dst) -> bool:
+    """Check whether dst already matches src by size and mtime (rsync-style)"""
+    try:
+        s = os.stat(src)
+        d = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    return s.st_size == d.st_size and int(s.st_mtime) == int(d.st_mtime)
+
+
+def _copy_file(src, dst):
+    """Copy src to dst, replacing (never writing through) any existing file"""
+    # A hard link left by a previous --link deploy is replaced with a real copy
+    if _is_current(src, dst) and not os.path.samefile(src, dst):
+        return dst
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    return shutil.copy2(src, dst)
+
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a full copy (e.g. across volumes)"""
+    if _is_current(src, dst):
+        return dst
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return shutil.copy2(src, dst)
+
+
+def _remove_stale(source_dir: Path, target_dir: Path) -> int:
+    """
+    Delete entries under target_dir that have no counterpart in source_dir
+    
+    Copying over an existing deploy leaves behind files that were deleted
+    or renamed in the source, and the editor would keep importing them.
+    
+    Returns:
+        Number of files and directories removed
+    """
+    removed = 0
+    for entry in os.scandir(target_dir):
+        source = source_dir / entry.name
+        deployed = not _IGNORE(os.fspath(source_dir), [entry.name])
+        
+        if entry.is_dir(follow_symlinks=False):
+            if deployed and source.is_dir():
+                removed += _remove_stale(source, Path(entry.path))
+                continue
+            shutil.rmtree(entry.path)
+        elif deployed and source.is_file():
+            continue
+        else:
+            os.unlink(entry.path)
+        removed += 1
+    return removed
+
+
+def _copy_one(
+    source_dir: Path,
+    target_dir: Path,
+    dir_name: str,
+    description: str,
+    copy_function: Callable
+) -> Tuple[bool, List[str]]:
+    """
+    Copy a single directory
+    
+    Output lines are returned rather than printed so that concurrent
+    copies don't interleave their messages.
+    
+    Returns:
+        Tuple of (success, output lines)
+    """
+    if not source_dir.exists():
+        return False, [f"⚠️  Skipping {dir_name}: Source not found"]
+    
+    # Count Python files as they are copied instead of re-walking the target
+    file_count = 0
+    
+    def copy_and_count(src, dst):
+        nonlocal file_count
+        if os.fspath(src).endswith('.py'):
+            file_count += 1
+        return copy_function(src, dst)
+    
+    try:
+        # Copy directory (updates existing files in place), then drop
+        # whatever the source no longer has
+        shutil.copytree(
+            source_dir,
+            target_dir,
+            copy_function=copy_and_count,
+            ignore=_IGNORE,
+            dirs_exist_ok=True
+        )
+        removed = _remove_stale(source_dir, target_dir)
+        
+        stale = f", {removed} stale removed" if removed else ""
+        return True, [
+            f"📦 Copying {dir_name}... ✓ ({file_count} Python files{stale})",
+            f"   {description}",
+        ]
+        
+    except Exception as e:
+        return False, [f"📦 Copying {dir_name}... ❌ Error copying {dir_name}: {e}"]
+
+
+def deploy_to_project(target_project_path: str, link: Optional[bool] = None):
     """
     Deploy latest libraries to target project
     
     Args:
         target_project_path: Path to target Unreal project root
+        link: Hard-link files instead of copying them. If None, links when
+              source and target are on the same volume.
     """
     # Convert to Path
     target_project = Path(target_project_path)
@@ -35,11 +157,17 @@ def deploy_to_project(target_project_path: str):
     # Create scripts directory if it doesn't exist
     target_scripts.mkdir(exist_ok=True)
     
+    # Hard links only work within one volume
+    if link is None:
+        link = target_scripts.stat().st_dev == source_scripts.stat().st_dev
+    copy_function = _link_or_copy if link else _copy_file
+    
     print("=" * 70)
     print("DEPLOYING LATEST LIBRARIES")
     print("=" * 70)
     print(f"\nSource: {source_scripts}")
-    print(f"Target: {target_scripts}\n")
+    print(f"Target: {target_scripts}")
+    print(f"Mode:   {'hard link' if link else 'copy'}\n")
     
     # List of directories to copy
     directories_to_copy = [
@@ -51,33 +179,25 @@ def deploy_to_project(target_project_path: str):
     
     success_count = 0
     
-    for dir_name, description in directories_to_copy:
-        source_dir = source_scripts / dir_name
-        target_dir = target_scripts / dir_name
-        
-        if not source_dir.exists():
-            print(f"⚠️  Skipping {dir_name}: Source not found")
-            continue
-        
-        try:
-            # Remove target if it exists (for clean copy)
-            if target_dir.exists():
-                print(f"🗑️  Removing old {dir_name}...")
-                shutil.rmtree(target_dir)
-            
-            # Copy directory
-            print(f"📦 Copying {dir_name}...", end=" ")
-            shutil.copytree(source_dir, target_dir)
-            
-            # Count files
-            file_count = sum(1 for _ in target_dir.rglob('*.py'))
-            print(f"✓ ({file_count} Python files)")
-            print(f"   {description}")
-            
-            success_count += 1
-            
-        except Exception as e:
-            print(f"❌ Error copying {dir_name}: {e}")
+    # Directories are independent and copying is I/O-bound, so copy them
+    # concurrently; results are reported in list order
+    with ThreadPoolExecutor(max_workers=len(directories_to_copy)) as pool:
+        futures = [
+            pool.submit(
+                _copy_one,
+                source_scripts / dir_name,
+                target_scripts / dir_name,
+                dir_name,
+                description,
+                copy_function
+            )
+            for dir_name, description in directories_to_copy
+        ]
+        for future in futures:
+            success, lines = future.result()
+            print("\n".join(lines))
+            if success:
+                success_count += 1
     
     print("\n" + "=" * 70)
     print(f"DEPLOYMENT COMPLETE: {success_count}/{len(directories_to_copy)} directories copied")
@@ -94,15 +214,28 @@ def deploy_to_project(target_project_path: str):
 
 def main():
     """Main entry point"""
-    if len(sys.argv) < 2:
-        print("Usage: python deploy.py <target_project_path>")
-        print("\nExample:")
-        print('  python deploy.py "C:/Users/cwood/Documents/Unreal Projects/Test1"')
-        print('  python deploy.py "../Test1"')
-        sys.exit(1)
-    
-    target_path = sys.argv[1]
-    success = deploy_to_project(target_path)
+    parser = argparse.ArgumentParser(
+        description='Deploy latest libraries to a target Unreal project',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python deploy.py "C:/Users/cwood/Documents/Unreal Projects/Test1"
+  python deploy.py "../Test1"
+        """
+    )
+    parser.add_argument(
+        'target_project_path',
+        help='Path to target Unreal project root'
+    )
+    parser.add_argument(
+        '--link',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Hard-link files instead of copying (default: on when on the same volume)'
+    )
+    
+    args = parser.parse_args()
+    success = deploy_to_project(args.target_project_path, link=args.link)
     
     sys.exit(0 if success else 1)
 
@@ -19,8 +19,7 @@ loader = WorkflowLoader()
 
 # List available workflows
 print("\nAvailable workflows:")
-for workflow_file in loader.list_workflows():
-    info = loader.get_workflow_info(workflow_file)
+for info in loader.list_workflow_infos():
     print(f"  - {info['name']}: {info['description']}")
     print(f"    File: {info['file']}, Tasks: {info['task_count']}")
 
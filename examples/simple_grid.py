@@ -20,16 +20,20 @@ spacing = 200.0
 
 unreal.log(f"Spawning {rows}x{cols} grid of cubes...")
 
-# Spawn grid
+# Precompute grid coordinates (row-major) so the spawn loop only spawns
+xs = [(col - (cols - 1) / 2) * spacing for col in range(cols)]
+ys = [(row - (rows - 1) / 2) * spacing for row in range(rows)]
+coords = [(x, y, 0) for y in ys for x in xs]
+
+# Spawn grid inside a single undo transaction, with selection cleared once
+# up front so each spawn doesn't trigger a selection/viewport update
+rotation = unreal.Rotator(0, 0, 0)
+editor_actor_subsystem.set_selected_level_actors([])
+
 count = 0
-for row in range(rows):
-    for col in range(cols):
-        x = col * spacing - (cols - 1) * spacing / 2
-        y = row * spacing - (rows - 1) * spacing / 2
-        z = 0
-        
+with unreal.ScopedEditorTransaction("Spawn grid"):
+    for x, y, z in coords:
         location = unreal.Vector(x, y, z)
-        rotation = unreal.Rotator(0, 0, 0)
         
         actor = editor_actor_subsystem.spawn_actor_from_object(
             cube_mesh,
@@ -19,10 +19,15 @@ print("="*60)
 print("\nClearing old example shapes...")
 editor_actor = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 all_actors = editor_actor.get_all_level_actors()
-for actor in all_actors:
-    if actor.get_actor_label().startswith("example_"):
-        editor_actor.destroy_actor(actor)
-        print(f"  Deleted: {actor.get_actor_label()}")
+old_examples = unreal.EditorFilterLibrary.by_actor_label(
+    all_actors,
+    "example_*",
+    unreal.EditorScriptingStringMatchType.MATCHES_WILDCARD,
+    ignore_case=False
+)
+with unreal.ScopedEditorTransaction("Clear example shapes"):
+    editor_actor.destroy_actors(old_examples)
+print(f"  Deleted {len(old_examples)} old example shapes")
 
 # Example 1: Spawn individual cubes
 print("\n1. Spawning three colored cubes...")
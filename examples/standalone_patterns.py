@@ -16,12 +16,15 @@ cube_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cube")
 sphere_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Sphere")
 cylinder_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder")
 
+# All patterns spawn unrotated, so build the rotator once
+ZERO_ROTATION = unreal.Rotator(0, 0, 0)
+
 def spawn_mesh(mesh, location, scale=1.0):
     """Helper to spawn a mesh at location"""
     actor = editor_actor.spawn_actor_from_object(
         mesh,
         unreal.Vector(*location),
-        unreal.Rotator(0, 0, 0)
+        ZERO_ROTATION
     )
     if scale != 1.0:
         actor.set_actor_scale3d(unreal.Vector(scale, scale, scale))
@@ -29,33 +32,37 @@ def spawn_mesh(mesh, location, scale=1.0):
 
 unreal.log("Spawning multiple patterns...")
 
-# 1. Grid of cubes (center)
-unreal.log("Pattern 1: Grid of cubes")
-for row in range(3):
-    for col in range(3):
-        x = col * 300 - 300
-        y = row * 300 - 300
-        spawn_mesh(cube_mesh, (x, y, 0))
+# Precompute pattern coordinates up front so the spawn loops only spawn
+grid_coords = [(col * 300 - 300, row * 300 - 300, 0) for row in range(3) for col in range(3)]
 
-# 2. Circle of spheres
-unreal.log("Pattern 2: Circle of spheres")
 radius = 800
-for i in range(12):
-    angle = (2 * math.pi * i) / 12
-    x = radius * math.cos(angle)
-    y = radius * math.sin(angle)
-    spawn_mesh(sphere_mesh, (x, y, 100))
-
-# 3. Spiral of cylinders
-unreal.log("Pattern 3: Spiral of cylinders")
-for i in range(15):
-    t = i / 14
-    angle = 4 * math.pi * t
-    r = 600 * t
-    x = r * math.cos(angle)
-    y = r * math.sin(angle)
-    z = i * 30
-    spawn_mesh(cylinder_mesh, (x, y, z), scale=0.5)
+circle_angles = [(2 * math.pi * i) / 12 for i in range(12)]
+circle_coords = [(radius * math.cos(a), radius * math.sin(a), 100) for a in circle_angles]
+
+spiral_t = [i / 14 for i in range(15)]
+spiral_coords = [
+    (600 * t * math.cos(4 * math.pi * t), 600 * t * math.sin(4 * math.pi * t), i * 30)
+    for i, t in enumerate(spiral_t)
+]
+
+# Clear selection once and group all spawns into one undo transaction
+editor_actor.set_selected_level_actors([])
+
+with unreal.ScopedEditorTransaction("Spawn patterns"):
+    # 1. Grid of cubes (center)
+    unreal.log("Pattern 1: Grid of cubes")
+    for location in grid_coords:
+        spawn_mesh(cube_mesh, location)
+
+    # 2. Circle of spheres
+    unreal.log("Pattern 2: Circle of spheres")
+    for location in circle_coords:
+        spawn_mesh(sphere_mesh, location)
+
+    # 3. Spiral of cylinders
+    unreal.log("Pattern 3: Spiral of cylinders")
+    for location in spiral_coords:
+        spawn_mesh(cylinder_mesh, location, scale=0.5)
 
 # Count total actors
 all_actors = editor_actor.get_all_level_actors()
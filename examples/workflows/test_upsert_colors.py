@@ -43,19 +43,19 @@ rainbow_colors = [
     ('pink', COLORS['pink']),
 ]
 
-for i, (color_name, color) in enumerate(rainbow_colors):
-    row = i // 3
-    col = i % 3
-    
-    graph.add_task(
+graph.add_tasks(
+    [
         SetActorColorTask(
             name=f"color_{color_name}",
             actor_labels=[f"workflow_grid_{row}_{col}"],
             color=color,
             opacity=1.0
-        ),
-        depends_on=["spawn_grid"]
-    )
+        )
+        for i, (color_name, color) in enumerate(rainbow_colors)
+        for row, col in [divmod(i, 3)]
+    ],
+    depends_on=["spawn_grid"]
+)
 
 # Execute with clean slate config
 config = WorkflowConfig.get_preset_config("clean_slate")
@@ -7,11 +7,13 @@ This example shows how to:
 3. Add new actors without duplicating existing ones
 """
 
+import itertools
+
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor, WorkflowConfig
 from unreallib.tasks import (
     ClearLevelTask,
     SpawnGridTask,
-    SetActorColorTask,
+    SetActorColorsTask,
 )
 from unreallib.materials import COLORS
 
@@ -74,20 +76,20 @@ def run_upsert_demo():
         COLORS['purple'], COLORS['magenta'], COLORS['pink']
     ]
     
-    # Create individual color tasks for each position
-    for i, color in enumerate(rainbow_colors):
-        row = i // 3
-        col = i % 3
-        actor_label = f"workflow_grid_{row}_{col}"
-        
-        graph2.add_task(
-            SetActorColorTask(
-                name=f"color_{row}_{col}",
-                actor_labels=[actor_label],
-                color=color,
-                opacity=1.0
-            )
+    # Labels in row-major order, matching rainbow_colors
+    grid_labels = [
+        f"workflow_grid_{row}_{col}"
+        for row, col in itertools.product(range(3), range(3))
+    ]
+    
+    # A single task colors every position in one pass over the level
+    graph2.add_task(
+        SetActorColorsTask(
+            name="color_grid",
+            colors=dict(zip(grid_labels, rainbow_colors)),
+            opacity=1.0
         )
+    )
     
     config2 = WorkflowConfig(
         clear_before_execute=False,  # Don't clear existing actors!
@@ -1,5 +1,9 @@
+import re
 import unreal
 
+# Property names worth listing when looking for the SCS
+SCS_PROPERTY_PATTERN = re.compile(r'script|construction|scs', re.IGNORECASE)
+
 # Create a test Blueprint to inspect its properties
 bp_path = "/Game/Imported/teal_chair_Blueprint"
 
@@ -42,8 +46,7 @@ except Exception as e:
 unreal.log("\n=== Available properties containing 'script' or 'construction' ===")
 try:
     for prop_name in dir(bp):
-        prop_lower = prop_name.lower()
-        if 'script' in prop_lower or 'construction' in prop_lower or 'scs' in prop_lower:
+        if SCS_PROPERTY_PATTERN.search(prop_name):
             unreal.log(f"  - {prop_name}")
 except Exception as e:
     unreal.log(f"Error listing properties: {e}")
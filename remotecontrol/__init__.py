@@ -5,7 +5,16 @@ Provides utilities for setting up and using remote Python execution
 in Unreal Engine via upyrc (UDP multicast) and file-based commands.
 """
 
-from .config import RemoteControlConfig
-from .client import UnrealRemoteClient
-
 __all__ = ['RemoteControlConfig', 'UnrealRemoteClient']
+
+
+def __getattr__(name):
+    # Imported on first use so the CLI can parse arguments (and show
+    # --help) without loading the client and its dependencies
+    if name == 'RemoteControlConfig':
+        from .config import RemoteControlConfig
+        return RemoteControlConfig
+    if name == 'UnrealRemoteClient':
+        from .client import UnrealRemoteClient
+        return UnrealRemoteClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,53 @@ Provides unified interface for sending Python commands to Unreal via:
 - File-based commands - Fallback method, requires init_unreal.py watcher
 """
 
+import logging
+import os
+import shutil
 import sys
 import time
 from pathlib import Path
 from typing import Optional, Union
 from .config import RemoteControlConfig
 
+# upyrc is optional; resolve it once at import time
+try:
+    from upyrc import upyre as _UPYRC
+except ImportError:
+    _UPYRC = None
+
+# exec_type argument -> upyrc ExecTypes member
+_EXEC_TYPES = {
+    'file': _UPYRC.ExecTypes.EXECUTE_FILE,
+    'statement': _UPYRC.ExecTypes.EXECUTE_STATEMENT,
+} if _UPYRC is not None else {}
+
+# Progress output is INFO; warnings and errors still show at the default level
+log = logging.getLogger("remotecontrol")
+
+_BANNER = '=' * 60
+
+_TROUBLESHOOTING = "\n".join([
+    "Troubleshooting:",
+    "1. Make sure Unreal Editor is running",
+    "2. Ensure the project is loaded",
+    "3. Check that PythonScriptPlugin is enabled",
+    "4. Verify init_unreal.py is running (check Output Log)",
+])
+_TROUBLESHOOTING_UPYRC = "\n".join([
+    "5. Confirm RemoteExecution listener is active",
+    "   (should see 'Remote Execution (upyre) started' in logs)",
+])
+
 
 class UnrealRemoteClient:
-    """Client for executing Python code in Unreal Engine"""
+    """
+    Client for executing Python code in Unreal Engine
+    
+    The upyrc connection is opened on first use and reused by later
+    calls; use the client as a context manager (or call close()) to
+    release it.
+    """
     
     def __init__(self, config: Optional[RemoteControlConfig] = None):
         """
@@ -23,24 +61,47 @@ class UnrealRemoteClient:
         Args:
             config: RemoteControlConfig instance. If None, creates from .env
         """
-        self.config = config or RemoteControlConfig()
-        self._upyrc_available = False
-        self._check_upyrc()
+        self.config = config or RemoteControlConfig.from_env()
+        self._upyrc_available = _UPYRC is not None
+        self._conn = None
+        # execute() method name -> handler
+        self._methods = {
+            'auto': self._do_auto,
+            'upyrc': self._do_upyrc,
+            'file': self._do_file,
+        }
     
-    def _check_upyrc(self):
-        """Check if upyrc is available"""
-        try:
-            from upyrc import upyre
-            self._upyrc_available = True
-        except ImportError:
-            self._upyrc_available = False
+    def _get_conn(self):
+        """Get the cached upyrc connection, opening it on first use"""
+        if self._conn is None:
+            exec_config = self.config.upyrc_config
+            log.info("Project: %s", self.config.PROJECT_FILE)
+            log.info("Multicast: %s", exec_config.MULTICAST_GROUP)
+            self._conn = _UPYRC.PythonRemoteConnection(exec_config).__enter__()
+        return self._conn
+    
+    def close(self):
+        """Close the cached upyrc connection, if one is open"""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.__exit__(None, None, None)
+            except Exception as e:
+                log.warning("Error closing upyrc connection: %s", e)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def execute(
         self,
         code: str,
         method: str = 'auto',
         exec_type: str = 'file',
-        raise_on_error: bool = True
+        raise_on_error: bool = True,
+        timeout: float = 10.0
     ) -> bool:
         """
         Execute Python code in Unreal Engine
@@ -50,34 +111,39 @@ class UnrealRemoteClient:
             method: 'upyrc', 'file', or 'auto' (tries upyrc first, falls back to file)
             exec_type: 'file' or 'statement' (for upyrc execution mode)
             raise_on_error: Whether to raise exceptions or return False
+            timeout: Seconds to wait for Unreal to pick up a file-based command
         
         Returns:
             True if successful, False otherwise
         """
-        if method == 'auto':
-            if self._upyrc_available:
-                try:
-                    return self._execute_upyrc(code, exec_type, raise_on_error)
-                except Exception as e:
-                    print(f"upyrc failed: {e}, falling back to file method...")
-                    return self._execute_file(code, raise_on_error)
-            else:
-                return self._execute_file(code, raise_on_error)
-        
-        elif method == 'upyrc':
-            if not self._upyrc_available:
-                error_msg = "upyrc not available. Install with: pip install upyrc"
-                if raise_on_error:
-                    raise RuntimeError(error_msg)
-                print(f"Error: {error_msg}")
-                return False
-            return self._execute_upyrc(code, exec_type, raise_on_error)
-        
-        elif method == 'file':
-            return self._execute_file(code, raise_on_error)
-        
-        else:
-            raise ValueError(f"Invalid method: {method}. Use 'upyrc', 'file', or 'auto'")
+        try:
+            handler = self._methods[method]
+        except KeyError:
+            raise ValueError(f"Invalid method: {method}. Use 'upyrc', 'file', or 'auto'") from None
+        return handler(code, exec_type, raise_on_error, timeout)
+    
+    def _do_auto(self, code: str, exec_type: str, raise_on_error: bool, timeout: float) -> bool:
+        """Try upyrc first, falling back to the file method"""
+        # _execute_upyrc reports failures by returning False
+        if self._upyrc_available:
+            if self._execute_upyrc(code, exec_type, raise_on_error):
+                return True
+            log.warning("upyrc failed, falling back to file method...")
+        return self._execute_file(code, raise_on_error, timeout)
+    
+    def _do_upyrc(self, code: str, exec_type: str, raise_on_error: bool, timeout: float) -> bool:
+        """Execute via upyrc only"""
+        if not self._upyrc_available:
+            error_msg = "upyrc not available. Install with: pip install upyrc"
+            if raise_on_error:
+                raise RuntimeError(error_msg)
+            log.error(error_msg)
+            return False
+        return self._execute_upyrc(code, exec_type, raise_on_error)
+    
+    def _do_file(self, code: str, exec_type: str, raise_on_error: bool, timeout: float) -> bool:
+        """Execute via the file-based command system only"""
+        return self._execute_file(code, raise_on_error, timeout)
     
     def _execute_upyrc(
         self,
@@ -86,112 +152,139 @@ class UnrealRemoteClient:
         raise_on_error: bool = True
     ) -> bool:
         """Execute code via upyrc (UDP multicast)"""
-        from upyrc import upyre
-        
-        print(f"\n{'='*60}")
-        print("Unreal Remote Control (upyrc/UDP)")
-        print(f"{'='*60}")
+        log.info("%s\nUnreal Remote Control (upyrc/UDP)\n%s", _BANNER, _BANNER)
         
         try:
-            # Get upyrc configuration
-            exec_config = self.config.get_upyrc_config()
-            print(f"Project: {self.config.PROJECT_FILE}")
-            print(f"Multicast: {exec_config.MULTICAST_GROUP}")
+            # Reuse the open connection (discovery only happens once)
+            conn = self._get_conn()
             
             # Show code preview
-            code_preview = code[:100] + "..." if len(code) > 100 else code
-            print(f"\nCode: {code_preview}")
-            print("\nSending to Unreal Engine...")
+            if log.isEnabledFor(logging.INFO):
+                log.info("Code: %s", self._preview(code))
+            log.info("Sending to Unreal Engine...")
             
-            # Map exec_type string to enum
-            exec_type_enum = (
-                upyre.ExecTypes.EXECUTE_FILE if exec_type == 'file'
-                else upyre.ExecTypes.EXECUTE_STATEMENT
+            # Execute
+            result = conn.execute_python_command(
+                code,
+                exec_type=_EXEC_TYPES[exec_type],
+                raise_exc=raise_on_error
             )
             
-            # Execute
-            with upyre.PythonRemoteConnection(exec_config) as conn:
-                result = conn.execute_python_command(
-                    code,
-                    exec_type=exec_type_enum,
-                    raise_exc=raise_on_error
-                )
-                
-                print("✓ Command executed successfully!")
-                if result:
-                    if hasattr(result, 'output') and result.output:
-                        print(f"\nOutput:\n{result.output}")
-                    elif isinstance(result, list):
-                        for item in result:
-                            if hasattr(item, 'output') and item.output:
-                                print(f"\n{item.type}: {item.output}")
+            log.info("✓ Command executed successfully!")
+            # Command output is the result of the call, so it is always shown
+            if result:
+                if hasattr(result, 'output') and result.output:
+                    print(f"\nOutput:\n{result.output}")
+                elif isinstance(result, list):
+                    for item in result:
+                        if hasattr(item, 'output') and item.output:
+                            print(f"\n{item.type}: {item.output}")
             
-            print(f"{'='*60}\n")
+            log.info(_BANNER)
             return True
             
         except Exception as e:
-            print(f"✗ Error: {e}")
-            if raise_on_error:
-                import traceback
-                traceback.print_exc()
-            self._print_troubleshooting()
-            print(f"{'='*60}\n")
+            # Tracebacks are only formatted when debug logging is on
+            log.error(
+                "✗ Error: %s", e,
+                exc_info=raise_on_error and log.isEnabledFor(logging.DEBUG)
+            )
+            # Don't keep reusing a connection that may be broken
+            self.close()
+            self._log_troubleshooting()
             return False
     
-    def _execute_file(self, code: str, raise_on_error: bool = True) -> bool:
-        """Execute code via file-based command system"""
-        print(f"\n{'='*60}")
-        print("Unreal Remote Control (File-based)")
-        print(f"{'='*60}")
+    def _execute_file(
+        self,
+        code: Optional[str],
+        raise_on_error: bool = True,
+        timeout: float = 10.0,
+        source: Optional[Path] = None
+    ) -> bool:
+        """
+        Execute code via file-based command system
+        
+        If source is given, that script is copied into the command file
+        byte-for-byte instead of writing code.
+        """
+        log.info("%s\nUnreal Remote Control (File-based)\n%s", _BANNER, _BANNER)
         
         try:
             command_file = self.config.COMMAND_FILE
-            print(f"Command file: {command_file}")
+            log.info("Command file: %s", command_file)
             
             # Ensure parent directory exists
             command_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Show code preview
-            code_preview = code[:100] + "..." if len(code) > 100 else code
-            print(f"\nCode: {code_preview}")
-            print("\nWriting to command file...")
-            
-            # Write code to command file
-            with open(command_file, 'w', encoding='utf-8') as f:
-                f.write(code)
+            if log.isEnabledFor(logging.INFO):
+                if source is not None:
+                    with open(source, encoding='utf-8') as f:
+                        log.info("Code: %s", self._preview(f.read(101)))
+                else:
+                    log.info("Code: %s", self._preview(code))
+            log.info("Writing to command file...")
             
-            print("✓ Command written successfully!")
-            print("\nWaiting for Unreal to process...")
+            # Write to a sibling temp file and rename it into place, so the
+            # watcher in Unreal never sees a partially written command
+            tmp_file = command_file.with_suffix('.py.tmp')
+            if source is not None:
+                shutil.copyfile(source, tmp_file)
+            else:
+                with open(tmp_file, 'wb', buffering=0) as f:
+                    f.write(code.encode('utf-8'))
+            os.replace(tmp_file, command_file)
             
-            # Wait a moment for processing
-            time.sleep(0.5)
+            log.info("✓ Command written successfully!")
+            log.info("Waiting for Unreal to process...")
             
-            # Check if file was cleared (indicates processing)
-            if command_file.exists():
-                content = command_file.read_text(encoding='utf-8')
-                if content.strip():
-                    print("⚠ Warning: Command file not cleared (may not have been processed)")
-                else:
-                    print("✓ Command file cleared (processed by Unreal)")
+            # Poll until Unreal clears the file, backing off from 5ms to 100ms
+            if self._wait_for_clear(command_file, timeout):
+                log.info("✓ Command file cleared (processed by Unreal)")
+            else:
+                log.warning("⚠ Command file not cleared (may not have been processed)")
             
-            print(f"{'='*60}\n")
+            log.info(_BANNER)
             return True
             
         except Exception as e:
-            print(f"✗ Error: {e}")
-            if raise_on_error:
-                import traceback
-                traceback.print_exc()
-            self._print_troubleshooting()
-            print(f"{'='*60}\n")
+            # Tracebacks are only formatted when debug logging is on
+            log.error(
+                "✗ Error: %s", e,
+                exc_info=raise_on_error and log.isEnabledFor(logging.DEBUG)
+            )
+            self._log_troubleshooting()
             return False
     
+    @staticmethod
+    def _wait_for_clear(command_file: Path, timeout: float) -> bool:
+        """
+        Wait for the command file to be emptied or removed
+        
+        Returns:
+            True if Unreal consumed the command before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while True:
+            # stat() is enough - no need to read back what we just wrote
+            try:
+                if command_file.stat().st_size == 0:
+                    return True
+            except FileNotFoundError:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.1)
+    
     def execute_file(
         self,
         script_path: Union[str, Path],
         method: str = 'auto',
         exec_type: str = 'file',
-        raise_on_error: bool = True
+        raise_on_error: bool = True,
+        timeout: float = 10.0
     ) -> bool:
         """
         Execute a Python file in Unreal Engine
@@ -201,33 +294,75 @@ class UnrealRemoteClient:
             method: 'upyrc', 'file', or 'auto'
             exec_type: 'file' or 'statement' (for upyrc execution mode)
             raise_on_error: Whether to raise exceptions
+            timeout: Seconds to wait for Unreal to pick up a file-based command
         
         Returns:
             True if successful, False otherwise
         """
+        if method not in self._methods:
+            raise ValueError(f"Invalid method: {method}. Use 'upyrc', 'file', or 'auto'")
+        
         script_path = Path(script_path)
         
         if not script_path.exists():
             error_msg = f"File not found: {script_path}"
             if raise_on_error:
                 raise FileNotFoundError(error_msg)
-            print(f"Error: {error_msg}")
+            log.error(error_msg)
             return False
         
-        print(f"Loading script: {script_path}")
+        # upyrc can execute the script by path, and the file method copies
+        # it straight into the command file; only upyrc statement mode
+        # needs the script body in memory
+        if method != 'file' and exec_type == 'file' and self._upyrc_available:
+            if self.execute_path(script_path, raise_on_error):
+                return True
+            if method == 'upyrc':
+                return False
+            log.warning("upyrc failed, falling back to file method...")
+            method = 'file'
+        
+        log.info("Loading script: %s", script_path)
+        if method == 'file' or (method == 'auto' and not self._upyrc_available):
+            return self._execute_file(None, raise_on_error, timeout, source=script_path)
+        
         code = script_path.read_text(encoding='utf-8')
-        return self.execute(code, method, exec_type, raise_on_error)
-    
-    def _print_troubleshooting(self):
-        """Print troubleshooting guide"""
-        print("\nTroubleshooting:")
-        print("1. Make sure Unreal Editor is running")
-        print("2. Ensure the project is loaded")
-        print("3. Check that PythonScriptPlugin is enabled")
-        print("4. Verify init_unreal.py is running (check Output Log)")
+        return self.execute(code, method, exec_type, raise_on_error, timeout)
+    
+    def execute_path(self, script_path: Union[str, Path], raise_on_error: bool = True) -> bool:
+        """
+        Execute a Python file in Unreal Engine by path (upyrc only)
+        
+        Unreal reads the script itself, so its contents are never loaded
+        here. The path must be readable from the machine running Unreal.
+        
+        The path is sent quoted: Unreal treats the first token of the
+        command as the file name, so an unquoted path with a space in it
+        would be run as Python code instead.
+        
+        Args:
+            script_path: Path to Python script file
+            raise_on_error: Whether to raise exceptions
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._upyrc_available:
+            raise RuntimeError("upyrc not available. Install with: pip install upyrc")
+        resolved = Path(script_path).resolve()
+        return self._execute_upyrc(f'"{resolved}"', 'file', raise_on_error)
+    
+    @staticmethod
+    def _preview(code: str, limit: int = 100) -> str:
+        """Short preview of code for log output"""
+        return code[:limit] + "..." if len(code) > limit else code
+    
+    def _log_troubleshooting(self):
+        """Log troubleshooting guide"""
         if self._upyrc_available:
-            print("5. Confirm RemoteExecution listener is active")
-            print(f"   (should see 'Remote Execution (upyre) started' in logs)")
+            log.warning("%s\n%s", _TROUBLESHOOTING, _TROUBLESHOOTING_UPYRC)
+        else:
+            log.warning(_TROUBLESHOOTING)
     
     def test_connection(self, method: str = 'auto') -> bool:
         """
@@ -240,7 +375,7 @@ class UnrealRemoteClient:
             True if connection successful
         """
         test_code = "import unreal; unreal.log('Connection test successful!')"
-        print(f"\nTesting connection ({method} method)...")
+        log.info("Testing connection (%s method)...", method)
         return self.execute(test_code, method=method, raise_on_error=False)
     
     def __repr__(self):
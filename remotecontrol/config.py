@@ -5,135 +5,205 @@ Loads settings from .env file and provides unified configuration.
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
-from dotenv import load_dotenv
+from typing import Any, Optional, Tuple
 
 
+@lru_cache(maxsize=None)
+def _find_env_file(start: Path) -> Optional[Path]:
+    """Find .env file in start or its parent directories"""
+    for parent in [start] + list(start.parents):
+        env_path = parent / '.env'
+        if env_path.exists():
+            return env_path
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_env_file(env_file: Path):
+    """Load a .env file into os.environ (once per file)"""
+    # Only imported when there is a file to load
+    from dotenv import load_dotenv
+    load_dotenv(env_file)
+
+
+_DEFAULT_PROJECT = 'firstperson'
+_DEFAULT_PROJECTS_ROOT = 'C:/Users/cwood/Documents/Unreal Projects'
+_DEFAULT_ENGINE_PATH = 'C:/Program Files/Epic Games/UE_5.6/Engine/Binaries/Win64/UnrealEditor-Cmd.exe'
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == 'true'
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class RemoteControlConfig:
-    """Configuration for Unreal Engine remote control"""
+    """
+    Configuration for Unreal Engine remote control
+    
+    Use RemoteControlConfig.from_env() to load settings from .env and the
+    environment; constructing directly uses the built-in defaults for any
+    field not given. Instances are immutable.
+    """
+    
+    # Unreal project (PROJECT_FOLDER/PROJECT_FILE derived when not given)
+    PROJECT_NAME: str = _DEFAULT_PROJECT
+    PROJECT_FOLDER: Optional[Path] = None
+    PROJECT_FILE: Optional[Path] = None
+    UNREAL_ENGINE_PATH: Path = Path(_DEFAULT_ENGINE_PATH)
+    
+    # Level configuration (LEVEL_PATH derived when not given)
+    LEVEL: str = 'Main'
+    LEVEL_PATH: Optional[str] = None
+    AUTO_LOAD_LEVEL: bool = True
+    
+    # upyrc (UDP multicast) settings
+    MULTICAST_HOST: str = '239.0.0.1'
+    MULTICAST_PORT: int = 6766
+    MULTICAST_BIND_ADDRESS: str = '0.0.0.0'
+    
+    # Command endpoint
+    COMMAND_HOST: str = '127.0.0.1'
+    COMMAND_PORT: int = 6776
+    
+    # WebRemoteControl HTTP settings
+    WEB_REMOTE_ENABLED: bool = True
+    WEB_REMOTE_PORT: int = 30010
+    WEB_REMOTE_HOST: str = 'localhost'
+    
+    # Grid layout
+    GRID_ROWS: int = 5
+    GRID_COLS: int = 5
+    GRID_SPACING: float = 200.0
+    
+    # Circle layout
+    CIRCLE_OBJECTS: int = 12
+    CIRCLE_RADIUS: float = 500.0
+    
+    # Spiral layout
+    SPIRAL_OBJECTS: int = 20
+    SPIRAL_MAX_RADIUS: float = 800.0
+    SPIRAL_HEIGHT_INCREMENT: float = 50.0
+    
+    # Scatter layout
+    SCATTER_OBJECTS: int = 30
+    SCATTER_AREA_SIZE: float = 1000.0
+    
+    # Logging
+    LOG_LEVEL: str = 'INFO'
+    VERBOSE_LOGGING: bool = False
+    
+    # .env file the values were loaded from, if any
+    env_file: Optional[Path] = None
+    
+    # Derived values (computed in __post_init__)
+    SCRIPTS_FOLDER: Path = field(init=False)
+    CONTENT_FOLDER: Path = field(init=False)
+    PYTHON_FOLDER: Path = field(init=False)
+    COMMAND_FILE: Path = field(init=False)
+    MULTICAST_GROUP: Tuple[str, int] = field(init=False)
+    COMMAND_ENDPOINT: Tuple[str, int] = field(init=False)
+    WEB_REMOTE_URL: str = field(init=False)
     
-    def __init__(self, env_file: Optional[Path] = None):
+    # upyrc RemoteExecutionConfig, built on first use of upyrc_config
+    _upyrc_config: Any = field(init=False, default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so derived fields are set through object.__setattr__
+        set_ = object.__setattr__
+        
+        if self.PROJECT_FOLDER is None:
+            set_(self, 'PROJECT_FOLDER', Path(_DEFAULT_PROJECTS_ROOT) / self.PROJECT_NAME)
+        if self.PROJECT_FILE is None:
+            set_(self, 'PROJECT_FILE', self.PROJECT_FOLDER / f"{self.PROJECT_NAME}.uproject")
+        if self.LEVEL_PATH is None:
+            set_(self, 'LEVEL_PATH', f'/Game/{self.LEVEL}')
+        
+        # Scripts and content paths
+        set_(self, 'SCRIPTS_FOLDER', self.PROJECT_FOLDER / 'scripts')
+        set_(self, 'CONTENT_FOLDER', self.PROJECT_FOLDER / 'Content')
+        set_(self, 'PYTHON_FOLDER', self.CONTENT_FOLDER / 'Python')
+        
+        # Command file for file-based remote control
+        set_(self, 'COMMAND_FILE', self.SCRIPTS_FOLDER / '.unreal_command.py')
+        
+        set_(self, 'MULTICAST_GROUP', (self.MULTICAST_HOST, self.MULTICAST_PORT))
+        set_(self, 'COMMAND_ENDPOINT', (self.COMMAND_HOST, self.COMMAND_PORT))
+        set_(self, 'WEB_REMOTE_URL', f"http://{self.WEB_REMOTE_HOST}:{self.WEB_REMOTE_PORT}")
+    
+    @classmethod
+    def from_env(cls, env_file: Optional[Path] = None) -> 'RemoteControlConfig':
         """
-        Initialize configuration from .env file
+        Create configuration from .env file and environment variables
         
         Args:
             env_file: Path to .env file. If None, searches parent directories
         """
-        # Find .env file
+        # Find .env file (search and load are cached across instances)
         if env_file is None:
-            env_file = self._find_env_file()
+            env_file = _find_env_file(Path.cwd())
         
         if env_file and env_file.exists():
-            load_dotenv(env_file)
-            self.env_file = env_file
+            _load_env_file(env_file)
         else:
-            self.env_file = None
+            env_file = None
         
-        # Load all configuration
-        self._load_project_config()
-        self._load_remote_config()
-        self._load_scene_config()
-    
-    def _find_env_file(self) -> Optional[Path]:
-        """Find .env file in current or parent directories"""
-        current = Path.cwd()
-        for parent in [current] + list(current.parents):
-            env_path = parent / '.env'
-            if env_path.exists():
-                return env_path
-        return None
-    
-    def _load_project_config(self):
-        """Load Unreal project configuration"""
-        # Project paths (authoritative from .env, with simple defaults)
-        self.PROJECT_NAME = os.getenv('PROJECT', 'firstperson')
-        self.PROJECT_FOLDER = Path(os.getenv(
-            'PROJECT_FOLDER',
-            f'C:/Users/cwood/Documents/Unreal Projects/{self.PROJECT_NAME}'
-        ))
-        # If PROJECT_FILE explicitly set, use it; else derive
-        env_project_file = os.getenv('PROJECT_FILE')
-        if env_project_file:
-            self.PROJECT_FILE = Path(env_project_file)
-        else:
-            self.PROJECT_FILE = self.PROJECT_FOLDER / f"{self.PROJECT_NAME}.uproject"
-        
-        # Scripts and content paths
-        self.SCRIPTS_FOLDER = self.PROJECT_FOLDER / 'scripts'
-        self.CONTENT_FOLDER = self.PROJECT_FOLDER / 'Content'
-        self.PYTHON_FOLDER = self.CONTENT_FOLDER / 'Python'
+        project_name = os.getenv('PROJECT', _DEFAULT_PROJECT)
+        project_folder = os.getenv('PROJECT_FOLDER')
+        project_file = os.getenv('PROJECT_FILE')
+        level_path = os.getenv('LEVEL_PATH')
         
-        # Command file for file-based remote control
-        self.COMMAND_FILE = self.SCRIPTS_FOLDER / '.unreal_command.py'
-        
-        # Unreal Engine executable
-        self.UNREAL_ENGINE_PATH = Path(os.getenv(
-            'UNREAL_ENGINE_PATH',
-            'C:/Program Files/Epic Games/UE_5.6/Engine/Binaries/Win64/UnrealEditor-Cmd.exe'
-        ))
-        
-        # Level configuration
-        self.LEVEL = os.getenv('LEVEL', 'Main')
-        self.LEVEL_PATH = os.getenv('LEVEL_PATH', f'/Game/{self.LEVEL}')
-        self.AUTO_LOAD_LEVEL = os.getenv('AUTO_LOAD_LEVEL', 'true').lower() == 'true'
-    
-    def _load_remote_config(self):
-        """Load remote execution configuration"""
-        # upyrc (UDP multicast) settings
-        self.MULTICAST_HOST = os.getenv('UNREAL_REMOTE_HOST', '239.0.0.1')
-        self.MULTICAST_PORT = int(os.getenv('UNREAL_REMOTE_PORT', '6766'))
-        self.MULTICAST_GROUP = (self.MULTICAST_HOST, self.MULTICAST_PORT)
-        self.MULTICAST_BIND_ADDRESS = os.getenv('UNREAL_BIND_ADDRESS', '0.0.0.0')
-        
-        # Command endpoint (derived from multicast config)
-        self.COMMAND_HOST = os.getenv('UNREAL_COMMAND_HOST', '127.0.0.1')
-        self.COMMAND_PORT = int(os.getenv('UNREAL_COMMAND_PORT', '6776'))
-        self.COMMAND_ENDPOINT = (self.COMMAND_HOST, self.COMMAND_PORT)
-        
-        # WebRemoteControl HTTP settings
-        self.WEB_REMOTE_ENABLED = os.getenv('WEB_REMOTE_ENABLED', 'true').lower() == 'true'
-        self.WEB_REMOTE_PORT = int(os.getenv('WEB_REMOTE_PORT', '30010'))
-        self.WEB_REMOTE_HOST = os.getenv('WEB_REMOTE_HOST', 'localhost')
-        self.WEB_REMOTE_URL = f"http://{self.WEB_REMOTE_HOST}:{self.WEB_REMOTE_PORT}"
-    
-    def _load_scene_config(self):
-        """Load scene population configuration"""
-        # Grid layout
-        self.GRID_ROWS = int(os.getenv('GRID_ROWS', '5'))
-        self.GRID_COLS = int(os.getenv('GRID_COLS', '5'))
-        self.GRID_SPACING = float(os.getenv('GRID_SPACING', '200'))
-        
-        # Circle layout
-        self.CIRCLE_OBJECTS = int(os.getenv('CIRCLE_OBJECTS', '12'))
-        self.CIRCLE_RADIUS = float(os.getenv('CIRCLE_RADIUS', '500'))
-        
-        # Spiral layout
-        self.SPIRAL_OBJECTS = int(os.getenv('SPIRAL_OBJECTS', '20'))
-        self.SPIRAL_MAX_RADIUS = float(os.getenv('SPIRAL_MAX_RADIUS', '800'))
-        self.SPIRAL_HEIGHT_INCREMENT = float(os.getenv('SPIRAL_HEIGHT_INCREMENT', '50'))
-        
-        # Scatter layout
-        self.SCATTER_OBJECTS = int(os.getenv('SCATTER_OBJECTS', '30'))
-        self.SCATTER_AREA_SIZE = float(os.getenv('SCATTER_AREA_SIZE', '1000'))
-        
-        # Logging
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-        self.VERBOSE_LOGGING = os.getenv('ENABLE_VERBOSE_LOGGING', 'false').lower() == 'true'
+        return cls(
+            PROJECT_NAME=project_name,
+            PROJECT_FOLDER=Path(project_folder) if project_folder else None,
+            PROJECT_FILE=Path(project_file) if project_file else None,
+            UNREAL_ENGINE_PATH=Path(os.getenv('UNREAL_ENGINE_PATH', _DEFAULT_ENGINE_PATH)),
+            LEVEL=os.getenv('LEVEL', 'Main'),
+            LEVEL_PATH=level_path or None,
+            AUTO_LOAD_LEVEL=_env_bool('AUTO_LOAD_LEVEL', 'true'),
+            MULTICAST_HOST=os.getenv('UNREAL_REMOTE_HOST', '239.0.0.1'),
+            MULTICAST_PORT=int(os.getenv('UNREAL_REMOTE_PORT', '6766')),
+            MULTICAST_BIND_ADDRESS=os.getenv('UNREAL_BIND_ADDRESS', '0.0.0.0'),
+            COMMAND_HOST=os.getenv('UNREAL_COMMAND_HOST', '127.0.0.1'),
+            COMMAND_PORT=int(os.getenv('UNREAL_COMMAND_PORT', '6776')),
+            WEB_REMOTE_ENABLED=_env_bool('WEB_REMOTE_ENABLED', 'true'),
+            WEB_REMOTE_PORT=int(os.getenv('WEB_REMOTE_PORT', '30010')),
+            WEB_REMOTE_HOST=os.getenv('WEB_REMOTE_HOST', 'localhost'),
+            GRID_ROWS=int(os.getenv('GRID_ROWS', '5')),
+            GRID_COLS=int(os.getenv('GRID_COLS', '5')),
+            GRID_SPACING=float(os.getenv('GRID_SPACING', '200')),
+            CIRCLE_OBJECTS=int(os.getenv('CIRCLE_OBJECTS', '12')),
+            CIRCLE_RADIUS=float(os.getenv('CIRCLE_RADIUS', '500')),
+            SPIRAL_OBJECTS=int(os.getenv('SPIRAL_OBJECTS', '20')),
+            SPIRAL_MAX_RADIUS=float(os.getenv('SPIRAL_MAX_RADIUS', '800')),
+            SPIRAL_HEIGHT_INCREMENT=float(os.getenv('SPIRAL_HEIGHT_INCREMENT', '50')),
+            SCATTER_OBJECTS=int(os.getenv('SCATTER_OBJECTS', '30')),
+            SCATTER_AREA_SIZE=float(os.getenv('SCATTER_AREA_SIZE', '1000')),
+            LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+            VERBOSE_LOGGING=_env_bool('ENABLE_VERBOSE_LOGGING', 'false'),
+            env_file=env_file,
+        )
     
-    def get_upyrc_config(self):
-        """Get configuration dict for upyrc library"""
+    @property
+    def upyrc_config(self):
+        """upyrc RemoteExecutionConfig for this config (built once, then cached)"""
+        if self._upyrc_config is not None:
+            return self._upyrc_config
         try:
             from upyrc import upyre
-            return upyre.RemoteExecutionConfig(
-                multicast_group=self.MULTICAST_GROUP,
-                multicast_bind_address=self.MULTICAST_BIND_ADDRESS
-            )
         except ImportError:
             raise ImportError(
                 "upyrc not installed. Run: pip install upyrc\n"
                 "Or: pip install -r requirements.txt"
             )
+        upyrc_config = upyre.RemoteExecutionConfig(
+            multicast_group=self.MULTICAST_GROUP,
+            multicast_bind_address=self.MULTICAST_BIND_ADDRESS
+        )
+        object.__setattr__(self, '_upyrc_config', upyrc_config)
+        return upyrc_config
     
     def __repr__(self):
         """String representation"""
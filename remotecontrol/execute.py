@@ -7,13 +7,19 @@ Usage:
     python -m remotecontrol.execute examples/spawn_grid.py
     python -m remotecontrol.execute --method upyrc script.py
     python -m remotecontrol.execute --method file "import unreal; unreal.log('Test')"
+    python -m remotecontrol.execute --batch scripts.txt
 """
 
 import sys
+import logging
 import argparse
 from pathlib import Path
-from .client import UnrealRemoteClient
-from .config import RemoteControlConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import UnrealRemoteClient
+
+log = logging.getLogger("remotecontrol")
 
 
 def main():
@@ -33,8 +39,15 @@ Examples:
   python -m remotecontrol.execute --method upyrc script.py
   python -m remotecontrol.execute --method file script.py
   
+  # Run several scripts over one connection (one path per line, # comments)
+  python -m remotecontrol.execute --batch scripts.txt
+  
   # Test connection
   python -m remotecontrol.execute --test
+  
+  # Show progress details
+  python -m remotecontrol.execute --verbose script.py
+  python -m remotecontrol.execute -vv script.py   # also show tracebacks
         """
     )
     
@@ -64,17 +77,45 @@ Examples:
         help='Test connection to Unreal Engine'
     )
     
+    parser.add_argument(
+        '--batch',
+        type=Path,
+        help='Text file listing .py scripts to run in order, one per line'
+    )
+    
     parser.add_argument(
         '--config',
         type=Path,
         help='Path to .env config file'
     )
     
+    parser.add_argument(
+        '-v', '--verbose',
+        action='count',
+        default=0,
+        help='Show progress details (connection, code preview, status); '
+             'repeat (-vv) to also show error tracebacks'
+    )
+    
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)],
+        format='%(message)s'
+    )
+    
+    # Imported after parsing so --help doesn't pay for dotenv/upyrc/dataclasses
+    from .client import UnrealRemoteClient
+    from .config import RemoteControlConfig
+    
     # Load configuration
-    config = RemoteControlConfig(args.config) if args.config else RemoteControlConfig()
-    client = UnrealRemoteClient(config)
+    config = RemoteControlConfig.from_env(args.config)
+    with UnrealRemoteClient(config) as client:
+        return _run(parser, args, client)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace, client: 'UnrealRemoteClient') -> int:
+    """Run the requested command with an open client"""
     
     # Test connection if requested
     if args.test:
@@ -82,6 +123,9 @@ Examples:
         success = client.test_connection(method=args.method)
         return 0 if success else 1
     
+    if args.batch:
+        return _run_batch(args, client)
+    
     # Require code or file
     if not args.code_or_file:
         parser.print_help()
@@ -110,5 +154,41 @@ Examples:
     return 0 if success else 1
 
 
+def _run_batch(args: argparse.Namespace, client: 'UnrealRemoteClient') -> int:
+    """
+    Run every script listed in the batch file through one client
+    
+    Relative script paths are resolved against the batch file's directory.
+    """
+    try:
+        text = args.batch.read_text(encoding='utf-8')
+    except OSError as e:
+        log.error("Cannot read batch file %s: %s", args.batch, e)
+        return 1
+    
+    scripts = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            scripts.append(args.batch.parent / line)
+    
+    failed = []
+    for script in scripts:
+        success = client.execute_file(
+            script,
+            method=args.method,
+            exec_type=args.exec_type,
+            raise_on_error=False
+        )
+        if not success:
+            failed.append(script)
+    
+    print(f"Batch complete: {len(scripts) - len(failed)}/{len(scripts)} scripts succeeded")
+    for script in failed:
+        print(f"  ✗ {script}")
+    
+    return 0 if not failed else 1
+
+
 if __name__ == '__main__':
     sys.exit(main())
@@ -8,12 +8,45 @@ This script:
 4. Creates .env configuration file
 """
 
+import os
+import re
 import sys
 import json
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+# INI section header at the start of a line, e.g. "[/Script/Engine.Engine]"
+_SECTION_RE = re.compile(r'(?m)^[ \t]*(\[[^\]\n]+\])')
+
+_PYTHON_SECTION = '[/Script/PythonScriptPlugin.PythonScriptPluginSettings]'
+_WEB_SECTION = '[/Script/WebRemoteControl.WebRemoteControlSettings]'
+
+# Sections _setup_engine_ini owns and rewrites on every run
+_MANAGED_SECTIONS = frozenset({_PYTHON_SECTION, _WEB_SECTION})
+
+# Python script plugin configuration
+_PYTHON_CONFIG_TEMPLATE = f"""
+{_PYTHON_SECTION}
+bRemoteExecution=True
+RemoteExecutionMulticastGroupEndpoint={{multicast_host}}:{{multicast_port}}
+RemoteExecutionMulticastBindAddress=0.0.0.0
+RemoteExecutionSendBufferSizeBytes=2097152
+RemoteExecutionReceiveBufferSizeBytes=2097152
+RemoteExecutionMulticastTtl=0
+"""
+
+# WebRemoteControl configuration (part of RemoteControl plugin)
+_WEB_CONFIG_TEMPLATE = f"""
+{_WEB_SECTION}
+bServerStartByDefault=True
+RemoteControlHttpServerPort={{web_remote_port}}
++RemoteControlAllowlist=/Script/PythonScriptPlugin.PythonScriptLibrary
+"""
 
 
 def setup_project(
@@ -49,12 +82,14 @@ def setup_project(
     project_dir = project_path.parent
     project_name = project_path.stem
     
-    print(f"\n{'='*60}")
-    print(f"Setting up Unreal Remote Control")
-    print(f"{'='*60}")
-    print(f"Project: {project_name}")
-    print(f"Path: {project_dir}")
-    print(f"\n")
+    print(
+        f"\n{'='*60}\n"
+        f"Setting up Unreal Remote Control\n"
+        f"{'='*60}\n"
+        f"Project: {project_name}\n"
+        f"Path: {project_dir}\n"
+        f"\n"
+    )
     
     # Step 1: Enable plugins in .uproject
     success = _setup_uproject(project_path, backup)
@@ -102,18 +137,19 @@ def setup_project(
     if not success:
         return False
     
-    print(f"\n{'='*60}")
-    print("✓ Setup Complete!")
-    print(f"{'='*60}")
-    print("\nNext steps:")
-    print("1. Open the project in Unreal Editor")
-    print("2. Check Output Log for 'Remote Execution (upyre) started'")
-    print("3. Test with a simple command:")
-    print(f"   cd {scripts_dir}")
-    print("   python -m remotecontrol --method file \"import unreal; unreal.log('Hello!')\"")
-    print("4. Try the examples:")
-    print("   python -m remotecontrol examples/spawn_shapes.py --method file")
-    print("")
+    print(
+        f"\n{'='*60}\n"
+        "✓ Setup Complete!\n"
+        f"{'='*60}\n"
+        "\nNext steps:\n"
+        "1. Open the project in Unreal Editor\n"
+        "2. Check Output Log for 'Remote Execution (upyre) started'\n"
+        "3. Test with a simple command:\n"
+        f"   cd {scripts_dir}\n"
+        "   python -m remotecontrol --method file \"import unreal; unreal.log('Hello!')\"\n"
+        "4. Try the examples:\n"
+        "   python -m remotecontrol examples/spawn_shapes.py --method file\n"
+    )
     
     return True
 
@@ -123,19 +159,16 @@ def _setup_uproject(project_path: Path, backup: bool) -> bool:
     print("Step 1: Enabling plugins in .uproject...")
     
     try:
-        # Backup if requested
-        if backup and project_path.exists():
-            backup_path = project_path.with_suffix('.uproject.backup')
-            shutil.copy2(project_path, backup_path)
-            print(f"  Created backup: {backup_path.name}")
+        # Read current project file (json accepts UTF-8 bytes directly)
+        project_data = json.loads(project_path.read_bytes())
         
-        # Read current project file
-        with open(project_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+        # Only rewrite (and back up) the file if something changes
+        dirty = False
         
         # Ensure Plugins section exists
         if 'Plugins' not in project_data:
             project_data['Plugins'] = []
+            dirty = True
         
         # Required plugins
         required_plugins = [
@@ -145,26 +178,41 @@ def _setup_uproject(project_path: Path, backup: bool) -> bool:
             'RemoteControl'
         ]
         
-        # Add missing plugins
-        existing_plugins = {p['Name'] for p in project_data['Plugins'] if 'Name' in p}
+        # Index existing plugin entries once
+        by_name = {p['Name']: p for p in project_data['Plugins'] if 'Name' in p}
         
+        # Add missing plugins, reporting them in one write afterwards
+        report = []
         for plugin_name in required_plugins:
-            if plugin_name not in existing_plugins:
+            plugin = by_name.get(plugin_name)
+            if plugin is None:
                 project_data['Plugins'].append({
                     'Name': plugin_name,
                     'Enabled': True
                 })
-                print(f"  + Added plugin: {plugin_name}")
+                dirty = True
+                report.append(f"  + Added plugin: {plugin_name}")
             else:
                 # Make sure it's enabled
-                for plugin in project_data['Plugins']:
-                    if plugin.get('Name') == plugin_name:
-                        plugin['Enabled'] = True
-                print(f"  ✓ Plugin already present: {plugin_name}")
+                if plugin.get('Enabled') is not True:
+                    plugin['Enabled'] = True
+                    dirty = True
+                    report.append(f"  + Enabled plugin: {plugin_name}")
+                else:
+                    report.append(f"  ✓ Plugin already present: {plugin_name}")
+        print('\n'.join(report))
+        
+        if not dirty:
+            print("  ✓ Plugins already configured, .uproject unchanged\n")
+            return True
+        
+        # Backup if requested
+        if backup:
+            _backup_file(project_path)
         
         # Write updated project file
-        with open(project_path, 'w', encoding='utf-8') as f:
-            json.dump(project_data, f, indent='\t')
+        with _replacing(project_path, 'wb') as f:
+            f.write(json.dumps(project_data, indent='\t').encode('utf-8'))
         
         print("  ✓ Plugins configured\n")
         return True
@@ -190,56 +238,31 @@ def _setup_engine_ini(
         
         # Backup if requested
         if backup and engine_ini.exists():
-            backup_path = engine_ini.with_suffix('.ini.backup')
-            shutil.copy2(engine_ini, backup_path)
-            print(f"  Created backup: {backup_path.name}")
+            _backup_file(engine_ini)
         
         # Read existing config
         if engine_ini.exists():
-            with open(engine_ini, 'r', encoding='utf-8') as f:
-                config_lines = f.readlines()
+            config_text = engine_ini.read_text(encoding='utf-8')
         else:
-            config_lines = []
+            config_text = ''
         
-        # Python script plugin configuration
-        python_config = f"""
-[/Script/PythonScriptPlugin.PythonScriptPluginSettings]
-bRemoteExecution=True
-RemoteExecutionMulticastGroupEndpoint={multicast_host}:{multicast_port}
-RemoteExecutionMulticastBindAddress=0.0.0.0
-RemoteExecutionSendBufferSizeBytes=2097152
-RemoteExecutionReceiveBufferSizeBytes=2097152
-RemoteExecutionMulticastTtl=0
-"""
-
-        # WebRemoteControl configuration (part of RemoteControl plugin)
-        web_config = f"""
-[/Script/WebRemoteControl.WebRemoteControlSettings]
-bServerStartByDefault=True
-RemoteControlHttpServerPort={web_remote_port}
-+RemoteControlAllowlist=/Script/PythonScriptPlugin.PythonScriptLibrary
-"""
-
-        # Remove existing sections if present
-        filtered_lines = []
-        skip_section = False
-        for line in config_lines:
-            if line.strip().startswith('[/Script/PythonScriptPlugin.PythonScriptPluginSettings]'):
-                skip_section = True
-            elif line.strip().startswith('[/Script/WebRemoteControl.WebRemoteControlSettings]'):
-                skip_section = True
-            elif line.strip().startswith('[') and line.strip() != '[':
-                skip_section = False
-            
-            if not skip_section:
-                filtered_lines.append(line)
+        python_config = _PYTHON_CONFIG_TEMPLATE.format(
+            multicast_host=multicast_host,
+            multicast_port=multicast_port
+        )
+        web_config = _WEB_CONFIG_TEMPLATE.format(web_remote_port=web_remote_port)
         
-        # Add our configurations
-        config_content = ''.join(filtered_lines).rstrip() + '\n' + python_config + '\n' + web_config
+        # Remove existing sections if present. Only the last kept slice
+        # needs trailing whitespace trimmed, so the slices are never
+        # joined into a second copy of the file
+        kept_parts = _kept_sections(config_text, _MANAGED_SECTIONS)
+        kept_parts[-1] = kept_parts[-1].rstrip()
         
-        # Write updated config
-        with open(engine_ini, 'w', encoding='utf-8') as f:
-            f.write(config_content)
+        # Write updated config with our configurations appended; the parts
+        # are written in turn rather than concatenated into one new string
+        with _replacing(engine_ini, 'w', encoding='utf-8') as f:
+            f.writelines(kept_parts)
+            f.writelines(('\n', python_config, '\n', web_config))
         
         print(f"  + Python remote execution: {multicast_host}:{multicast_port}")
         print(f"  + WebRemoteControl: localhost:{web_remote_port}")
@@ -251,6 +274,102 @@ RemoteControlHttpServerPort={web_remote_port}
         return False
 
 
+def _remove_sections(text: str, sections) -> str:
+    """
+    Drop INI sections (header through to the next header) from text
+    
+    Args:
+        text: Full INI file contents
+        sections: Section headers to remove, including brackets
+    
+    Returns:
+        Text with those sections removed
+    """
+    return ''.join(_kept_sections(text, sections))
+
+
+def _kept_sections(text: str, sections) -> List[str]:
+    """
+    Slices of text left after dropping the given INI sections
+    
+    Every slice after the first starts with a section header, and there
+    is always at least one slice.
+    """
+    headers = [(m.start(), m.group(1)) for m in _SECTION_RE.finditer(text)]
+    if not headers:
+        return [text]
+    
+    # Anything before the first header is always kept
+    kept = [text[:headers[0][0]]]
+    for i, (start, header) in enumerate(headers):
+        if header not in sections:
+            end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+            kept.append(text[start:end])
+    return kept
+
+
+def _backup_file(path: Path) -> Path:
+    """
+    Snapshot path as <name>.backup alongside it
+    
+    The backup is a hard link where the filesystem allows it, so no data
+    is copied. Files that were backed up must be rewritten with
+    _replacing(), never truncated in place, or the backup changes too.
+    """
+    # with_name skips with_suffix's suffix parsing, and keeps dotfiles
+    # like .env from becoming .env.env.backup
+    backup_path = path.with_name(path.name + '.backup')
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        # No hard link support (e.g. FAT or some network drives)
+        shutil.copy2(path, backup_path)
+    print(f"  Created backup: {backup_path.name}")
+    return backup_path
+
+
+@contextmanager
+def _replacing(path: Path, mode: str = 'w', **kwargs):
+    """
+    Open a sibling temp file for writing and move it over path on success
+    
+    Replacing the file gives it a new inode, leaving any hard-linked
+    backup holding the old contents.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_if_changed(path: Path, content: str, backup: bool) -> bool:
+    """
+    Write content to path unless the file already holds exactly that
+    
+    Args:
+        path: File to write
+        content: New file contents
+        backup: Copy the existing file aside before overwriting it
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if path.exists():
+        if path.read_text(encoding='utf-8') == content:
+            return False
+        if backup:
+            _backup_file(path)
+    
+    with _replacing(path, encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
 def _create_init_script(init_script: Path, project_dir: Path, backup: bool) -> bool:
     """Create init_unreal.py startup script"""
     print("Step 3: Creating init_unreal.py...")
@@ -259,12 +378,6 @@ def _create_init_script(init_script: Path, project_dir: Path, backup: bool) -> b
         # Create Content/Python directory
         init_script.parent.mkdir(parents=True, exist_ok=True)
         
-        # Backup if requested
-        if backup and init_script.exists():
-            backup_path = init_script.with_suffix('.py.backup')
-            shutil.copy2(init_script, backup_path)
-            print(f"  Created backup: {backup_path.name}")
-        
         # Get scripts directory path
         scripts_dir = project_dir / 'scripts'
         command_file = scripts_dir / '.unreal_command.py'
@@ -386,9 +499,10 @@ unreal.register_slate_post_tick_callback(check_commands)
 unreal.log("✓ Slate tick callback registered")
 '''
         
-        # Write init script
-        with open(init_script, 'w', encoding='utf-8') as f:
-            f.write(init_content)
+        # Write init script (backing up the old one) only if it changed
+        if not _write_if_changed(init_script, init_content, backup):
+            print(f"  ✓ {init_script.relative_to(project_dir)} already up to date\n")
+            return True
         
         print(f"  Created: {init_script.relative_to(project_dir)}")
         print("  ✓ Startup script created\n")
@@ -412,12 +526,6 @@ def _create_env_file(
     print("Step 4: Creating .env configuration...")
     
     try:
-        # Backup if requested
-        if backup and env_file.exists():
-            backup_path = env_file.with_suffix('.env.backup')
-            shutil.copy2(env_file, backup_path)
-            print(f"  Created backup: {backup_path.name}")
-        
         env_content = f"""# Unreal Engine Configuration
 UNREAL_ENGINE_PATH=C:/Program Files/Epic Games/UE_5.6/Engine/Binaries/Win64/UnrealEditor-Cmd.exe
 
@@ -460,9 +568,10 @@ LOG_LEVEL=INFO
 ENABLE_VERBOSE_LOGGING=false
 """
         
-        # Write .env file
-        with open(env_file, 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        # Write .env file (backing up the old one) only if it changed
+        if not _write_if_changed(env_file, env_content, backup):
+            print(f"  ✓ {env_file.relative_to(project_dir)} already up to date\n")
+            return True
         
         print(f"  Created: {env_file.relative_to(project_dir)}")
         print("  ✓ Configuration file created\n")
@@ -473,6 +582,32 @@ ENABLE_VERBOSE_LOGGING=false
         return False
 
 
+def _copy_library(source_lib: Path, dest_lib: Path) -> str:
+    """
+    Copy one library folder unless it already exists
+    
+    Returns:
+        Status line to print (returned so concurrent copies don't
+        interleave their output)
+    """
+    lib_name = source_lib.name
+    
+    if not source_lib.exists():
+        return f"  ! Warning: {lib_name} not found at {source_lib}"
+    
+    if dest_lib.exists():
+        return f"  ✓ {lib_name} already exists, skipping"
+    
+    # Content only (no per-file metadata syscalls), minus caches
+    shutil.copytree(
+        source_lib,
+        dest_lib,
+        copy_function=shutil.copyfile,
+        ignore=shutil.ignore_patterns('__pycache__', '*.pyc')
+    )
+    return f"  + Copied {lib_name}/"
+
+
 def _copy_libraries(scripts_dir: Path) -> bool:
     """Copy unreallib, examples, and remotecontrol to the project scripts folder"""
     print("Step 5: Copying libraries and examples...")
@@ -484,20 +619,16 @@ def _copy_libraries(scripts_dir: Path) -> bool:
         # Libraries to copy
         libraries = ['unreallib', 'examples', 'remotecontrol']
         
-        for lib_name in libraries:
-            source_lib = source_scripts_dir / lib_name
-            dest_lib = scripts_dir / lib_name
-            
-            if source_lib.exists():
-                # Copy the library
-                if dest_lib.exists():
-                    print(f"  ✓ {lib_name} already exists, skipping")
-                else:
-                    shutil.copytree(source_lib, dest_lib)
-                    print(f"  + Copied {lib_name}/")
-            else:
-                print(f"  ! Warning: {lib_name} not found at {source_lib}")
+        # Copies are independent and I/O-bound, so run them concurrently;
+        # results are reported in list order
+        with ThreadPoolExecutor(max_workers=len(libraries)) as pool:
+            futures = [
+                pool.submit(_copy_library, source_scripts_dir / lib_name, scripts_dir / lib_name)
+                for lib_name in libraries
+            ]
+            results = [future.result() for future in futures]
         
+        print('\n'.join(results))
         print("  ✓ Libraries copied\n")
         return True
         
@@ -506,6 +637,73 @@ def _copy_libraries(scripts_dir: Path) -> bool:
         return False
 
 
+# Unreal project subfolders that never contain .uproject files
+_NO_UPROJECT_DIRS = frozenset({
+    'Binaries', 'Content', 'DerivedDataCache', 'Intermediate', 'Saved', '.git',
+})
+
+
+def _most_recent_uproject(root: Path) -> Optional[Path]:
+    """
+    Find the most recently modified .uproject file under root
+    
+    Walks the tree with os.scandir so each file's mtime comes from its
+    directory entry, keeping only the newest match as it goes. Project
+    subfolders that never hold a .uproject are not descended into.
+    """
+    best_mtime = -1.0
+    best_path = None
+    stack = [os.fspath(root)]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _NO_UPROJECT_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.uproject'):
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best_mtime, best_path = mtime, entry.path
+        except OSError:
+            # Unreadable directory - skip it
+            continue
+    
+    return Path(best_path) if best_path else None
+
+
+def _unreal_editor_running() -> bool:
+    """
+    Check whether any UnrealEditor process is running
+    
+    Uses psutil when installed. Otherwise, on Windows, asks tasklist
+    (much cheaper to start than PowerShell); elsewhere returns False.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    
+    if psutil is not None:
+        return any(
+            'UnrealEditor' in (proc.info.get('name') or '')
+            for proc in psutil.process_iter(['name'])
+        )
+    
+    if sys.platform != 'win32':
+        return False
+    
+    import subprocess
+    result = subprocess.run(
+        ['tasklist', '/FI', 'IMAGENAME eq UnrealEditor*', '/FO', 'CSV', '/NH'],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    return result.returncode == 0 and 'UnrealEditor' in result.stdout
+
+
 def find_current_project() -> Optional[Path]:
     """
     Attempt to find the currently open Unreal project.
@@ -516,31 +714,15 @@ def find_current_project() -> Optional[Path]:
     Returns:
         Path to .uproject file if found, None otherwise
     """
-    import subprocess
-    
-    # Try to find running Unreal Editor process with project file
+    # If an editor is running, the most recently modified project is
+    # likely the open one
     try:
-        # Get all UnrealEditor processes with command line arguments
-        cmd = 'Get-Process | Where-Object {$_.ProcessName -like "*UnrealEditor*"} | Select-Object -ExpandProperty Path'
-        result = subprocess.run(
-            ['powershell', '-Command', cmd],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0 and result.stdout.strip():
-            # Found Unreal Editor process, now look for .uproject files being accessed
-            # Check recent files in common Unreal project locations
+        if _unreal_editor_running():
             unreal_projects_dir = Path.home() / 'Documents' / 'Unreal Projects'
             
             if unreal_projects_dir.exists():
-                # Find all .uproject files
-                uprojects = list(unreal_projects_dir.rglob('*.uproject'))
-                
-                # Check which one was modified most recently (likely the open one)
-                if uprojects:
-                    most_recent = max(uprojects, key=lambda p: p.stat().st_mtime)
+                most_recent = _most_recent_uproject(unreal_projects_dir)
+                if most_recent:
                     return most_recent
     except Exception as e:
         print(f"  (Could not detect running Unreal Editor: {e})")
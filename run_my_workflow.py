@@ -7,14 +7,54 @@ Usage from command line in your Unreal project:
 Then edit this file to change which workflow runs.
 """
 
+import os
 import unreal
-import importlib, sys
+import sys
+
+# Packages hot-reloaded between runs
+_RELOAD_PACKAGES = ('unreallib', 'remotecontrol')
+
+
+def _source_mtime(root):
+    """Newest .py modification time under root"""
+    newest = 0.0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name != '__pycache__':
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    newest = max(newest, entry.stat().st_mtime)
+    return newest
+
+
+def _loaded_packages():
+    """Top-level reload packages currently imported, with their source mtimes"""
+    return {
+        sys.modules[name]: _source_mtime(os.path.dirname(sys.modules[name].__file__))
+        for name in _RELOAD_PACKAGES
+        if name in sys.modules
+    }
+
 
 # Hot-reload unreallib modules so edits are picked up in a persistent Unreal Python session
 def _reload_unreallib():
-    """Reload all unreallib modules to pick up code changes"""
-    # First, remove all unreallib modules from cache to force fresh imports
-    to_remove = [m for m in list(sys.modules.keys()) if m.startswith('unreallib') or m.startswith('remotecontrol')]
+    """Reload all unreallib modules if their source changed since the last run"""
+    # Each package is stamped with its source mtime after import, so an
+    # untouched tree keeps its already-imported modules
+    loaded = _loaded_packages()
+    if loaded and all(getattr(pkg, '_source_mtime', None) == mtime for pkg, mtime in loaded.items()):
+        print("✓ unreallib unchanged, reusing cached modules")
+        return
+    
+    # Remove all unreallib modules from cache to force fresh imports
+    # Dropping the modules and re-importing below executes each one once,
+    # in import order - no per-module importlib.reload needed
+    to_remove = [
+        m for m in list(sys.modules)
+        if m.partition('.')[0] in _RELOAD_PACKAGES
+    ]
     for m in to_remove:
         del sys.modules[m]
     print(f"🔄 Cleared {len(to_remove)} cached modules for fresh reload")
@@ -23,6 +63,9 @@ _reload_unreallib()
 
 from unreallib.workflow import WorkflowLoader, WorkflowExecutor
 
+for _pkg, _mtime in _loaded_packages().items():
+    _pkg._source_mtime = _mtime
+
 # ============================================================
 # CONFIGURATION - Change these settings
 # ============================================================
@@ -5,7 +5,10 @@ This script tests the lighting system components directly in Unreal.
 Run this from within Unreal Engine's Python console or via remote execution.
 """
 
+import io
 import sys
+import traceback
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 
 # Ensure scripts are in path - handle both file and remote execution
@@ -21,7 +24,25 @@ if str(scripts_dir) not in sys.path:
 import unreal
 from unreallib.tasks.generators import LightsGeneratorTask, ForEachLightTask
 from unreallib.workflow.task import TaskStatus
-from unreallib.workflow import WorkflowLoader, WorkflowExecutor
+from unreallib.workflow import WorkflowLoader, WorkflowExecutor, WorkflowConfig
+from unreallib.level import snapshot_labels, destroy_actors, actors_with_tag
+
+
+# One loader for the workflow tests, so definitions are only read once
+_loader = WorkflowLoader()
+
+
+@contextmanager
+def batched_output():
+    """Collect everything printed inside the block and write it out once"""
+    # Unreal's Python console handles each write separately, so one write
+    # per test is much cheaper than one per line
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
 def test_lights_generator_task():
@@ -144,7 +165,7 @@ def test_lights_generator_validation():
     lights = [{'location': [0, 0, 300]}]
     task = LightsGeneratorTask('test_gen', lights=lights)
     result = task.execute({})
-    assert result.status == TaskStatus.FAILURE, "Should fail without light_type"
+    assert result.status == TaskStatus.FAILED, "Should fail without light_type"
     print(f"  Error: {result.output['error']}")
     print("  ✓ Correctly rejected")
     
@@ -153,7 +174,7 @@ def test_lights_generator_validation():
     lights = [{'light_type': 'point'}]
     task = LightsGeneratorTask('test_gen', lights=lights)
     result = task.execute({})
-    assert result.status == TaskStatus.FAILURE, "Should fail without location"
+    assert result.status == TaskStatus.FAILED, "Should fail without location"
     print(f"  Error: {result.output['error']}")
     print("  ✓ Correctly rejected")
     
@@ -162,7 +183,7 @@ def test_lights_generator_validation():
     lights = [{'light_type': 'invalid', 'location': [0, 0, 300]}]
     task = LightsGeneratorTask('test_gen', lights=lights)
     result = task.execute({})
-    assert result.status == TaskStatus.FAILURE, "Should fail with invalid type"
+    assert result.status == TaskStatus.FAILED, "Should fail with invalid type"
     print(f"  Error: {result.output['error']}")
     print("  ✓ Correctly rejected")
     
@@ -176,23 +197,27 @@ def test_foreach_light_task():
     print("TEST 5: ForEachLightTask - Create Actual Lights")
     print("="*80)
     
-    # Clear existing test lights
-    print("\nCleaning up any existing test lights...")
-    for actor in unreal.EditorLevelLibrary.get_all_level_actors():
-        if actor and actor.get_actor_label().startswith('test_foreach_'):
-            unreal.EditorLevelLibrary.destroy_actor(actor)
+    # Lights left by an earlier run are reused through the actor registry
+    # rather than destroyed and respawned; only strays are removed
+    prefix = 'test_foreach_'
+    expected_labels = {f'{prefix}key', f'{prefix}fill'}
+    print("\nCleaning up any stray test lights...")
+    destroy_actors(
+        a for a, label in snapshot_labels(unreal.Light)
+        if label.startswith(prefix) and label not in expected_labels
+    )
     
     # Generate lights
     lights = [
         {
-            'actor_id': 'test_foreach_key',
+            'actor_id': 'key',
             'light_type': 'point',
             'location': [200, 100, 300],
             'intensity': 8000.0,
             'color': [1.0, 0.9, 0.8]
         },
         {
-            'actor_id': 'test_foreach_fill',
+            'actor_id': 'fill',
             'light_type': 'point',
             'location': [-200, -100, 250],
             'intensity': 5000.0,
@@ -205,8 +230,11 @@ def test_foreach_light_task():
     
     print(f"Generated {gen_result.output['count']} light configs")
     
-    # Create lights
-    context = {'gen': gen_result.output}
+    # Create (or update) lights
+    context = {
+        'gen': gen_result.output,
+        'workflow_config': WorkflowConfig(upsert_mode=True, actor_id_prefix=prefix),
+    }
     create_task = ForEachLightTask('create', lights_input='gen.lights')
     create_result = create_task.execute(context)
     
@@ -221,12 +249,12 @@ def test_foreach_light_task():
     
     # Verify lights exist in level
     print("\nVerifying lights in level...")
-    all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    test_lights = [a for a in all_actors if a and 'test_foreach' in a.get_actor_label()]
+    # The registry tags each light with its prefix
+    test_lights = [(a, a.get_actor_label()) for a in actors_with_tag(prefix)]
     print(f"Found {len(test_lights)} test lights in level")
     
-    for light in test_lights:
-        print(f"  - {light.get_actor_label()} at {light.get_actor_location()}")
+    for light, label in test_lights:
+        print(f"  - {label} at {light.get_actor_location()}")
     
     assert len(test_lights) == 2, "Should have 2 lights in level"
     
@@ -242,14 +270,11 @@ def test_full_workflow_json():
     
     # Clear existing lights
     print("\nCleaning up existing workflow lights...")
-    for actor in unreal.EditorLevelLibrary.get_all_level_actors():
-        if actor and 'demo_' in actor.get_actor_label():
-            unreal.EditorLevelLibrary.destroy_actor(actor)
+    destroy_actors(a for a, label in snapshot_labels() if 'demo_' in label)
     
     # Load workflow
     print("\nLoading workflow: complete_scene_with_lights.json")
-    loader = WorkflowLoader()
-    workflow = loader.load('complete_scene_with_lights')
+    workflow = _loader.load('complete_scene_with_lights')
     
     print(f"Loaded workflow: {workflow.name}")
     print(f"Tasks: {len(workflow.tasks)}")
@@ -273,12 +298,10 @@ def test_full_workflow_json():
     
     # Verify objects in scene
     print("\nVerifying scene objects...")
-    all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    demo_actors = [a for a in all_actors if a and 'demo_' in a.get_actor_label()]
+    demo_actors = [(a, a.get_actor_label()) for a in actors_with_tag('demo_')]
     
     print(f"Found {len(demo_actors)} demo actors:")
-    for actor in demo_actors:
-        label = actor.get_actor_label()
+    for actor, label in demo_actors:
         location = actor.get_actor_location()
         print(f"  - {label} at {location}")
     
@@ -296,14 +319,11 @@ def test_studio_lighting_workflow():
     
     # Clear existing lights
     print("\nCleaning up existing studio lights...")
-    for actor in unreal.EditorLevelLibrary.get_all_level_actors():
-        if actor and 'studio_' in actor.get_actor_label():
-            unreal.EditorLevelLibrary.destroy_actor(actor)
+    destroy_actors(a for a, label in snapshot_labels(unreal.Light) if 'studio_' in label)
     
     # Load and execute
     print("\nLoading workflow: lighting_studio.json")
-    loader = WorkflowLoader()
-    workflow = loader.load('lighting_studio')
+    workflow = _loader.load('lighting_studio')
     
     print(f"Executing {workflow.name}...")
     executor = WorkflowExecutor()
@@ -315,14 +335,13 @@ def test_studio_lighting_workflow():
     assert result.status == TaskStatus.SUCCESS, "Studio lighting should succeed"
     
     # Verify lights
-    all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    studio_lights = [a for a in all_actors if a and 'studio_' in a.get_actor_label()]
+    studio_labels = [a.get_actor_label() for a in actors_with_tag('studio_')]
     
-    print(f"\nCreated {len(studio_lights)} studio lights:")
-    for light in studio_lights:
-        print(f"  - {light.get_actor_label()}")
+    print(f"\nCreated {len(studio_labels)} studio lights:")
+    for label in studio_labels:
+        print(f"  - {label}")
     
-    assert len(studio_lights) == 5, "Should have 5 studio lights"
+    assert len(studio_labels) == 5, "Should have 5 studio lights"
     
     print("✓ PASSED")
     return True
@@ -334,16 +353,14 @@ def cleanup_test_lights():
     print("CLEANUP: Removing Test Lights")
     print("="*80)
     
-    prefixes = ['test_', 'demo_', 'studio_']
-    removed = 0
+    # str.startswith checks a whole tuple of prefixes in one call
+    prefixes = ('test_', 'demo_', 'studio_')
+    to_remove = [(a, label) for a, label in snapshot_labels() if label.startswith(prefixes)]
+    for _, label in to_remove:
+        print(f"  Removing: {label}")
     
-    for actor in unreal.EditorLevelLibrary.get_all_level_actors():
-        if actor:
-            label = actor.get_actor_label()
-            if any(label.startswith(prefix) for prefix in prefixes):
-                print(f"  Removing: {label}")
-                unreal.EditorLevelLibrary.destroy_actor(actor)
-                removed += 1
+    # One bulk destroy instead of a call per actor
+    removed = destroy_actors(a for a, _ in to_remove)
     
     print(f"\nRemoved {removed} test actors")
 
@@ -370,19 +387,21 @@ def run_all_tests():
     
     for test_name, test_func in tests:
         try:
-            if test_func():
+            with batched_output():
+                ok = test_func()
+            if ok:
                 passed += 1
         except Exception as e:
             failed += 1
             errors.append((test_name, str(e)))
             print(f"\n✗ FAILED: {test_name}")
             print(f"  Error: {e}")
-            import traceback
             traceback.print_exc()
     
     # Cleanup
     try:
-        cleanup_test_lights()
+        with batched_output():
+            cleanup_test_lights()
     except Exception as e:
         print(f"Cleanup error: {e}")
     
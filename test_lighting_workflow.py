@@ -3,7 +3,8 @@ Test the complete lighting workflow system in Unreal
 This tests the LightsGeneratorTask and ForEachLightTask
 """
 
-import unreal
+import traceback
+
 print("\n" + "="*70)
 print("LIGHTING WORKFLOW SYSTEM TEST")
 print("="*70)
@@ -11,6 +12,7 @@ print("="*70)
 # Import workflow system
 from unreallib.workflow import WorkflowLoader, WorkflowGraph, WorkflowExecutor
 from unreallib.workflow.task import TaskStatus
+from unreallib.level import actors_with_tag
 
 # Test loading and executing the studio lighting workflow
 print("\n1. Loading lighting_studio workflow...")
@@ -21,7 +23,6 @@ try:
     print(f"   Tasks: {list(workflow.tasks.keys())}")
 except Exception as e:
     print(f"   ✗ Error loading workflow: {e}")
-    import traceback
     traceback.print_exc()
     exit(1)
 
@@ -47,19 +48,17 @@ try:
     print(f"\n   ✓ Workflow completed: {'All tasks succeeded' if all_success else 'Some tasks failed'}")
 except Exception as e:
     print(f"   ✗ Error executing workflow: {e}")
-    import traceback
     traceback.print_exc()
     exit(1)
 
 # Verify lights in scene
 print("\n3. Verifying lights in scene...")
 try:
-    all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    studio_lights = [a for a in all_actors if a and 'studio_' in a.get_actor_label()]
+    # The registry tags each light with the workflow's actor_id_prefix
+    studio_lights = [(a, a.get_actor_label()) for a in actors_with_tag('studio_')]
     
     print(f"   Found {len(studio_lights)} studio lights:")
-    for light in studio_lights:
-        label = light.get_actor_label()
+    for light, label in studio_lights:
         location = light.get_actor_location()
         print(f"     - {label} at ({location.x:.0f}, {location.y:.0f}, {location.z:.0f})")
     
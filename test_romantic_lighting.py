@@ -2,6 +2,8 @@
 Test the romantic dining room lighting workflow
 """
 
+import traceback
+
 import unreal
 
 print("\n" + "="*70)
@@ -10,6 +12,7 @@ print("="*70)
 
 from unreallib.workflow import WorkflowLoader, WorkflowExecutor
 from unreallib.workflow.task import TaskStatus
+from unreallib.level import snapshot_labels
 
 # Load and execute the romantic dining workflow
 print("\n📖 Loading romantic dining room lighting workflow...")
@@ -20,7 +23,6 @@ try:
     print(f"   Tasks: {list(workflow.tasks.keys())}")
 except Exception as e:
     print(f"   ✗ Error loading workflow: {e}")
-    import traceback
     traceback.print_exc()
     exit(1)
 
@@ -46,19 +48,18 @@ try:
     print(f"\n   ✓ Workflow completed: {'All tasks succeeded' if all_success else 'Some tasks failed'}")
 except Exception as e:
     print(f"   ✗ Error executing workflow: {e}")
-    import traceback
     traceback.print_exc()
     exit(1)
 
 # Verify lights were created
 print("\n🔍 Verifying romantic lights in scene...")
-all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-romantic_lights = [a for a in all_actors if a.get_name().startswith('romance_')]
+# Only lights come back from the engine; labels are read once each
+romantic_lights = [(a, label) for a, label in snapshot_labels(unreal.Light) if 'romance_' in label]
 
 print(f"   Found {len(romantic_lights)} romantic lights:")
-for light in romantic_lights:
+for light, label in romantic_lights:
     location = light.get_actor_location()
-    print(f"     • {light.get_name()} at ({location.x:.0f}, {location.y:.0f}, {location.z:.0f})")
+    print(f"     • {label} at ({location.x:.0f}, {location.y:.0f}, {location.z:.0f})")
 
 print("\n" + "="*70)
 print("✅ ROMANTIC DINING ROOM LIGHTING TEST COMPLETE")
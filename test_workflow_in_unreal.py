@@ -3,8 +3,11 @@ Test JSON workflow system in Unreal Engine
 Loads and executes a workflow in the current level
 """
 
+import time
+
 import unreal
 from unreallib.workflow import WorkflowLoader, WorkflowExecutor
+from unreallib.level import snapshot_labels
 
 print("=" * 70)
 print("TESTING JSON WORKFLOW SYSTEM")
@@ -45,10 +48,9 @@ print("\n[4] Executing Workflow...")
 print("-" * 70)
 executor = WorkflowExecutor(config=config)
 
-import time
-start_time = time.time()
+start_time = time.perf_counter()
 results = executor.execute(workflow)
-elapsed = time.time() - start_time
+elapsed = time.perf_counter() - start_time
 
 # Show results
 print("-" * 70)
@@ -64,9 +66,7 @@ print("WORKFLOW TEST COMPLETE!")
 print("=" * 70)
 
 # Verify actors were created
-editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-all_actors = editor_subsystem.get_all_level_actors()
-workflow_actors = [a for a in all_actors if a.get_actor_label().startswith('grid_')]
+workflow_actors = [a for a, label in snapshot_labels() if label.startswith('grid_')]
 
 print(f"\nVerification: Found {len(workflow_actors)} actors with 'grid_' prefix")
 print("\nYou should see a 5x5 grid of cubes in your level!")
@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import sys
+from itertools import repeat
+from pathlib import Path
+from unittest.mock import MagicMock
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# The parts of the unreal API that unreallib uses. The mock refuses any
+# other name, so a misspelt or new API call fails instead of passing silently
+_UNREAL_API = (
+    'Actor', 'AddNewSubobjectParams', 'AssetImportTask', 'AssetToolsHelpers',
+    'Blueprint', 'BlueprintEditorLibrary', 'BlueprintFactory', 'CameraActor',
+    'ComponentMobility', 'DirectionalLight', 'EditorActorSubsystem',
+    'EditorAssetLibrary', 'EditorAssetSubsystem', 'EditorLevelLibrary',
+    'GameplayStatics', 'ImportAssetParameters', 'InterchangeForceMeshType',
+    'InterchangeManager', 'LevelEditorSubsystem', 'Light', 'LightComponent',
+    'LinearColor', 'MaterialEditingLibrary', 'MaterialInstanceConstant',
+    'MaterialInstanceConstantFactoryNew', 'Name', 'PointLight',
+    'PythonScriptLibrary', 'Rotator', 'SoftObjectPath', 'SpotLight',
+    'StaticMesh', 'StaticMeshActor', 'StaticMeshComponent',
+    'SubobjectDataBlueprintFunctionLibrary', 'SubobjectDataSubsystem',
+    'SystemLibrary', 'Vector', 'get_editor_subsystem', 'get_engine_subsystem',
+    'log', 'log_error', 'log_warning', 'register_slate_post_tick_callback',
+)
+
+# unreal only exists inside the editor. Install one mock before any test
+# module is collected, since importing unreallib needs it
+_UNREAL_MOCK = sys.modules.setdefault('unreal', MagicMock(spec_set=_UNREAL_API))
+
+import pytest
+from types import SimpleNamespace
+from remotecontrol.config import RemoteControlConfig
+from unreallib.workflow.task import TaskStatus
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_unreal():
+    """The shared mock unreal module, removed again when the session ends"""
+    yield _UNREAL_MOCK
+    if sys.modules.get('unreal') is _UNREAL_MOCK:
+        del sys.modules['unreal']
+
+
+class FakeCreateLightTask:
+    """
+    Stand-in for CreateLightTask that never touches the editor
+    
+    Every instance is recorded in `instances`. execute() returns the next
+    item of `results`, which is CREATED forever unless a test swaps in its
+    own sequence, e.g. iter([CREATED, FAILED, CREATED]).
+    """
+    CREATED = SimpleNamespace(status=TaskStatus.SUCCESS, output={'action': 'created'})
+    FAILED = SimpleNamespace(status=TaskStatus.FAILED, output={'error': 'Failed to create'})
+    
+    instances = []
+    results = repeat(CREATED)
+    
+    def __init__(self, name, **params):
+        self.name = name
+        self.params = params
+        self.instances.append(self)
+    
+    def execute(self, context):
+        return next(self.results)
+
+
+@pytest.fixture
+def fake_create_light_task(monkeypatch):
+    """Swap CreateLightTask in ForEachLightTask for a fresh FakeCreateLightTask"""
+    fake = type('FakeCreateLightTask', (FakeCreateLightTask,), {'instances': []})
+    monkeypatch.setattr('unreallib.tasks.generators.for_each_light_task.CreateLightTask', fake)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Built-in default config, shared by tests that only read it (it is frozen)"""
+    return RemoteControlConfig()
+
+
+@pytest.fixture
+def client(default_config):
+    """Remote client on the default config, closed after the test"""
+    from remotecontrol.client import UnrealRemoteClient
+    with UnrealRemoteClient(default_config) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def unreal_client():
+    """
+    Client for a running Unreal Editor, shared by the integration tests
+    
+    Skips the requesting tests when upyrc isn't installed or no editor
+    answers. Only upyrc is tried: the file method can't tell whether
+    anything is watching the command file.
+    """
+    from remotecontrol.client import UnrealRemoteClient
+    client = UnrealRemoteClient(RemoteControlConfig.from_env())
+    if not client._upyrc_available:
+        pytest.skip("upyrc not installed")
+    if not client.test_connection(method='upyrc'):
+        client.close()
+        pytest.skip("Unreal Editor not reachable")
+    yield client
+    client.close()
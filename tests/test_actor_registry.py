@@ -0,0 +1,68 @@
+"""
+Tests for ActorRegistry prefix tagging
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from unreallib import utils
+
+
+class FakeActor:
+    """Actor with a label and editor-property tags"""
+    
+    def __init__(self, label, tags=()):
+        self.label = label
+        self.tags = list(tags)
+    
+    def get_actor_label(self):
+        return self.label
+    
+    def set_actor_label(self, label):
+        self.label = label
+    
+    def get_editor_property(self, name):
+        assert name == 'tags'
+        return list(self.tags)
+    
+    def set_editor_property(self, name, value):
+        assert name == 'tags'
+        self.tags = list(value)
+
+
+@pytest.fixture
+def level(monkeypatch):
+    """Mock unreal module whose level holds the returned list of actors"""
+    actors = []
+    unreal = MagicMock()
+    unreal.Name = str
+    unreal.EditorLevelLibrary.get_all_level_actors.return_value = actors
+    monkeypatch.setattr(utils, 'unreal', unreal)
+    return actors
+
+
+def test_register_tags_new_actor(level):
+    """Test that a registered actor is tagged with the prefix once"""
+    registry = utils.ActorRegistry(prefix='test_')
+    actor = FakeActor('Cube')
+    
+    registry.register('key', actor)
+    registry.register('key', actor)
+    
+    assert actor.label == 'test_key'
+    assert actor.tags == ['test_']
+
+
+def test_existing_actor_tagged_on_load(level):
+    """Test that actors found in the level get the tag before any update"""
+    old = FakeActor('test_key', tags=['keep'])
+    level.append(old)
+    level.append(FakeActor('other_fill'))
+    
+    registry = utils.ActorRegistry(prefix='test_')
+    actor, created = registry.update_or_create('key', create_fn=lambda: FakeActor('new'))
+    
+    assert actor is old
+    assert created is False
+    assert old.tags == ['keep', 'test_']
+    assert level[1].tags == []
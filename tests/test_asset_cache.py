@@ -0,0 +1,51 @@
+"""
+Tests for the asset loading cache
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from unreallib import asset_cache
+
+
+@pytest.fixture
+def mock_unreal(monkeypatch):
+    """Install a fresh mock unreal module and empty the cache"""
+    unreal = MagicMock()
+    unreal.SystemLibrary.is_valid.return_value = True
+    monkeypatch.setitem(sys.modules, 'unreal', unreal)
+    asset_cache.clear_cache()
+    yield unreal
+    asset_cache.clear_cache()
+
+
+class TestAssetCache:
+    """Tests for asset_cache.load_asset"""
+    
+    def test_repeated_load_hits_cache(self, mock_unreal):
+        """Test that the same path is only loaded once"""
+        first = asset_cache.load_asset('/Engine/BasicShapes/Cube')
+        second = asset_cache.load_asset('/Engine/BasicShapes/Cube')
+        
+        assert first is second
+        mock_unreal.EditorAssetLibrary.load_asset.assert_called_once_with('/Engine/BasicShapes/Cube')
+    
+    def test_invalid_asset_is_reloaded(self, mock_unreal):
+        """Test that an asset no longer valid in Unreal is loaded again"""
+        asset_cache.load_asset('/Engine/BasicShapes/Cube')
+        mock_unreal.SystemLibrary.is_valid.return_value = False
+        asset_cache.load_asset('/Engine/BasicShapes/Cube')
+        
+        assert mock_unreal.EditorAssetLibrary.load_asset.call_count == 2
+    
+    def test_missing_asset_not_cached(self, mock_unreal):
+        """Test that failed loads are retried on the next call"""
+        mock_unreal.EditorAssetLibrary.load_asset.return_value = None
+        
+        assert asset_cache.load_asset('/Game/Missing') is None
+        assert asset_cache.load_asset('/Game/Missing') is None
+        assert mock_unreal.EditorAssetLibrary.load_asset.call_count == 2
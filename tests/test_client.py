@@ -19,34 +19,155 @@ def test_client_creation():
     assert isinstance(client.config, RemoteControlConfig)
 
 
-def test_client_with_custom_config():
+def test_client_with_custom_config(default_config):
     """Test creating client with custom config"""
-    config = RemoteControlConfig()
-    client = UnrealRemoteClient(config)
+    client = UnrealRemoteClient(default_config)
     
-    assert client.config is config
+    assert client.config is default_config
 
 
-def test_upyrc_availability():
+def test_upyrc_availability(client):
     """Test upyrc availability detection"""
-    client = UnrealRemoteClient()
-    
     # Should be boolean
     assert isinstance(client._upyrc_available, bool)
 
 
-def test_invalid_method_raises():
+def test_invalid_method_raises(client):
     """Test that invalid method raises error"""
-    client = UnrealRemoteClient()
-    
     with pytest.raises(ValueError):
         client.execute("test code", method='invalid_method')
 
 
-def test_client_repr():
+def test_execute_file_invalid_method_raises(client, tmp_path, monkeypatch):
+    """Test that execute_file rejects an unknown method before trying upyrc"""
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')")
+    
+    client._upyrc_available = True
+    sent = []
+    monkeypatch.setattr(client, '_execute_upyrc', lambda code, *a: sent.append(code) or True)
+    
+    with pytest.raises(ValueError):
+        client.execute_file(script, method='upyr')
+    assert sent == []
+
+
+def test_client_repr(client):
     """Test client string representation"""
-    client = UnrealRemoteClient()
     repr_str = repr(client)
     
     assert "UnrealRemoteClient" in repr_str
     assert "Project:" in repr_str
+
+
+def test_connection_reused_and_closed():
+    """Test that the upyrc connection is opened once and released on exit"""
+    from unittest.mock import MagicMock
+    
+    with UnrealRemoteClient() as client:
+        conn = MagicMock()
+        client._conn = conn
+        assert client._get_conn() is conn
+        assert client._get_conn() is conn
+    
+    conn.__exit__.assert_called_once_with(None, None, None)
+    assert client._conn is None
+
+
+def test_wait_for_clear(tmp_path):
+    """Test waiting for the command file to be consumed"""
+    command_file = tmp_path / ".unreal_command.py"
+    
+    # Missing or empty file counts as processed
+    assert UnrealRemoteClient._wait_for_clear(command_file, timeout=0) is True
+    command_file.write_text("")
+    assert UnrealRemoteClient._wait_for_clear(command_file, timeout=0) is True
+    
+    # A file nobody clears times out
+    command_file.write_text("print('hi')")
+    assert UnrealRemoteClient._wait_for_clear(command_file, timeout=0.02) is False
+
+
+def test_execute_file_sends_path_via_upyrc(client, tmp_path, monkeypatch):
+    """Test that upyrc execution passes the script path, not its contents"""
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')")
+    
+    client._upyrc_available = True
+    sent = []
+    monkeypatch.setattr(client, '_execute_upyrc', lambda code, *a: sent.append(code) or True)
+    
+    assert client.execute_file(script, method='upyrc') is True
+    assert sent == [f'"{script.resolve()}"']
+
+
+def test_execute_file_quotes_path_with_spaces(client, tmp_path, monkeypatch):
+    """Test that a path with spaces reaches upyrc as one quoted token"""
+    folder = tmp_path / "Unreal Projects"
+    folder.mkdir()
+    script = folder / "script.py"
+    script.write_text("print('hi')")
+    
+    client._upyrc_available = True
+    sent = []
+    monkeypatch.setattr(client, '_execute_upyrc', lambda code, *a: sent.append(code) or True)
+    
+    assert client.execute_file(script, method='upyrc') is True
+    assert sent == [f'"{script.resolve()}"']
+
+
+def test_auto_falls_back_to_file_when_upyrc_fails(client, monkeypatch):
+    """Test that method='auto' uses the file method when upyrc returns False"""
+    client._upyrc_available = True
+    monkeypatch.setattr(client, '_execute_upyrc', lambda *a: False)
+    fallback = []
+    monkeypatch.setattr(client, '_execute_file', lambda code, *a, **kw: fallback.append(code) or True)
+    
+    assert client.execute("print('hi')", method='auto') is True
+    assert fallback == ["print('hi')"]
+
+
+def test_execute_file_auto_falls_back_when_upyrc_fails(client, tmp_path, monkeypatch):
+    """Test that execute_file(method='auto') falls back to the file method"""
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')")
+    
+    client._upyrc_available = True
+    monkeypatch.setattr(client, '_execute_upyrc', lambda *a: False)
+    fallback = []
+    monkeypatch.setattr(client, '_execute_file', lambda code, *a, **kw: fallback.append(kw.get('source')) or True)
+    
+    assert client.execute_file(script, method='auto') is True
+    assert fallback == [script]
+
+
+def test_execute_file_upyrc_failure_returns_false(client, tmp_path, monkeypatch):
+    """Test that method='upyrc' reports a failed send instead of falling back"""
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')")
+    
+    client._upyrc_available = True
+    monkeypatch.setattr(client, '_execute_upyrc', lambda *a: False)
+    
+    assert client.execute_file(script, method='upyrc') is False
+
+
+def test_execute_file_copies_script_for_file_method(tmp_path):
+    """Test that the file method copies the script into the command file"""
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')\n")
+    config = RemoteControlConfig(PROJECT_FOLDER=tmp_path / "project")
+    
+    client = UnrealRemoteClient(config)
+    assert client.execute_file(script, method='file', timeout=0) is True
+    assert config.COMMAND_FILE.read_text() == "print('hi')\n"
+
+
+def test_execute_code_via_file_method(tmp_path):
+    """Test that code is handed off through the command file atomically"""
+    config = RemoteControlConfig(PROJECT_FOLDER=tmp_path / "project")
+    client = UnrealRemoteClient(config)
+    
+    assert client.execute("x = 'é'", method='file', timeout=0) is True
+    assert config.COMMAND_FILE.read_text(encoding='utf-8') == "x = 'é'"
+    assert not config.COMMAND_FILE.with_suffix('.py.tmp').exists()
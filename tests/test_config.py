@@ -12,9 +12,9 @@ import tempfile
 from remotecontrol.config import RemoteControlConfig
 
 
-def test_config_creation():
+def test_config_creation(default_config):
     """Test creating config without .env file"""
-    config = RemoteControlConfig()
+    config = default_config
     
     assert config.PROJECT_NAME is not None
     assert config.MULTICAST_GROUP is not None
@@ -38,7 +38,7 @@ GRID_ROWS=10
     env_file.write_text(env_content)
     
     # Load config
-    config = RemoteControlConfig(env_file)
+    config = RemoteControlConfig.from_env(env_file)
     
     assert config.PROJECT_NAME == "TestProject"
     assert config.MULTICAST_HOST == "192.168.1.1"
@@ -46,38 +46,73 @@ GRID_ROWS=10
     assert config.GRID_ROWS == 10
 
 
-def test_multicast_config():
+def test_multicast_config(default_config):
     """Test multicast configuration"""
-    config = RemoteControlConfig()
+    config = default_config
     
     assert len(config.MULTICAST_GROUP) == 2
     assert isinstance(config.MULTICAST_GROUP[0], str)
     assert isinstance(config.MULTICAST_GROUP[1], int)
 
 
-def test_paths_config():
+def test_paths_config(default_config):
     """Test path configuration"""
-    config = RemoteControlConfig()
+    config = default_config
     
     assert isinstance(config.PROJECT_FOLDER, Path)
     assert isinstance(config.SCRIPTS_FOLDER, Path)
     assert isinstance(config.CONTENT_FOLDER, Path)
 
 
-def test_scene_config():
+def test_scene_config(default_config):
     """Test scene configuration"""
-    config = RemoteControlConfig()
+    config = default_config
     
     assert config.GRID_ROWS > 0
     assert config.GRID_COLS > 0
     assert config.CIRCLE_RADIUS > 0
 
 
-def test_config_repr():
+def test_config_repr(default_config):
     """Test config string representation"""
-    config = RemoteControlConfig()
+    config = default_config
     repr_str = repr(config)
     
     assert "RemoteControlConfig" in repr_str
     assert "Project:" in repr_str
     assert "Multicast:" in repr_str
+
+
+def test_config_is_frozen(default_config):
+    """Test that config values can't be reassigned"""
+    import dataclasses
+    config = default_config
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.PROJECT_NAME = "Other"
+
+
+def test_derived_paths_follow_project():
+    """Test that derived paths are computed from the given project"""
+    config = RemoteControlConfig(PROJECT_NAME="Demo", PROJECT_FOLDER=Path("/projects/Demo"))
+    
+    assert config.PROJECT_FILE == Path("/projects/Demo/Demo.uproject")
+    assert config.COMMAND_FILE == Path("/projects/Demo/scripts/.unreal_command.py")
+    assert config.MULTICAST_GROUP == (config.MULTICAST_HOST, config.MULTICAST_PORT)
+
+
+def test_upyrc_config_cached(monkeypatch):
+    """Test that the upyrc config is built once per config"""
+    from unittest.mock import MagicMock
+    upyre = MagicMock()
+    upyrc = MagicMock(upyre=upyre)
+    monkeypatch.setitem(sys.modules, 'upyrc', upyrc)
+    monkeypatch.setitem(sys.modules, 'upyrc.upyre', upyre)
+    
+    config = RemoteControlConfig()
+    
+    assert config.upyrc_config is config.upyrc_config
+    upyre.RemoteExecutionConfig.assert_called_once_with(
+        multicast_group=config.MULTICAST_GROUP,
+        multicast_bind_address=config.MULTICAST_BIND_ADDRESS
+    )
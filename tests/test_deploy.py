@@ -0,0 +1,48 @@
+"""
+Tests for the deploy script's directory copy
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'env_setup'))
+
+from deploy import _copy_one, _copy_file, _link_or_copy
+
+
+def _tree(root):
+    return sorted(p.relative_to(root).as_posix() for p in root.rglob('*'))
+
+
+def test_redeploy_removes_stale_files(tmp_path):
+    """Test that files deleted or renamed in the source leave the target"""
+    source = tmp_path / 'src'
+    (source / 'sub').mkdir(parents=True)
+    (source / 'a.py').write_text("a = 1\n")
+    (source / 'sub' / 'b.py').write_text("b = 1\n")
+    target = tmp_path / 'dst'
+    
+    assert _copy_one(source, target, 'lib', 'Library', _copy_file)[0]
+    
+    (source / 'sub' / 'b.py').rename(source / 'sub' / 'c.py')
+    (target / 'old_module.py').write_text("old = 1\n")
+    (target / 'old_package').mkdir()
+    
+    success, lines = _copy_one(source, target, 'lib', 'Library', _link_or_copy)
+    
+    assert success
+    assert _tree(target) == ['a.py', 'sub', 'sub/c.py']
+    assert '3 stale removed' in lines[0]
+
+
+def test_deploy_skips_bytecode(tmp_path):
+    """Test that __pycache__ and .pyc files are neither copied nor kept"""
+    source = tmp_path / 'src'
+    (source / '__pycache__').mkdir(parents=True)
+    (source / '__pycache__' / 'a.cpython-311.pyc').write_bytes(b'')
+    (source / 'a.py').write_text("a = 1\n")
+    (source / 'b.pyc').write_bytes(b'')
+    target = tmp_path / 'dst'
+    
+    assert _copy_one(source, target, 'lib', 'Library', _copy_file)[0]
+    
+    assert _tree(target) == ['a.py']
@@ -0,0 +1,58 @@
+"""
+Tests for the execute CLI's batch mode
+"""
+
+import sys
+from argparse import Namespace
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from remotecontrol.execute import _run_batch
+
+
+class StubClient:
+    """Client that records each script and fails the ones named bad*.py"""
+    
+    def __init__(self):
+        self.scripts = []
+    
+    def execute_file(self, script_path, method, exec_type, raise_on_error):
+        self.scripts.append(script_path)
+        return script_path.exists() and not script_path.name.startswith('bad')
+
+
+def _args(batch):
+    return Namespace(batch=batch, method='auto', exec_type='file')
+
+
+def test_batch_counts_and_exit_code(tmp_path, capsys):
+    """Test that the batch reports successes and fails if any script fails"""
+    (tmp_path / 'scripts').mkdir()
+    (tmp_path / 'scripts' / 'a.py').write_text("a = 1\n")
+    (tmp_path / 'scripts' / 'bad.py').write_text("b = 1\n")
+    batch = tmp_path / 'batch.txt'
+    batch.write_text("# setup\nscripts/a.py\n\nscripts/bad.py\n")
+    
+    client = StubClient()
+    
+    assert _run_batch(_args(batch), client) == 1
+    assert client.scripts == [tmp_path / 'scripts' / 'a.py', tmp_path / 'scripts' / 'bad.py']
+    assert "1/2 scripts succeeded" in capsys.readouterr().out
+
+
+def test_batch_all_succeed(tmp_path):
+    """Test that a batch where every script succeeds exits with 0"""
+    (tmp_path / 'a.py').write_text("a = 1\n")
+    batch = tmp_path / 'batch.txt'
+    batch.write_text("a.py\n")
+    
+    assert _run_batch(_args(batch), StubClient()) == 0
+
+
+def test_missing_batch_file(tmp_path, caplog):
+    """Test that an unreadable batch file is an error, not a traceback"""
+    client = StubClient()
+    
+    assert _run_batch(_args(tmp_path / 'missing.txt'), client) == 1
+    assert client.scripts == []
+    assert "Cannot read batch file" in caplog.text
@@ -1,10 +1,11 @@
 """
 Integration tests for actor spawning and manipulation
 
-These tests require Unreal Engine to be running with a level open.
-They test real actor operations in the Unreal environment.
+These tests require Unreal Engine to be running with a level open and
+upyrc installed. Each test sends its code to the editor and fails if
+the code raises there; without a reachable editor they are skipped.
 
-Run with: pytest tests/test_integration_actors.py -v
+Run with: INTEGRATION=1 pytest tests/test_integration_actors.py -m integration -v
 """
 
 import pytest
@@ -14,11 +15,13 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+pytestmark = pytest.mark.integration
+
 
 class TestActorSpawning:
     """Tests for basic actor spawning operations"""
     
-    def test_spawn_cube(self):
+    def test_spawn_cube(self, unreal_client):
         """Test spawning a single cube"""
         # This would be run via remotecontrol in Unreal
         code = """
@@ -34,10 +37,9 @@ assert cube is not None
 assert cube.get_actor_label() == "test_integration_cube"
 print("✓ Cube spawned successfully")
 """
-        # In a real test, we'd execute this via remotecontrol and check results
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_spawn_grid(self):
+    def test_spawn_grid(self, unreal_client):
         """Test spawning a grid of actors"""
         code = """
 from unreallib import actors, level
@@ -52,9 +54,9 @@ grid_actors = actors.spawn_grid(rows=3, cols=3, spacing=200.0, shape='sphere')
 assert len(grid_actors) == 9
 print(f"✓ Grid spawned: {len(grid_actors)} spheres")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_clear_level(self):
+    def test_clear_level(self, unreal_client):
         """Test clearing actors from level"""
         code = """
 from unreallib import level
@@ -72,9 +74,9 @@ count = level.get_actor_count()
 assert count == 0
 print("✓ Level cleared successfully")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_actor_labeling(self):
+    def test_actor_labeling(self, unreal_client):
         """Test actor label assignment and retrieval"""
         code = """
 import unreal
@@ -89,13 +91,13 @@ label = cube.get_actor_label()
 assert label == "test_labeled_cube"
 print(f"✓ Actor labeled: {label}")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
 
 
 class TestActorManipulation:
     """Tests for actor manipulation operations"""
     
-    def test_actor_position(self):
+    def test_actor_position(self, unreal_client):
         """Test setting and getting actor position"""
         code = """
 import unreal
@@ -111,9 +113,9 @@ assert abs(loc.y - 200) < 1.0
 assert abs(loc.z - 300) < 1.0
 print(f"✓ Position verified: {loc}")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_actor_scale(self):
+    def test_actor_scale(self, unreal_client):
         """Test spawning with different scales"""
         code = """
 from unreallib import actors
@@ -126,9 +128,4 @@ assert small is not None
 assert large is not None
 print("✓ Scaled actors spawned")
 """
-        assert True  # Placeholder
-
-
-# Note: These are placeholder tests that demonstrate structure.
-# Real integration tests would use remotecontrol to execute code in Unreal
-# and verify results. This requires a running Unreal instance.
+        assert unreal_client.execute(code, method='upyrc')
@@ -2,9 +2,10 @@
 Integration tests for upsert functionality
 
 Tests actor creation vs update behavior with the upsert pattern.
-Requires Unreal Engine running with a level open.
+Requires Unreal Engine running with a level open and upyrc installed;
+without a reachable editor the tests are skipped.
 
-Run with: pytest tests/test_integration_upsert.py -v
+Run with: INTEGRATION=1 pytest tests/test_integration_upsert.py -m integration -v
 """
 
 import pytest
@@ -14,11 +15,13 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+pytestmark = pytest.mark.integration
+
 
 class TestUpsertBasics:
     """Tests for basic upsert functionality"""
     
-    def test_upsert_creates_new_actors(self):
+    def test_upsert_creates_new_actors(self, unreal_client):
         """First run should create new actors"""
         code = """
 import unreal
@@ -52,9 +55,9 @@ for row in range(3):
 assert created == 9
 print(f"✓ Created {created} new actors")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_upsert_updates_existing_actors(self):
+    def test_upsert_updates_existing_actors(self, unreal_client):
         """Subsequent runs should update, not duplicate"""
         code = """
 import unreal
@@ -85,7 +88,7 @@ for row in range(3):
             current_loc = actor.get_actor_location()
             new_z = current_loc.z + 100
             actor.set_actor_location(
-                unreal.Vector(col * 200, row * 200, new_z)
+                unreal.Vector(col * 200, row * 200, new_z), False, False
             )
             updated += 1
 
@@ -98,9 +101,9 @@ final_upsert_actors = [a for a in all_actors if a.get_actor_label().startswith("
 assert len(final_upsert_actors) == initial_count
 print(f"✓ Actor count unchanged: {len(final_upsert_actors)}")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_upsert_position_persistence(self):
+    def test_upsert_position_persistence(self, unreal_client):
         """Actor positions should persist and update across runs"""
         code = """
 import unreal
@@ -123,47 +126,51 @@ if upsert_actors:
     print(f"✓ Actor Z position: {z} (shows persistence)")
     assert z >= 50
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
 
 
 class TestUpsertRegistry:
     """Tests for ActorRegistry upsert implementation"""
     
-    def test_registry_update_or_create(self):
+    def test_registry_update_or_create(self, unreal_client):
         """Test ActorRegistry.update_or_create method"""
         code = """
+import unreal
 from unreallib.utils import ActorRegistry
-from unreallib import actors
+from unreallib import actors, level
 
 registry = ActorRegistry()
+actor_id = "test_actor_1"
+
+# Remove the actor left by an earlier run, so the first call creates
+if registry.exists(actor_id):
+    level.destroy_actors([registry.get(actor_id)])
+    registry.clear()
 
 # First call should create
-actor_id = "test_actor_1"
-actor1 = registry.update_or_create(
+actor1, created = registry.update_or_create(
     actor_id=actor_id,
-    create_func=lambda: actors.spawn_cube(location=(0, 0, 50)),
-    update_func=lambda a: a.set_actor_location(unreal.Vector(0, 0, 150))
+    create_fn=lambda: actors.spawn_cube(location=(0, 0, 50)),
+    update_fn=lambda a: a.set_actor_location(unreal.Vector(0, 0, 150), False, False)
 )
 
 assert actor1 is not None
+assert created
 initial_z = actor1.get_actor_location().z
 print(f"✓ Created actor at Z={initial_z}")
 
 # Second call should update
-actor2 = registry.update_or_create(
+actor2, created = registry.update_or_create(
     actor_id=actor_id,
-    create_func=lambda: actors.spawn_cube(location=(0, 0, 50)),
-    update_func=lambda a: a.set_actor_location(unreal.Vector(0, 0, 250))
+    create_fn=lambda: actors.spawn_cube(location=(0, 0, 50)),
+    update_fn=lambda a: a.set_actor_location(unreal.Vector(0, 0, 250), False, False)
 )
 
 assert actor2 is not None
+assert not created
 assert actor2 == actor1  # Should be same actor instance
 final_z = actor2.get_actor_location().z
 assert final_z == 250
 print(f"✓ Updated same actor to Z={final_z}")
 """
-        assert True  # Placeholder
-
-
-# Note: These are placeholder tests demonstrating structure.
-# Real integration tests would use remotecontrol to execute in Unreal.
+        assert unreal_client.execute(code, method='upyrc')
@@ -2,9 +2,10 @@
 Integration tests for workflow execution in Unreal
 
 Tests complete workflow DAGs with real actor spawning and manipulation.
-Requires Unreal Engine running with a level open.
+Requires Unreal Engine running with a level open and upyrc installed;
+without a reachable editor the tests are skipped.
 
-Run with: pytest tests/test_integration_workflow.py -v
+Run with: INTEGRATION=1 pytest tests/test_integration_workflow.py -m integration -v
 """
 
 import pytest
@@ -14,11 +15,13 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+pytestmark = pytest.mark.integration
+
 
 class TestWorkflowExecution:
     """Tests for workflow execution in Unreal"""
     
-    def test_simple_sequence_workflow(self):
+    def test_simple_sequence_workflow(self, unreal_client):
         """Test sequential task execution"""
         code = """
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor
@@ -28,9 +31,9 @@ from unreallib.tasks import ClearLevelTask, SpawnGridTask
 workflow = WorkflowGraph()
 
 # Add tasks in sequence
-clear = ClearLevelTask(task_id="clear")
+clear = ClearLevelTask("clear")
 spawn = SpawnGridTask(
-    task_id="spawn_grid",
+    "spawn_grid",
     rows=3,
     cols=3,
     spacing=200.0,
@@ -38,11 +41,11 @@ spawn = SpawnGridTask(
 )
 
 workflow.add_task(clear)
-workflow.add_task(spawn, dependencies=["clear"])
+workflow.add_task(spawn, depends_on=["clear"])
 
 # Execute
-executor = WorkflowExecutor()
-results = executor.execute(workflow)
+executor = WorkflowExecutor(workflow)
+results = executor.execute()
 
 # Verify
 assert len(results) == 2
@@ -50,9 +53,9 @@ assert results["clear"].success
 assert results["spawn_grid"].success
 print(f"✓ Sequential workflow executed: {len(results)} tasks")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_dag_workflow_with_dependencies(self):
+    def test_dag_workflow_with_dependencies(self, unreal_client):
         """Test DAG execution with task dependencies"""
         code = """
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor
@@ -61,26 +64,28 @@ from unreallib.tasks import ClearLevelTask, SpawnGridTask, SpawnCircleTask
 # Build DAG
 workflow = WorkflowGraph()
 
-clear = ClearLevelTask(task_id="clear")
-grid = SpawnGridTask(task_id="grid", rows=2, cols=2)
-circle = SpawnCircleTask(task_id="circle", count=8, radius=400)
+clear = ClearLevelTask("clear")
+grid = SpawnGridTask("grid", rows=2, cols=2)
+circle = SpawnCircleTask("circle", count=8, radius=400)
 
 workflow.add_task(clear)
-workflow.add_task(grid, dependencies=["clear"])
-workflow.add_task(circle, dependencies=["clear"])
+workflow.add_task(grid, depends_on=["clear"])
+workflow.add_task(circle, depends_on=["clear"])
 
 # Grid and circle can run in parallel after clear
 # Execute
-executor = WorkflowExecutor()
-results = executor.execute(workflow)
+executor = WorkflowExecutor(workflow)
+results = executor.execute()
 
 assert len(results) == 3
 assert all(r.success for r in results.values())
+assert results["clear"].layer == 0
+assert results["grid"].layer == results["circle"].layer == 1
 print("✓ DAG workflow executed with parallel tasks")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_workflow_with_config(self):
+    def test_workflow_with_config(self, unreal_client):
         """Test workflow execution with different configs"""
         code = """
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor, WorkflowConfig
@@ -88,7 +93,7 @@ from unreallib.tasks import SpawnGridTask
 
 # Build workflow
 workflow = WorkflowGraph()
-spawn = SpawnGridTask(task_id="spawn", rows=3, cols=3)
+spawn = SpawnGridTask("spawn", rows=3, cols=3)
 workflow.add_task(spawn)
 
 # Test with clean_slate config (should clear first)
@@ -97,8 +102,8 @@ config_clean = WorkflowConfig(
     save_level_after=False
 )
 
-executor = WorkflowExecutor(config=config_clean)
-results = executor.execute(workflow)
+executor = WorkflowExecutor(workflow, config_clean)
+results = executor.execute()
 
 assert results["spawn"].success
 print("✓ Workflow with clean_slate config executed")
@@ -109,77 +114,68 @@ config_incremental = WorkflowConfig(
     save_level_after=False
 )
 
-executor2 = WorkflowExecutor(config=config_incremental)
-results2 = executor2.execute(workflow)
+executor2 = WorkflowExecutor(workflow, config_incremental)
+results2 = executor2.execute()
 
 assert results2["spawn"].success
 print("✓ Workflow with incremental config executed")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
 
 
 class TestWorkflowUpsert:
     """Tests for workflow upsert functionality"""
     
-    def test_workflow_upsert_mode(self):
+    def test_workflow_upsert_mode(self, unreal_client):
         """Test workflow with upsert_mode enabled"""
         code = """
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor, WorkflowConfig
 from unreallib.tasks import SpawnGridTask
+from unreallib import level
 
 # Build workflow with upsert
 workflow = WorkflowGraph()
-spawn = SpawnGridTask(
-    task_id="spawn",
-    rows=3,
-    cols=3,
-    label_prefix="workflow_upsert"
-)
+spawn = SpawnGridTask("spawn", rows=3, cols=3)
 workflow.add_task(spawn)
 
 # Execute with upsert mode
 config = WorkflowConfig(
     clear_before_execute=False,
-    upsert_mode=True
+    upsert_mode=True,
+    actor_id_prefix="workflow_upsert_"
 )
 
-executor = WorkflowExecutor(config=config)
+executor = WorkflowExecutor(workflow, config)
 
 # First execution - creates actors
-results1 = executor.execute(workflow)
+results1 = executor.execute()
 assert results1["spawn"].success
+count_after_first = level.get_actor_count()
 
 # Second execution - updates actors
-results2 = executor.execute(workflow)
+results2 = executor.execute()
 assert results2["spawn"].success
 
 # Should still have same actor count (updated, not duplicated)
-from unreallib import level
 count = level.get_actor_count()
+assert count == count_after_first
 print(f"✓ Upsert mode: actor count stable at {count}")
 """
-        assert True  # Placeholder
+        assert unreal_client.execute(code, method='upyrc')
     
-    def test_workflow_create_mode(self):
+    def test_workflow_create_mode(self, unreal_client):
         """Test workflow with upsert_mode disabled (always create)"""
         code = """
 from unreallib.workflow import WorkflowGraph, WorkflowExecutor, WorkflowConfig
 from unreallib.tasks import SpawnGridTask
 from unreallib import level
-import time
 
 # Clear first
 level.clear_all_actors()
 
 # Build workflow
 workflow = WorkflowGraph()
-run_id = int(time.time() % 10000)
-spawn = SpawnGridTask(
-    task_id="spawn",
-    rows=2,
-    cols=2,
-    label_prefix=f"workflow_create_{run_id}"
-)
+spawn = SpawnGridTask("spawn", rows=2, cols=2)
 workflow.add_task(spawn)
 
 # Execute with create mode (no upsert)
@@ -188,19 +184,16 @@ config = WorkflowConfig(
     upsert_mode=False
 )
 
-executor = WorkflowExecutor(config=config)
+executor = WorkflowExecutor(workflow, config)
 
 # First execution
 initial_count = level.get_actor_count()
-results1 = executor.execute(workflow)
+results1 = executor.execute()
+assert results1["spawn"].success
 
 # Should have added actors
 count_after_first = level.get_actor_count()
 assert count_after_first > initial_count
 print(f"✓ Create mode: added {count_after_first - initial_count} actors")
 """
-        assert True  # Placeholder
-
-
-# Note: These are placeholder tests demonstrating structure.
-# Real integration tests would execute via remotecontrol in Unreal.
+        assert unreal_client.execute(code, method='upyrc')
@@ -2,19 +2,74 @@
 Tests for Lighting System - LightsGeneratorTask and ForEachLightTask
 """
 
-import sys
-from unittest.mock import Mock, MagicMock, patch
-
-# Mock unreal module before imports
-sys.modules['unreal'] = MagicMock()
+from types import MappingProxyType
 
 import pytest
 from unreallib.tasks.generators import LightsGeneratorTask, ForEachLightTask
 from unreallib.workflow.task import TaskStatus
 
 
-class TestLightsGeneratorTask:
-    """Test LightsGeneratorTask - JSON light configuration parsing and validation"""
+# Shared, read-only test inputs. Neither task mutates its lights, so
+# tests pass these straight in instead of rebuilding the literals.
+
+# Key, fill and rim, as a workflow JSON file would give them
+_THREE_POINT_LIGHTS = (
+    MappingProxyType({
+        'actor_id': 'key_light',
+        'light_type': 'point',
+        'location': [400, 300, 400],
+        'intensity': 12000.0,
+        'color': [1.0, 0.9, 0.8]
+    }),
+    MappingProxyType({
+        'actor_id': 'fill_light',
+        'light_type': 'point',
+        'location': [-300, -200, 300],
+        'intensity': 6000.0,
+        'color': [0.6, 0.7, 1.0]
+    }),
+    MappingProxyType({
+        'actor_id': 'rim_light',
+        'light_type': 'spot',
+        'location': [-200, 400, 200],
+        'rotation': [0, -135, 0],
+        'intensity': 10000.0,
+        'inner_cone_angle': 20.0,
+        'outer_cone_angle': 40.0
+    }),
+)
+
+# One light of each type, fully resolved as the generator outputs them
+_RESOLVED_LIGHTS = (
+    MappingProxyType({'light_type': 'point', 'location': (0, 0, 300), 'rotation': (0, 0, 0),
+                      'intensity': 5000.0, 'color': (1.0, 1.0, 1.0), 'actor_id': 'light_0'}),
+    MappingProxyType({'light_type': 'spot', 'location': (100, 0, 400), 'rotation': (-45, 0, 0),
+                      'intensity': 8000.0, 'color': (1.0, 0.9, 0.8), 'actor_id': 'light_1'}),
+    MappingProxyType({'light_type': 'directional', 'location': (0, 0, 0), 'rotation': (-45, 135, 0),
+                      'intensity': 3.0, 'color': (1.0, 0.95, 0.85), 'actor_id': 'light_2'}),
+)
+
+
+@pytest.fixture(scope="module")
+def generate_lights():
+    """
+    Run LightsGeneratorTask once per light spec and share the result
+    
+    Call with a key naming the spec and the lights list; later calls with
+    the same key return the first result. Treat the result as read-only.
+    """
+    cache = {}
+    
+    def run(key, lights):
+        if key not in cache:
+            cache[key] = LightsGeneratorTask('gen', lights=lights).execute({})
+        return cache[key]
+    
+    return run
+
+
+class TestGeneratorOutput:
+    """Test LightsGeneratorTask - building light configurations from JSON"""
     
     def test_generator_creation(self):
         """Test creating a lights generator task"""
@@ -45,76 +100,40 @@ class TestLightsGeneratorTask:
     
     def test_generator_with_multiple_lights(self):
         """Test generating multiple light configurations"""
-        lights = [
-            {'light_type': 'point', 'location': [0, 0, 300]},
-            {'light_type': 'spot', 'location': [100, 0, 400]},
-            {'light_type': 'directional', 'location': [0, 0, 0]}
-        ]
-        
-        task = LightsGeneratorTask('gen', lights=lights)
+        task = LightsGeneratorTask('gen', lights=_RESOLVED_LIGHTS)
         result = task.execute({})
         
         assert result.status == TaskStatus.SUCCESS
-        assert len(result.output['lights']) == 3
+        assert [light['light_type'] for light in result.output['lights']] == \
+            ['point', 'spot', 'directional']
         assert result.output['count'] == 3
+
+
+class TestGeneratorDefaults:
+    """Test LightsGeneratorTask - default and optional light properties"""
     
-    def test_generator_applies_defaults(self):
-        """Test that generator applies default values"""
-        lights = [
-            {'light_type': 'point', 'location': [0, 0, 300]}
-        ]
-        
-        task = LightsGeneratorTask(
-            'gen',
-            lights=lights,
-            default_intensity=8000.0,
-            default_color=(1.0, 0.9, 0.8),
-            default_rotation=(-45, 0, 0)
-        )
-        result = task.execute({})
-        
-        light = result.output['lights'][0]
-        assert light['intensity'] == 8000.0
-        assert light['color'] == (1.0, 0.9, 0.8)
-        assert light['rotation'] == (-45, 0, 0)
-    
-    def test_generator_light_overrides_defaults(self):
-        """Test that light-specific values override defaults"""
-        lights = [
-            {
-                'light_type': 'point',
-                'location': [0, 0, 300],
-                'intensity': 12000.0,
-                'color': [1.0, 0.0, 0.0]
-            }
-        ]
-        
-        task = LightsGeneratorTask(
-            'gen',
-            lights=lights,
-            default_intensity=5000.0,
-            default_color=(1.0, 1.0, 1.0)
-        )
-        result = task.execute({})
-        
-        light = result.output['lights'][0]
-        assert light['intensity'] == 12000.0
-        assert light['color'] == (1.0, 0.0, 0.0)
-    
-    def test_generator_custom_actor_id(self):
-        """Test that custom actor_id is preserved"""
-        lights = [
-            {
-                'light_type': 'point',
-                'location': [0, 0, 300],
-                'actor_id': 'key_light'
-            }
-        ]
-        
-        task = LightsGeneratorTask('gen', lights=lights)
+    @pytest.mark.parametrize("light,defaults,expected", [
+        # Defaults fill in what the light leaves out
+        ({'light_type': 'point', 'location': [0, 0, 300]},
+         {'default_intensity': 8000.0, 'default_color': (1.0, 0.9, 0.8), 'default_rotation': (-45, 0, 0)},
+         {'intensity': 8000.0, 'color': (1.0, 0.9, 0.8), 'rotation': (-45, 0, 0), 'actor_id': 'light_0'}),
+        # Light-specific values override defaults
+        ({'light_type': 'point', 'location': [0, 0, 300], 'intensity': 12000.0, 'color': [1.0, 0.0, 0.0]},
+         {'default_intensity': 5000.0, 'default_color': (1.0, 1.0, 1.0)},
+         {'intensity': 12000.0, 'color': (1.0, 0.0, 0.0)}),
+        # A custom actor_id is preserved
+        ({'light_type': 'point', 'location': [0, 0, 300], 'actor_id': 'key_light'},
+         {},
+         {'actor_id': 'key_light'}),
+    ], ids=["defaults", "overrides", "custom_actor_id"])
+    def test_generator_resolves_values(self, light, defaults, expected):
+        """Test how light values combine with the generator defaults"""
+        task = LightsGeneratorTask('gen', lights=[light], **defaults)
         result = task.execute({})
         
-        assert result.output['lights'][0]['actor_id'] == 'key_light'
+        resolved = result.output['lights'][0]
+        for key, value in expected.items():
+            assert resolved[key] == value
     
     def test_generator_optional_properties(self):
         """Test that optional properties are included"""
@@ -137,53 +156,28 @@ class TestLightsGeneratorTask:
         assert light['cast_shadows'] is True
         assert light['inner_cone_angle'] == 20.0
         assert light['outer_cone_angle'] == 45.0
+
+
+class TestGeneratorValidation:
+    """Test LightsGeneratorTask - rejecting invalid light configurations"""
     
-    def test_generator_fails_without_lights(self):
-        """Test that generator fails when no lights provided"""
-        task = LightsGeneratorTask('gen', lights=[])
-        result = task.execute({})
-        
-        assert result.status == TaskStatus.FAILURE
-        assert 'error' in result.output
-    
-    def test_generator_fails_missing_light_type(self):
-        """Test that generator fails when light_type is missing"""
-        lights = [
-            {'location': [0, 0, 300]}  # Missing light_type
-        ]
-        
-        task = LightsGeneratorTask('gen', lights=lights)
-        result = task.execute({})
-        
-        assert result.status == TaskStatus.FAILURE
-        assert 'light_type' in result.output['error']
-    
-    def test_generator_fails_missing_location(self):
-        """Test that generator fails when location is missing"""
-        lights = [
-            {'light_type': 'point'}  # Missing location
-        ]
-        
-        task = LightsGeneratorTask('gen', lights=lights)
-        result = task.execute({})
-        
-        assert result.status == TaskStatus.FAILURE
-        assert 'location' in result.output['error']
-    
-    def test_generator_fails_invalid_light_type(self):
-        """Test that generator fails with invalid light type"""
-        lights = [
-            {
-                'light_type': 'invalid_type',
-                'location': [0, 0, 300]
-            }
-        ]
-        
+    @pytest.mark.parametrize("lights,err", [
+        ([], "No lights"),
+        ([{'location': [0, 0, 300]}], "light_type"),
+        ([{'light_type': 'point'}], "location"),
+        ([{'light_type': 'invalid_type', 'location': [0, 0, 300]}], "invalid light_type"),
+    ], ids=["no_lights", "missing_light_type", "missing_location", "invalid_light_type"])
+    def test_generator_validation_failures(self, lights, err):
+        """Test that generator fails on missing or invalid light configurations"""
         task = LightsGeneratorTask('gen', lights=lights)
         result = task.execute({})
         
-        assert result.status == TaskStatus.FAILURE
-        assert 'invalid light_type' in result.output['error']
+        assert result.status == TaskStatus.FAILED
+        assert err in result.output['error']
+
+
+class TestGeneratorTypeCoercion:
+    """Test LightsGeneratorTask - normalising JSON values"""
     
     def test_generator_converts_lists_to_tuples(self):
         """Test that lists are converted to tuples"""
@@ -203,6 +197,10 @@ class TestLightsGeneratorTask:
         assert isinstance(light['location'], tuple)
         assert isinstance(light['rotation'], tuple)
         assert isinstance(light['color'], tuple)
+
+
+class TestGeneratorSchema:
+    """Test LightsGeneratorTask - JSON schema"""
     
     def test_get_schema(self):
         """Test that JSON schema is available"""
@@ -211,33 +209,18 @@ class TestLightsGeneratorTask:
         assert 'type' in schema
         assert 'properties' in schema
         assert 'lights' in schema['properties']
+    
+    def test_get_schema_is_built_once(self):
+        """Test that repeated calls share one schema dictionary"""
+        assert LightsGeneratorTask.get_schema() is LightsGeneratorTask.get_schema()
 
 
-class TestForEachLightTask:
-    """Test ForEachLightTask - Creates lights from generator output"""
+class TestForEachCreation:
+    """Test ForEachLightTask - creating lights from generator output"""
     
-    @patch('unreallib.tasks.generators.for_each_light_task.CreateLightTask')
-    def test_foreach_creates_single_light(self, mock_create_task_class):
+    def test_foreach_creates_single_light(self, fake_create_light_task):
         """Test creating a single light"""
-        # Setup mock
-        mock_task_instance = Mock()
-        mock_result = Mock()
-        mock_result.status = TaskStatus.SUCCESS
-        mock_result.output = {'action': 'created', 'light_type': 'point'}
-        mock_task_instance.execute.return_value = mock_result
-        mock_create_task_class.return_value = mock_task_instance
-        
-        # Create task
-        lights = [
-            {
-                'light_type': 'point',
-                'location': (0, 0, 300),
-                'rotation': (0, 0, 0),
-                'intensity': 5000.0,
-                'color': (1.0, 1.0, 1.0),
-                'actor_id': 'light_0'
-            }
-        ]
+        lights = _RESOLVED_LIGHTS[:1]
         
         context = {'test_lights': lights}
         task = ForEachLightTask('foreach', lights_input='test_lights')
@@ -248,71 +231,34 @@ class TestForEachLightTask:
         assert result.output['failed'] == 0
         assert len(result.output['created_lights']) == 1
     
-    @patch('unreallib.tasks.generators.for_each_light_task.CreateLightTask')
-    def test_foreach_creates_multiple_lights(self, mock_create_task_class):
-        """Test creating multiple lights"""
-        # Setup mock
-        mock_task_instance = Mock()
-        mock_result = Mock()
-        mock_result.status = TaskStatus.SUCCESS
-        mock_result.output = {'action': 'created'}
-        mock_task_instance.execute.return_value = mock_result
-        mock_create_task_class.return_value = mock_task_instance
-        
-        # Create task with multiple lights
-        lights = [
-            {'light_type': 'point', 'location': (0, 0, 300), 'rotation': (0, 0, 0),
-             'intensity': 5000.0, 'color': (1.0, 1.0, 1.0), 'actor_id': 'light_0'},
-            {'light_type': 'spot', 'location': (100, 0, 400), 'rotation': (-45, 0, 0),
-             'intensity': 8000.0, 'color': (1.0, 0.9, 0.8), 'actor_id': 'light_1'},
-            {'light_type': 'directional', 'location': (0, 0, 0), 'rotation': (-45, 135, 0),
-             'intensity': 3.0, 'color': (1.0, 0.95, 0.85), 'actor_id': 'light_2'}
-        ]
-        
-        context = {'test_lights': lights}
-        task = ForEachLightTask('foreach', lights_input='test_lights')
+    @pytest.mark.parametrize("source", ["resolved", "full_pipeline"])
+    def test_foreach_creates_multiple_lights(self, source, generate_lights, fake_create_light_task):
+        """Test creating multiple lights, from ready configs or a generator's output"""
+        if source == "full_pipeline":
+            # Generate lights, then create them from the generated configs
+            gen_result = generate_lights('three_point', _THREE_POINT_LIGHTS)
+            assert gen_result.status == TaskStatus.SUCCESS
+            context = {'gen': gen_result.output}
+            lights_input = 'gen.lights'
+        else:
+            context = {'test_lights': _RESOLVED_LIGHTS}
+            lights_input = 'test_lights'
+        
+        task = ForEachLightTask('foreach', lights_input=lights_input)
         result = task.execute(context)
         
         assert result.status == TaskStatus.SUCCESS
         assert result.output['successful'] == 3
         assert result.output['failed'] == 0
-        assert mock_create_task_class.call_count == 3
+        assert len(fake_create_light_task.instances) == 3
     
-    @patch('unreallib.tasks.generators.for_each_light_task.CreateLightTask')
-    def test_foreach_handles_partial_failure(self, mock_create_task_class):
+    def test_foreach_handles_partial_failure(self, fake_create_light_task):
         """Test handling when some lights fail to create"""
-        # Setup mock to fail on second light
-        call_count = [0]
-        
-        def side_effect(*args, **kwargs):
-            call_count[0] += 1
-            mock_instance = Mock()
-            if call_count[0] == 2:
-                # Second light fails
-                mock_result = Mock()
-                mock_result.status = TaskStatus.FAILURE
-                mock_result.output = {'error': 'Failed to create'}
-                mock_instance.execute.return_value = mock_result
-            else:
-                # Other lights succeed
-                mock_result = Mock()
-                mock_result.status = TaskStatus.SUCCESS
-                mock_result.output = {'action': 'created'}
-                mock_instance.execute.return_value = mock_result
-            return mock_instance
-        
-        mock_create_task_class.side_effect = side_effect
-        
-        lights = [
-            {'light_type': 'point', 'location': (0, 0, 300), 'rotation': (0, 0, 0),
-             'intensity': 5000.0, 'color': (1.0, 1.0, 1.0), 'actor_id': 'light_0'},
-            {'light_type': 'spot', 'location': (100, 0, 400), 'rotation': (-45, 0, 0),
-             'intensity': 8000.0, 'color': (1.0, 0.9, 0.8), 'actor_id': 'light_1'},
-            {'light_type': 'point', 'location': (200, 0, 300), 'rotation': (0, 0, 0),
-             'intensity': 5000.0, 'color': (1.0, 1.0, 1.0), 'actor_id': 'light_2'}
-        ]
+        # Second light fails
+        fake = fake_create_light_task
+        fake.results = iter([fake.CREATED, fake.FAILED, fake.CREATED])
         
-        context = {'test_lights': lights}
+        context = {'test_lights': _RESOLVED_LIGHTS}
         task = ForEachLightTask('foreach', lights_input='test_lights')
         result = task.execute(context)
         
@@ -320,6 +266,10 @@ class TestForEachLightTask:
         assert result.output['successful'] == 2
         assert result.output['failed'] == 1
         assert len(result.output['failed_lights']) == 1
+
+
+class TestForEachFailures:
+    """Test ForEachLightTask - missing or malformed lights input"""
     
     def test_foreach_fails_no_lights_found(self):
         """Test that task fails when lights input is not found"""
@@ -327,7 +277,7 @@ class TestForEachLightTask:
         task = ForEachLightTask('foreach', lights_input='missing_lights')
         result = task.execute(context)
         
-        assert result.status == TaskStatus.FAILURE
+        assert result.status == TaskStatus.FAILED
         assert 'No lights found' in result.output['error']
     
     def test_foreach_fails_invalid_lights_type(self):
@@ -336,121 +286,39 @@ class TestForEachLightTask:
         task = ForEachLightTask('foreach', lights_input='test_lights')
         result = task.execute(context)
         
-        assert result.status == TaskStatus.FAILURE
+        assert result.status == TaskStatus.FAILED
         assert 'must be a list' in result.output['error']
+
+
+@pytest.fixture(scope="module")
+def foreach_task():
+    """One ForEachLightTask for the input resolution cases"""
+    return ForEachLightTask('foreach', lights_input='unused')
+
+
+class TestForEachResolution:
+    """Test ForEachLightTask - resolving the lights input from context"""
     
-    def test_foreach_resolves_dotted_reference(self):
-        """Test resolving dotted reference like 'task_name.lights'"""
-        lights = [
-            {'light_type': 'point', 'location': (0, 0, 300), 'rotation': (0, 0, 0),
-             'intensity': 5000.0, 'color': (1.0, 1.0, 1.0), 'actor_id': 'light_0'}
-        ]
-        
-        context = {
-            'gen_task': {
-                'lights': lights,
-                'count': 1
-            }
-        }
-        
-        task = ForEachLightTask('foreach', lights_input='gen_task.lights')
-        
-        # Test the resolve method directly
-        resolved = task._resolve_input(context, 'gen_task.lights')
-        assert resolved == lights
-    
-    def test_foreach_resolves_nested_reference(self):
-        """Test resolving nested reference"""
-        context = {
-            'task1': {
-                'output': {
-                    'lights': ['light1', 'light2']
-                }
-            }
-        }
-        
-        task = ForEachLightTask('foreach', lights_input='task1.output.lights')
-        resolved = task._resolve_input(context, 'task1.output.lights')
-        assert resolved == ['light1', 'light2']
+    @pytest.mark.parametrize("ref,context,expected", [
+        ('test_lights', {'test_lights': _RESOLVED_LIGHTS}, _RESOLVED_LIGHTS),
+        ('gen_task.lights', {'gen_task': {'lights': _RESOLVED_LIGHTS[:1], 'count': 1}}, _RESOLVED_LIGHTS[:1]),
+        ('task1.output.lights', {'task1': {'output': {'lights': ['light1', 'light2']}}}, ['light1', 'light2']),
+        ('missing_lights', {}, None),
+        ('gen_task.missing', {'gen_task': {'lights': []}}, None),
+        ('gen_task.lights.first', {'gen_task': {'lights': []}}, None),
+        (None, {'test_lights': _RESOLVED_LIGHTS}, None),
+    ], ids=["direct", "dotted", "nested", "missing", "missing_key", "not_a_dict", "no_ref"])
+    def test_foreach_resolves_input(self, foreach_task, ref, context, expected):
+        """Test resolving direct, dotted and nested references"""
+        assert foreach_task._resolve_input(context, ref) == expected
 
 
 class TestLightingSystemIntegration:
     """Integration tests for the complete lighting system"""
     
-    @patch('unreallib.tasks.generators.for_each_light_task.CreateLightTask')
-    def test_full_pipeline(self, mock_create_task_class):
-        """Test complete pipeline: generate -> create lights"""
-        # Setup mock
-        mock_task_instance = Mock()
-        mock_result = Mock()
-        mock_result.status = TaskStatus.SUCCESS
-        mock_result.output = {'action': 'created'}
-        mock_task_instance.execute.return_value = mock_result
-        mock_create_task_class.return_value = mock_task_instance
-        
-        # Step 1: Generate lights
-        light_configs = [
-            {
-                'actor_id': 'key_light',
-                'light_type': 'point',
-                'location': [400, 300, 400],
-                'intensity': 12000.0,
-                'color': [1.0, 0.9, 0.8]
-            },
-            {
-                'actor_id': 'fill_light',
-                'light_type': 'point',
-                'location': [-300, -200, 300],
-                'intensity': 6000.0,
-                'color': [0.6, 0.7, 1.0]
-            }
-        ]
-        
-        gen_task = LightsGeneratorTask('gen', lights=light_configs)
-        gen_result = gen_task.execute({})
-        
-        assert gen_result.status == TaskStatus.SUCCESS
-        assert len(gen_result.output['lights']) == 2
-        
-        # Step 2: Create lights from generated configs
-        context = {'gen': gen_result.output}
-        create_task = ForEachLightTask('create', lights_input='gen.lights')
-        create_result = create_task.execute(context)
-        
-        assert create_result.status == TaskStatus.SUCCESS
-        assert create_result.output['successful'] == 2
-        assert create_result.output['failed'] == 0
-    
-    def test_three_point_lighting_config(self):
+    def test_three_point_lighting_config(self, generate_lights):
         """Test a realistic three-point lighting configuration"""
-        lights = [
-            {
-                'actor_id': 'key_light',
-                'light_type': 'point',
-                'location': [400, 300, 400],
-                'intensity': 12000.0,
-                'color': [1.0, 0.9, 0.8]
-            },
-            {
-                'actor_id': 'fill_light',
-                'light_type': 'point',
-                'location': [-300, -200, 300],
-                'intensity': 6000.0,
-                'color': [0.6, 0.7, 1.0]
-            },
-            {
-                'actor_id': 'rim_light',
-                'light_type': 'spot',
-                'location': [-200, 400, 200],
-                'rotation': [0, -135, 0],
-                'intensity': 10000.0,
-                'inner_cone_angle': 20.0,
-                'outer_cone_angle': 40.0
-            }
-        ]
-        
-        task = LightsGeneratorTask('gen', lights=lights)
-        result = task.execute({})
+        result = generate_lights('three_point', _THREE_POINT_LIGHTS)
         
         assert result.status == TaskStatus.SUCCESS
         assert result.output['count'] == 3
@@ -0,0 +1,116 @@
+"""
+Tests for remote control project setup helpers
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from remotecontrol.setup import _remove_sections, _MANAGED_SECTIONS
+
+
+def test_remove_managed_sections():
+    """Test that only the managed INI sections are dropped"""
+    text = (
+        "; header comment\n"
+        "[/Script/EngineSettings.GameMapsSettings]\n"
+        "GameDefaultMap=/Game/Main\n"
+        "\n"
+        "[/Script/PythonScriptPlugin.PythonScriptPluginSettings]\n"
+        "bRemoteExecution=True\n"
+        "[/Script/WebRemoteControl.WebRemoteControlSettings]\n"
+        "bServerStartByDefault=True\n"
+        "[/Script/Engine.RendererSettings]\n"
+        "r.Lumen=1\n"
+    )
+    
+    result = _remove_sections(text, _MANAGED_SECTIONS)
+    
+    assert result == (
+        "; header comment\n"
+        "[/Script/EngineSettings.GameMapsSettings]\n"
+        "GameDefaultMap=/Game/Main\n"
+        "\n"
+        "[/Script/Engine.RendererSettings]\n"
+        "r.Lumen=1\n"
+    )
+
+
+def test_remove_sections_without_headers():
+    """Test that text without sections is returned unchanged"""
+    assert _remove_sections("", _MANAGED_SECTIONS) == ""
+    assert _remove_sections("key=value\n", _MANAGED_SECTIONS) == "key=value\n"
+
+
+def test_most_recent_uproject(tmp_path):
+    """Test finding the newest .uproject in a nested tree"""
+    import os
+    from remotecontrol.setup import _most_recent_uproject
+    
+    old = tmp_path / "Old" / "Old.uproject"
+    new = tmp_path / "Nested" / "New" / "New.uproject"
+    for path, mtime in ((old, 1000), (new, 2000)):
+        path.parent.mkdir(parents=True)
+        path.write_text("{}")
+        os.utime(path, (mtime, mtime))
+    (tmp_path / "Nested" / "notes.txt").write_text("")
+    
+    # Generated folders are skipped even if they hold a newer match
+    stale = tmp_path / "Old" / "Saved" / "Autosave.uproject"
+    stale.parent.mkdir()
+    stale.write_text("{}")
+    os.utime(stale, (3000, 3000))
+    
+    assert _most_recent_uproject(tmp_path) == new
+    assert _most_recent_uproject(tmp_path / "Nested" / "New" / "Missing") is None
+
+
+def test_setup_uproject_skips_write_when_unchanged(tmp_path):
+    """Test that a fully configured .uproject isn't rewritten or backed up"""
+    import json
+    from remotecontrol.setup import _setup_uproject
+    
+    project = tmp_path / "Demo.uproject"
+    original = json.dumps({"Plugins": [{"Name": "RemoteControl", "Enabled": False}]})
+    project.write_text(original)
+    
+    assert _setup_uproject(project, backup=True) is True
+    data = json.loads(project.read_text())
+    assert all(p["Enabled"] for p in data["Plugins"])
+    assert len(data["Plugins"]) == 4
+    
+    backup = tmp_path / "Demo.uproject.backup"
+    assert backup.read_text() == original
+    backup.unlink()
+    written = project.read_text()
+    
+    assert _setup_uproject(project, backup=True) is True
+    assert project.read_text() == written
+    assert not backup.exists()
+
+
+def test_write_if_changed(tmp_path):
+    """Test that unchanged files are neither rewritten nor backed up"""
+    from remotecontrol.setup import _write_if_changed
+    
+    target = tmp_path / "init_unreal.py"
+    backup = tmp_path / "init_unreal.py.backup"
+    
+    assert _write_if_changed(target, "a\n", True) is True
+    assert not backup.exists()
+    assert _write_if_changed(target, "a\n", True) is False
+    assert not backup.exists()
+    assert _write_if_changed(target, "b\n", True) is True
+    assert backup.read_text() == "a\n"
+    assert target.read_text() == "b\n"
+
+
+def test_backup_file_keeps_dotfile_name(tmp_path):
+    """Test that backups append .backup to the full file name"""
+    from remotecontrol.setup import _backup_file
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("PROJECT=demo\n")
+    
+    assert _backup_file(env_file) == tmp_path / ".env.backup"
+    assert (tmp_path / ".env.backup").read_text() == "PROJECT=demo\n"
@@ -85,6 +85,13 @@ class TestWorkflowConfig:
         assert config.upsert_mode is False  # default
         assert config.actor_id_prefix == 'workflow_'  # default
     
+    def test_from_dict_ignores_max_parallel(self):
+        """Test that a workflow file can't move editor tasks onto threads"""
+        config = WorkflowConfig.from_dict({'max_parallel': 8})
+        
+        assert config.max_parallel == 1
+        assert 'max_parallel' not in config.to_dict()
+    
     def test_repr(self):
         """Test string representation"""
         config = WorkflowConfig(clear_before_execute=True)
@@ -93,6 +100,21 @@ class TestWorkflowConfig:
         
         assert 'WorkflowConfig' in repr_str
         assert 'clear=True' in repr_str
+    
+    def test_config_is_immutable(self):
+        """Test that config fields cannot be reassigned"""
+        config = WorkflowConfig()
+        
+        with pytest.raises(AttributeError):
+            config.upsert_mode = True
+    
+    def test_config_is_hashable(self):
+        """Test that equal configs hash equally"""
+        a = WorkflowConfig(upsert_mode=True, metadata={'key': 'a'})
+        b = WorkflowConfig(upsert_mode=True, metadata={'key': 'b'})
+        
+        assert hash(a) == hash(b)
+        assert {a: 1}[WorkflowConfig(upsert_mode=True, metadata={'key': 'a'})] == 1
 
 
 class TestPresetConfigs:
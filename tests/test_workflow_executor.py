@@ -48,6 +48,16 @@ class FailingTask(Task):
         raise RuntimeError("Task failed intentionally")
 
 
+class PartialTask(Task):
+    """Task where only some of its items succeed"""
+    
+    def execute(self, context):
+        return TaskResult(
+            status=TaskStatus.PARTIAL_SUCCESS,
+            output={'created': 2, 'failed': 1}
+        )
+
+
 class TestWorkflowExecutor:
     """Tests for WorkflowExecutor"""
     
@@ -152,6 +162,21 @@ class TestWorkflowExecutor:
         assert results["task1"].status == TaskStatus.FAILED
         assert results["task2"].status == TaskStatus.SKIPPED
     
+    def test_partial_success_runs_downstream(self, capsys):
+        """Test that a partially successful task feeds its dependents"""
+        graph = WorkflowGraph()
+        graph.add_task(PartialTask("lights"))
+        graph.add_task(CounterTask("after"), depends_on=["lights"])
+        
+        executor = WorkflowExecutor(graph)
+        results = executor.execute()
+        
+        assert results["lights"].status == TaskStatus.PARTIAL_SUCCESS
+        assert results["lights"].success is False
+        assert results["after"].status == TaskStatus.SUCCESS
+        assert executor.get_task_output("lights") == {'created': 2, 'failed': 1}
+        assert "  Partial: 1\n" in capsys.readouterr().out
+    
     def test_parallel_execution_independent(self):
         """Test that parallel branches share context and accumulate state"""
         graph = WorkflowGraph()
@@ -172,6 +197,19 @@ class TestWorkflowExecutor:
         assert results["branch1"].output == 11
         assert results["branch2"].output == 31
     
+    def test_results_record_layer(self):
+        """Test that each result records the topological layer it ran in"""
+        graph = WorkflowGraph()
+        graph.add_task(CounterTask("clear"))
+        graph.add_task(CounterTask("grid"), depends_on=["clear"])
+        graph.add_task(CounterTask("circle"), depends_on=["clear"])
+        
+        executor = WorkflowExecutor(graph)
+        results = executor.execute()
+        
+        assert results["clear"].layer == 0
+        assert results["grid"].layer == results["circle"].layer == 1
+    
     def test_config_in_context(self):
         """Test that config is added to context"""
         graph = WorkflowGraph()
@@ -228,3 +266,55 @@ class TestWorkflowExecutorConfig:
         
         # Just verify config is set - actual saving requires Unreal
         assert executor.config.save_level_after is True
+
+
+class TestParallelExecution:
+    """Tests for ready-set scheduling with max_parallel > 1"""
+    
+    def test_independent_tasks_run_concurrently(self):
+        """Independent roots should all be in flight at the same time"""
+        import threading
+        
+        barrier = threading.Barrier(3, timeout=5)
+        
+        class BarrierTask(Task):
+            def execute(self, context):
+                barrier.wait()
+                return TaskResult(status=TaskStatus.SUCCESS, output=self.name)
+        
+        graph = WorkflowGraph()
+        graph.add_tasks([BarrierTask(f"t{i}") for i in range(3)])
+        
+        executor = WorkflowExecutor(graph, WorkflowConfig(max_parallel=3))
+        results = executor.execute()
+        
+        assert all(r.success for r in results.values())
+        assert len(results) == 3
+    
+    def test_skipped_results_record_layer(self):
+        """Skipped tasks still report their layer"""
+        graph = WorkflowGraph()
+        graph.add_task(FailingTask("bad"))
+        graph.add_task(CounterTask("blocked"), depends_on=["bad"])
+        
+        executor = WorkflowExecutor(graph, WorkflowConfig(max_parallel=2))
+        results = executor.execute()
+        
+        assert results["bad"].layer == 0
+        assert results["blocked"].status == TaskStatus.SKIPPED
+        assert results["blocked"].layer == 1
+    
+    def test_dependencies_respected(self):
+        """Dependents run after their dependencies, failures still skip"""
+        graph = WorkflowGraph()
+        graph.add_task(CounterTask("root", increment=1))
+        graph.add_task(FailingTask("bad"))
+        graph.add_task(CounterTask("child", increment=10), depends_on=["root"])
+        graph.add_task(CounterTask("blocked"), depends_on=["bad", "child"])
+        
+        executor = WorkflowExecutor(graph, WorkflowConfig(max_parallel=4))
+        results = executor.execute()
+        
+        assert results["child"].output == 11
+        assert results["bad"].status == TaskStatus.FAILED
+        assert results["blocked"].status == TaskStatus.SKIPPED
@@ -70,6 +70,29 @@ class TestWorkflowGraph:
         with pytest.raises(ValueError, match="hasn't been added"):
             graph.add_task(task, depends_on=["nonexistent"])
     
+    def test_add_tasks_shared_dependencies(self):
+        """Test adding several tasks with the same dependencies at once"""
+        graph = WorkflowGraph()
+        graph.add_task(DummyTask("root"))
+        
+        graph.add_tasks([DummyTask("a"), DummyTask("b")], depends_on=["root"])
+        
+        assert len(graph) == 3
+        assert graph.dependencies["a"] == ["root"]
+        assert graph.dependencies["b"] == ["root"]
+        assert graph.get_execution_order()[0] == "root"
+    
+    def test_add_tasks_is_all_or_nothing(self):
+        """Test that a duplicate in the batch leaves the graph unchanged"""
+        graph = WorkflowGraph()
+        
+        with pytest.raises(ValueError, match="already exists"):
+            graph.add_tasks([DummyTask("a"), DummyTask("a")])
+        with pytest.raises(ValueError, match="hasn't been added"):
+            graph.add_tasks([DummyTask("b")], depends_on=["nonexistent"])
+        
+        assert len(graph) == 0
+    
     def test_execution_order_single_task(self):
         """Test execution order for single task"""
         graph = WorkflowGraph()
@@ -118,6 +141,34 @@ class TestWorkflowGraph:
         assert order[-1] == "bottom"
         assert set(order[1:3]) == {"left", "right"}
     
+    def test_execution_layers_diamond(self):
+        """Test grouping a diamond dependency into layers"""
+        graph = WorkflowGraph()
+        graph.add_task(DummyTask("root"))
+        graph.add_task(DummyTask("left"), depends_on=["root"])
+        graph.add_task(DummyTask("right"), depends_on=["root"])
+        graph.add_task(DummyTask("bottom"), depends_on=["left", "right"])
+        
+        layers = graph.get_execution_layers()
+        
+        assert layers[0] == ["root"]
+        assert set(layers[1]) == {"left", "right"}
+        assert layers[2] == ["bottom"]
+    
+    def test_execution_layers_uses_deepest_dependency(self):
+        """Test that a task waits for its deepest dependency's layer"""
+        graph = WorkflowGraph()
+        graph.add_task(DummyTask("a"))
+        graph.add_task(DummyTask("b"), depends_on=["a"])
+        graph.add_task(DummyTask("c"), depends_on=["a", "b"])
+        graph.add_task(DummyTask("solo"))
+        
+        layers = graph.get_execution_layers()
+        
+        assert set(layers[0]) == {"a", "solo"}
+        assert layers[1] == ["b"]
+        assert layers[2] == ["c"]
+    
     def test_circular_dependency_raises(self):
         """Test that circular dependency is detected"""
         graph = WorkflowGraph()
@@ -105,6 +105,93 @@ class TestWorkflowLoader:
         assert info['task_count'] == 2
         assert info['file'] == 'simple_grid.json'
     
+    def test_list_workflow_infos(self):
+        """Test listing metadata for all workflows"""
+        loader = WorkflowLoader()
+        infos = loader.list_workflow_infos()
+        
+        files = [info['file'] for info in infos]
+        assert files == loader.list_workflows()
+        assert 'simple_grid.json' in files
+    
+    def test_load_reuses_parsed_definition(self, tmp_path):
+        """Test that load() reuses the definition parsed for listing while unchanged"""
+        workflow_file = tmp_path / 'cached.json'
+        workflow_file.write_text(json.dumps({
+            "name": "Cached",
+            "tasks": [{"name": "clear", "type": "ClearLevelTask"}]
+        }))
+        
+        from unreallib.workflow.loader import _parse_workflow_file
+        loader = WorkflowLoader(tmp_path)
+        loader.list_workflow_infos()
+        hits = _parse_workflow_file.cache_info().hits
+        
+        workflow = loader.load('cached')
+        assert 'clear' in workflow.tasks
+        assert _parse_workflow_file.cache_info().hits == hits + 1
+    
+    def test_load_with_stdlib_json(self, monkeypatch):
+        """Test loading when orjson isn't installed"""
+        from unreallib.workflow import loader as loader_module
+        monkeypatch.setattr(loader_module, '_json_loads', json.loads)
+        loader_module._parse_workflow_file.cache_clear()
+        
+        workflow = WorkflowLoader().load('simple_grid')
+        assert len(workflow.tasks) == 2
+    
+    def test_parse_shared_until_file_changes(self, tmp_path):
+        """Test that loaders share a parse until the file is modified"""
+        import os
+        workflow_file = tmp_path / 'shared.json'
+        workflow_file.write_text(json.dumps({"name": "First", "tasks": []}))
+        
+        from unreallib.workflow.loader import _parse_workflow_file
+        first = WorkflowLoader(tmp_path).get_workflow_info('shared')
+        hits = _parse_workflow_file.cache_info().hits
+        WorkflowLoader(tmp_path).get_workflow_info('shared')
+        assert _parse_workflow_file.cache_info().hits == hits + 1
+        
+        workflow_file.write_text(json.dumps({"name": "Second", "tasks": []}))
+        stat = workflow_file.stat()
+        os.utime(workflow_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert first['name'] == 'First'
+        assert WorkflowLoader(tmp_path).get_workflow_info('shared')['name'] == 'Second'
+    
+    def test_same_loader_sees_edited_file(self, tmp_path):
+        """Test that a long-lived loader reads a workflow again after an edit"""
+        import os
+        workflow_file = tmp_path / 'edited.json'
+        workflow_file.write_text(json.dumps({"name": "First", "tasks": []}))
+        
+        loader = WorkflowLoader(tmp_path)
+        assert loader.get_workflow_info('edited')['name'] == 'First'
+        
+        workflow_file.write_text(json.dumps({"name": "Second", "tasks": []}))
+        stat = workflow_file.stat()
+        os.utime(workflow_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert loader.get_workflow_info('edited')['name'] == 'Second'
+    
+    def test_info_mutation_does_not_leak(self, tmp_path):
+        """Test that editing a returned definition leaves the shared parse intact"""
+        workflow_file = tmp_path / 'mutable.json'
+        workflow_file.write_text(json.dumps({
+            "name": "Mutable",
+            "config": {"upsert_mode": True},
+            "tasks": []
+        }))
+        
+        loader = WorkflowLoader(tmp_path)
+        info = loader.get_workflow_info('mutable')
+        info['config']['max_parallel'] = 4
+        loader._read_definition('mutable')['tasks'].append({"name": "extra"})
+        
+        again = WorkflowLoader(tmp_path).get_workflow_info('mutable')
+        assert again['config'] == {"upsert_mode": True}
+        assert again['task_count'] == 0
+    
     def test_load_colored_grid_workflow(self):
         """Test loading the colored grid workflow"""
         loader = WorkflowLoader()
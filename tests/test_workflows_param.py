@@ -0,0 +1,56 @@
+"""
+Tests for the bundled lighting and grid workflows
+
+Loads each workflow definition and runs its pure-Python parts (config and
+generator tasks). Spawning the actors still needs the editor; see the
+test_*_in_unreal / test_*_lighting scripts in the scripts root.
+"""
+
+import pytest
+from unreallib.workflow import WorkflowLoader
+from unreallib.workflow.task import TaskStatus
+from unreallib.tasks import LightsGeneratorTask, ForEachLightTask, SpawnGridTask
+
+
+@pytest.fixture(scope="module")
+def loader():
+    """One loader for the whole module, so each workflow file is read once"""
+    return WorkflowLoader()
+
+
+@pytest.mark.parametrize("name,expected_prefix,expected_count", [
+    ("lighting_studio", "studio_", 5),
+    ("lighting_romantic_dining", "romance_", 10),
+])
+def test_lighting_workflow_generates_lights(loader, name, expected_prefix, expected_count):
+    """Test that a lighting workflow's generator yields the expected lights"""
+    workflow = loader.load(name)
+    
+    generators = [t for t in workflow.tasks.values() if isinstance(t, LightsGeneratorTask)]
+    creators = [t for t in workflow.tasks.values() if isinstance(t, ForEachLightTask)]
+    assert len(generators) == 1
+    assert len(creators) == 1
+    assert creators[0].lights_input == f"{generators[0].name}.lights"
+    
+    result = generators[0].execute({})
+    assert result.status == TaskStatus.SUCCESS
+    assert result.output['count'] == expected_count
+    
+    # Lights are labelled prefix + actor_id when created through the registry
+    labels = [
+        loader.last_config.actor_id_prefix + light['actor_id']
+        for light in result.output['lights']
+    ]
+    assert all(expected_prefix in label for label in labels)
+    assert len(set(labels)) == expected_count
+
+
+def test_simple_grid_workflow(loader):
+    """Test that simple_grid builds a 5x5 grid after clearing the level"""
+    workflow = loader.load('simple_grid')
+    
+    grid = workflow.tasks['spawn_grid']
+    assert isinstance(grid, SpawnGridTask)
+    assert grid.params['rows'] * grid.params['cols'] == 25
+    assert workflow.dependencies['spawn_grid'] == ['clear_scene']
+    assert loader.last_config.actor_id_prefix == 'grid_'
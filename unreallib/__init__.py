@@ -8,4 +8,4 @@ and other common Unreal Engine tasks.
 from . import workflow
 from . import tasks
 
-__all__ = ['actors', 'level', 'materials', 'utils', 'workflow', 'tasks']
+__all__ = ['actors', 'asset_cache', 'level', 'materials', 'utils', 'workflow', 'tasks']
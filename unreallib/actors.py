@@ -7,6 +7,8 @@ Functions for spawning, manipulating, and organizing actors in levels.
 import math
 from typing import Optional, Tuple, List
 
+from unreallib import asset_cache
+
 
 def spawn_cube(location: Tuple[float, float, float] = (0, 0, 0), scale: float = 1.0):
     """
@@ -29,7 +31,7 @@ def spawn_cube(location: Tuple[float, float, float] = (0, 0, 0), scale: float =
     editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
     
     # Load cube mesh
-    cube_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cube")
+    cube_mesh = asset_cache.load_asset("/Engine/BasicShapes/Cube")
     
     # Spawn static mesh actor
     actor_location = unreal.Vector(*location)
@@ -63,7 +65,7 @@ def spawn_sphere(location: Tuple[float, float, float] = (0, 0, 0), scale: float
     import unreal
     
     editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    sphere_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Sphere")
+    sphere_mesh = asset_cache.load_asset("/Engine/BasicShapes/Sphere")
     
     actor_location = unreal.Vector(*location)
     actor_rotation = unreal.Rotator(0, 0, 0)
@@ -95,7 +97,7 @@ def spawn_cylinder(location: Tuple[float, float, float] = (0, 0, 0), scale: floa
     import unreal
     
     editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    cylinder_mesh = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder")
+    cylinder_mesh = asset_cache.load_asset("/Engine/BasicShapes/Cylinder")
     
     actor_location = unreal.Vector(*location)
     actor_rotation = unreal.Rotator(0, 0, 0)
@@ -0,0 +1,41 @@
+"""
+Asset loading cache for Unreal Engine
+
+Memoizes EditorAssetLibrary.load_asset lookups by path so repeated loads
+of the same asset (e.g. the basic shape meshes used for every spawn) are
+a dictionary lookup instead of an editor call.
+"""
+
+from typing import Any, Dict, Optional
+
+
+_cache: Dict[str, Any] = {}
+
+
+def load_asset(asset_path: str) -> Optional[Any]:
+    """
+    Load an asset by path, reusing a previously loaded instance if still valid
+    
+    Args:
+        asset_path: Asset path (e.g., '/Engine/BasicShapes/Cube')
+    
+    Returns:
+        The loaded asset, or None if it could not be loaded
+    """
+    import unreal
+    
+    asset = _cache.get(asset_path)
+    if asset is not None and unreal.SystemLibrary.is_valid(asset):
+        return asset
+    
+    asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+    if asset is not None:
+        _cache[asset_path] = asset
+    else:
+        _cache.pop(asset_path, None)
+    return asset
+
+
+def clear_cache():
+    """Forget all cached assets (e.g. after deleting or reimporting assets)"""
+    _cache.clear()
@@ -59,6 +59,71 @@ def get_actor_count():
     return len(all_actors)
 
 
+def snapshot_labels(actor_class=None):
+    """
+    Get every actor in the current level paired with its label
+    
+    Labels are read once here, so callers can filter and print them
+    without asking Unreal for each actor's label again.
+    
+    Args:
+        actor_class: Only include actors of this class (e.g. unreal.Light).
+                     The filtering happens in the engine, so other actors
+                     are never returned to Python.
+    
+    Returns:
+        List of (actor, label) tuples
+    """
+    import unreal
+    
+    if actor_class is None:
+        editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        actors = editor_actor_subsystem.get_all_level_actors()
+    else:
+        actors = unreal.GameplayStatics.get_all_actors_of_class(get_current_level(), actor_class)
+    
+    return [(actor, actor.get_actor_label()) for actor in actors if actor]
+
+
+def actors_with_tag(tag: str):
+    """
+    Get the actors in the current level carrying a tag
+    
+    ActorRegistry tags every actor it creates with its prefix, so this
+    finds a workflow's actors without scanning the whole level.
+    
+    Args:
+        tag: Actor tag (e.g. an actor_id_prefix such as 'studio_')
+    
+    Returns:
+        List of actors
+    """
+    import unreal
+    
+    return list(unreal.GameplayStatics.get_all_actors_with_tag(get_current_level(), tag))
+
+
+def destroy_actors(actors):
+    """
+    Destroy a list of actors with a single editor call
+    
+    Args:
+        actors: Actors to destroy
+    
+    Returns:
+        Number of actors destroyed
+    """
+    import unreal
+    
+    actors = list(actors)
+    if not actors:
+        return 0
+    
+    editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    editor_actor_subsystem.destroy_actors(actors)
+    return len(actors)
+
+
 def save_current_level():
     """
     Save the currently loaded level
@@ -7,6 +7,8 @@ Functions for applying and manipulating materials on actors.
 import unreal
 from typing import Tuple, Optional
 
+from unreallib import asset_cache
+
 
 def set_actor_color(actor: unreal.Actor, color: Tuple[float, float, float], opacity: float = 1.0, base_material_path: Optional[str] = None):
     """
@@ -42,7 +44,7 @@ def set_actor_color(actor: unreal.Actor, color: Tuple[float, float, float], opac
             base_material_path = "/Engine/BasicShapes/BasicShapeMaterial"
     
     # Load base material
-    base_material = unreal.EditorAssetLibrary.load_asset(base_material_path)
+    base_material = asset_cache.load_asset(base_material_path)
     
     if not base_material:
         unreal.log_error(f"Failed to load material: {base_material_path}")
@@ -80,7 +82,7 @@ def set_actor_material(actor: unreal.Actor, material_path: str, material_index:
         unreal.log_warning(f"Actor {actor.get_actor_label()} has no StaticMeshComponent")
         return False
     
-    material = unreal.EditorAssetLibrary.load_asset(material_path)
+    material = asset_cache.load_asset(material_path)
     
     if material:
         static_mesh_component.set_material(material_index, material)
@@ -34,6 +34,7 @@ from .spawn_grid_task import SpawnGridTask
 from .spawn_circle_task import SpawnCircleTask
 from .spawn_spiral_task import SpawnSpiralTask
 from .set_actor_color_task import SetActorColorTask
+from .set_actor_colors_task import SetActorColorsTask
 from .color_grid_task import ColorGridTask
 from .material_upsert_task import MaterialUpsertTask
 from .apply_materials_task import ApplyMaterialsTask
@@ -57,6 +58,7 @@ __all__ = [
     'SpawnCircleTask',
     'SpawnSpiralTask',
     'SetActorColorTask',
+    'SetActorColorsTask',
     'ColorGridTask',
     'MaterialUpsertTask',
     'ApplyMaterialsTask',
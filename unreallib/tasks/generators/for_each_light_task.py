@@ -66,13 +66,14 @@ class ForEachLightTask(Task):
         
         if not lights:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f'No lights found at input: {self.lights_input}'}
             )
         
-        if not isinstance(lights, list):
+        # Generators hand over a tuple; JSON and hand-built inputs are lists
+        if not isinstance(lights, (list, tuple)):
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f'Lights input must be a list, got: {type(lights).__name__}'}
             )
         
@@ -82,15 +83,20 @@ class ForEachLightTask(Task):
         
         for idx, light_config in enumerate(lights):
             try:
+                # Fields used for both the task and the result record
+                actor_id = light_config.get('actor_id')
+                light_type = light_config.get('light_type', 'point')
+                location = light_config.get('location', (0, 0, 300))
+                
                 # Create CreateLightTask for this light
                 light_task = CreateLightTask(
                     name=f"{self.name}_light_{idx}",
-                    light_type=light_config.get('light_type', 'point'),
-                    location=light_config.get('location', (0, 0, 300)),
+                    light_type=light_type,
+                    location=location,
                     rotation=light_config.get('rotation', (0, 0, 0)),
                     intensity=light_config.get('intensity', 5000.0),
                     color=light_config.get('color', (1.0, 1.0, 1.0)),
-                    actor_id=light_config.get('actor_id'),
+                    actor_id=actor_id,
                     use_registry=self.use_registry
                 )
                 
@@ -99,14 +105,14 @@ class ForEachLightTask(Task):
                 
                 if result.status == TaskStatus.SUCCESS:
                     created_lights.append({
-                        'actor_id': light_config.get('actor_id'),
+                        'actor_id': actor_id,
                         'light_type': light_config.get('light_type'),
                         'location': light_config.get('location'),
                         'action': result.output.get('action', 'created')
                     })
                 else:
                     failed_lights.append({
-                        'actor_id': light_config.get('actor_id'),
+                        'actor_id': actor_id,
                         'error': result.output.get('error', 'Unknown error')
                     })
             
@@ -118,7 +124,7 @@ class ForEachLightTask(Task):
         
         # Determine overall status
         if failed_lights and not created_lights:
-            status = TaskStatus.FAILURE
+            status = TaskStatus.FAILED
         elif failed_lights:
             status = TaskStatus.PARTIAL_SUCCESS
         else:
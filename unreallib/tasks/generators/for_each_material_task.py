@@ -49,7 +49,7 @@ class ForEachMaterialTask(Task):
         
         if not material_map:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f'No material mapping found'}
             )
         
@@ -86,7 +86,7 @@ class ForEachMaterialTask(Task):
         if modified_count > 0:
             status = TaskStatus.SUCCESS
         elif errors:
-            status = TaskStatus.FAILURE
+            status = TaskStatus.FAILED
         else:
             status = TaskStatus.SUCCESS
         
@@ -47,7 +47,7 @@ class ForEachSpawnTask(Task):
         
         if not data_points:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f'No data found in context["{self.data_key}"]'}
             )
         
@@ -5,10 +5,18 @@ This task takes a list of light configurations and outputs them for
 iteration by ForEach tasks or for batch processing.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List
 from unreallib.workflow.task import Task, TaskResult, TaskStatus
 
 
+# Light types CreateLightTask can spawn
+_LIGHT_TYPES = ('point', 'spot', 'directional')
+
+# Optional per-light properties passed through when present
+_OPTIONAL_PROPERTIES = ('radius', 'cast_shadows', 'inner_cone_angle', 'outer_cone_angle')
+
+
 class LightsGeneratorTask(Task):
     """
     Generate light configurations from a structured definition
@@ -70,7 +78,7 @@ class LightsGeneratorTask(Task):
         
         if not self.lights:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': 'No lights defined'}
             )
         
@@ -81,24 +89,23 @@ class LightsGeneratorTask(Task):
             # Validate required fields
             if 'light_type' not in light_config:
                 return TaskResult(
-                    status=TaskStatus.FAILURE,
+                    status=TaskStatus.FAILED,
                     output={'error': f'Light {idx} missing required field: light_type'}
                 )
             
             if 'location' not in light_config:
                 return TaskResult(
-                    status=TaskStatus.FAILURE,
+                    status=TaskStatus.FAILED,
                     output={'error': f'Light {idx} missing required field: location'}
                 )
             
             # Validate light type
-            valid_types = ['point', 'spot', 'directional']
-            if light_config['light_type'] not in valid_types:
+            if light_config['light_type'] not in _LIGHT_TYPES:
                 return TaskResult(
-                    status=TaskStatus.FAILURE,
+                    status=TaskStatus.FAILED,
                     output={
                         'error': f'Light {idx} has invalid light_type: {light_config["light_type"]}. '
-                                f'Must be one of: {", ".join(valid_types)}'
+                                f'Must be one of: {", ".join(_LIGHT_TYPES)}'
                     }
                 )
             
@@ -113,20 +120,15 @@ class LightsGeneratorTask(Task):
             }
             
             # Optional properties (for potential future use)
-            if 'radius' in light_config:
-                processed_light['radius'] = light_config['radius']
-            
-            if 'cast_shadows' in light_config:
-                processed_light['cast_shadows'] = light_config['cast_shadows']
-            
-            if 'inner_cone_angle' in light_config:
-                processed_light['inner_cone_angle'] = light_config['inner_cone_angle']
-            
-            if 'outer_cone_angle' in light_config:
-                processed_light['outer_cone_angle'] = light_config['outer_cone_angle']
+            for key in _OPTIONAL_PROPERTIES:
+                if key in light_config:
+                    processed_light[key] = light_config[key]
             
             processed_lights.append(processed_light)
         
+        # Frozen as a tuple: downstream tasks only read the configs
+        processed_lights = tuple(processed_lights)
+        
         return TaskResult(
             status=TaskStatus.SUCCESS,
             output={
@@ -136,10 +138,14 @@ class LightsGeneratorTask(Task):
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_schema() -> Dict[str, Any]:
         """
         Get JSON schema for light configurations
         
+        The schema is built once and the same dictionary is returned on
+        every call, so callers must not modify it.
+        
         Returns:
             JSON schema dictionary describing the light configuration format
         """
@@ -159,7 +165,7 @@ class LightsGeneratorTask(Task):
                             },
                             "light_type": {
                                 "type": "string",
-                                "enum": ["point", "spot", "directional"],
+                                "enum": list(_LIGHT_TYPES),
                                 "description": "Type of light to create"
                             },
                             "location": {
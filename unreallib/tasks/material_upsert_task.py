@@ -57,7 +57,7 @@ class MaterialUpsertTask(Task):
                     }
                 )
             # Create directory if needed
-            pkg_path = "/".join(self.material_path.split("/")[:-1])
+            pkg_path, _, asset_name = self.material_path.rpartition("/")
             if not editor_asset_lib.does_directory_exist(pkg_path):
                 editor_asset_lib.make_directory(pkg_path)
             parent = editor_asset_lib.load_asset(self.parent_material_path)
@@ -67,7 +67,6 @@ class MaterialUpsertTask(Task):
                     error=f"Parent material not found: {self.parent_material_path}",
                     metadata={'task_type': 'material_upsert'}
                 )
-            asset_name = self.material_path.split("/")[-1]
             package_path = pkg_path
             material_instance = asset_tools.create_asset(
                 asset_name=asset_name,
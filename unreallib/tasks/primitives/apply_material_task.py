@@ -58,13 +58,13 @@ class ApplyMaterialTask(Task):
         
         if not actor:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': 'No actor specified or found'}
             )
         
         if not self.material_path:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': 'No material_path specified'}
             )
         
@@ -86,6 +86,6 @@ class ApplyMaterialTask(Task):
             )
         else:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f'Failed to apply material: {self.material_path}'}
             )
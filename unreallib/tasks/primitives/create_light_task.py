@@ -7,6 +7,14 @@ from unreallib.workflow.task import Task, TaskResult, TaskStatus
 import unreal
 
 
+# light_type -> Unreal light actor class
+_LIGHT_CLASSES = {
+    'point': unreal.PointLight,
+    'spot': unreal.SpotLight,
+    'directional': unreal.DirectionalLight,
+}
+
+
 class CreateLightTask(Task):
     """
     Create a single light actor
@@ -61,20 +69,14 @@ class CreateLightTask(Task):
         """Create a light actor"""
         from unreallib.utils import ActorRegistry
         
-        # Map light type to Unreal class
-        light_classes = {
-            'point': unreal.PointLight.static_class(),
-            'spot': unreal.SpotLight.static_class(),
-            'directional': unreal.DirectionalLight.static_class()
-        }
-        
-        if self.light_type not in light_classes:
+        # Map light type to Unreal class (only the one needed is resolved)
+        if self.light_type not in _LIGHT_CLASSES:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f"Unknown light type: {self.light_type}"}
             )
         
-        light_class = light_classes[self.light_type]
+        light_class = _LIGHT_CLASSES[self.light_type].static_class()
         
         # Check if we should use upsert mode
         config = context.get('workflow_config')
@@ -65,7 +65,7 @@ class ImportModelTask(Task):
         
         if not self.source:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': 'No source specified (file path or asset path)'}
             )
         
@@ -77,7 +77,7 @@ class ImportModelTask(Task):
             static_mesh = self._import_file(self.source)
             if not static_mesh:
                 return TaskResult(
-                    status=TaskStatus.FAILURE,
+                    status=TaskStatus.FAILED,
                     output={'error': f'Failed to import file: {self.source}'}
                 )
         else:
@@ -85,7 +85,7 @@ class ImportModelTask(Task):
             static_mesh = unreal.EditorAssetLibrary.load_asset(self.source)
             if not static_mesh:
                 return TaskResult(
-                    status=TaskStatus.FAILURE,
+                    status=TaskStatus.FAILED,
                     output={'error': f'Failed to load asset: {self.source}'}
                 )
         
@@ -245,9 +245,8 @@ class ImportModelTask(Task):
         
         # Get folder paths for Blueprint detection/creation
         first_mesh_path = imported_meshes[0].get_path_name()
-        folder_path = '/'.join(first_mesh_path.split('/')[:-1])
-        base_name = folder_path.split('/')[-1]
-        parent_folder = '/'.join(folder_path.split('/')[:-1])
+        folder_path = first_mesh_path.rpartition('/')[0]
+        parent_folder, _, base_name = folder_path.rpartition('/')
         
         # Try common Blueprint naming patterns (case variations)
         blueprint_names = [
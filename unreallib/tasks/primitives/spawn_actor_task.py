@@ -68,7 +68,7 @@ class SpawnActorTask(Task):
         
         if self.shape not in spawn_funcs:
             return TaskResult(
-                status=TaskStatus.FAILURE,
+                status=TaskStatus.FAILED,
                 output={'error': f"Unknown shape: {self.shape}"}
             )
         
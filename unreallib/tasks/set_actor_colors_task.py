@@ -0,0 +1,56 @@
+"""
+Set Actor Colors Task - Applies a different color to each of several actors
+"""
+
+from typing import Dict, Tuple
+from unreallib.workflow.task import Task, TaskResult, TaskStatus
+
+
+class SetActorColorsTask(Task):
+    """Task to color many actors in one pass over the level"""
+    
+    def __init__(
+        self,
+        name: str,
+        colors: Dict[str, Tuple[float, float, float]],
+        opacity: float = 1.0
+    ):
+        """
+        Initialize bulk color task
+        
+        Args:
+            name: Task identifier
+            colors: Mapping of actor label to RGB color tuple (0-1 range)
+            opacity: Opacity value (0-1) applied to every actor
+        """
+        # Pass params to base class so they're properly stored in context
+        super().__init__(name, colors=colors, opacity=opacity)
+        self.colors = colors
+        self.opacity = opacity
+    
+    def execute(self, context: dict) -> TaskResult:
+        """Apply each actor's color from a single level sweep"""
+        import unreal
+        from unreallib import materials
+
+        print(f"SetActorColorsTask: {len(self.colors)} target labels")
+        editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        all_actors = editor_actor_subsystem.get_all_level_actors()
+
+        modified_count = 0
+        for actor in all_actors:
+            label = actor.get_actor_label()
+            color = self.colors.get(label)
+            if color is not None:
+                print(f"  Coloring actor '{label}' -> {color}")
+                materials.set_actor_color(actor, color, self.opacity)
+                modified_count += 1
+
+        return TaskResult(
+            status=TaskStatus.SUCCESS,
+            output={
+                'modified_count': modified_count,
+                'actor_labels': list(self.colors)
+            },
+            metadata={'task_type': 'set_actor_colors'}
+        )
@@ -36,13 +36,27 @@ class ActorRegistry:
             if actor:
                 label = actor.get_actor_label()
                 if label.startswith(self.prefix):
-                    # This actor belongs to our registry
+                    # This actor belongs to our registry; tag it in case
+                    # it predates prefix tagging
                     self._actors[label] = actor
+                    self._tag(actor)
                     loaded_count += 1
         
         if loaded_count > 0:
             print(f"  [ActorRegistry] Loaded {loaded_count} existing actors with prefix '{self.prefix}'")
     
+    def _tag(self, actor: unreal.Actor):
+        """
+        Tag an actor with the registry prefix
+        
+        The whole group can then be looked up by tag in the engine without
+        reading every actor's label.
+        """
+        tags = list(actor.get_editor_property('tags'))
+        if self.prefix not in (str(tag) for tag in tags):
+            tags.append(unreal.Name(self.prefix))
+            actor.set_editor_property('tags', tags)
+    
     def register(self, actor_id: str, actor: unreal.Actor):
         """
         Register an actor with an ID
@@ -57,6 +71,8 @@ class ActorRegistry:
         # Set actor label in Unreal for debugging
         print(f"  [ActorRegistry] Setting label: '{full_id}' on actor {actor}")
         actor.set_actor_label(full_id)
+        self._tag(actor)
+        
         # Verify it was set
         actual_label = actor.get_actor_label()
         print(f"  [ActorRegistry] Verified label: '{actual_label}'")
@@ -6,16 +6,24 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """
     Global configuration for workflow execution
     
+    Instances are immutable, so presets can be shared safely and
+    configs can be used as dictionary keys.
+    
     Attributes:
         clear_before_execute: If True, clear all actors before running workflow
         upsert_mode: If True, update existing actors instead of always creating new ones
         actor_id_prefix: Prefix for actor labels/IDs (for tracking)
         save_level_after: If True, save level after workflow completes
+        max_parallel: Maximum number of independent tasks to run at once
+                      (1 runs tasks one at a time in topological order).
+                      Only for workflows whose tasks never call the editor
+                      API, which must stay on the game thread; it can only
+                      be set in code, never from a workflow file
         metadata: Additional custom configuration
     """
     
@@ -23,7 +31,8 @@ class WorkflowConfig:
     upsert_mode: bool = False
     actor_id_prefix: str = "workflow_"
     save_level_after: bool = False
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    max_parallel: int = 1
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
@@ -37,7 +46,12 @@ class WorkflowConfig:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowConfig':
-        """Create config from dictionary"""
+        """
+        Create config from dictionary
+        
+        max_parallel is deliberately not read: workflow files are made of
+        editor tasks, which must not run on pool threads.
+        """
         return cls(
             clear_before_execute=data.get('clear_before_execute', False),
             upsert_mode=data.get('upsert_mode', False),
@@ -51,7 +65,8 @@ class WorkflowConfig:
             f"WorkflowConfig("
             f"clear={self.clear_before_execute}, "
             f"upsert={self.upsert_mode}, "
-            f"save={self.save_level_after})"
+            f"save={self.save_level_after}, "
+            f"parallel={self.max_parallel})"
         )
 
 
@@ -2,17 +2,29 @@
 Workflow executor - runs tasks in dependency order
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Dict, Any, List, Optional
 from .graph import WorkflowGraph
 from .task import Task, TaskResult, TaskStatus
 from .config import WorkflowConfig
 
+# Statuses whose output feeds downstream tasks; a partial success still
+# produced usable items (e.g. the lights that were created)
+_COMPLETED = (TaskStatus.SUCCESS, TaskStatus.PARTIAL_SUCCESS)
+
 
 class WorkflowExecutor:
     """
     Executes workflow tasks in dependency order
     
     Manages execution context and handles task outputs/failures.
+    
+    With config.max_parallel > 1, tasks whose dependencies have all
+    finished are dispatched concurrently on a thread pool (ready-set
+    scheduling). Editor API calls must stay on the game thread, so this
+    is only for tasks that never touch unreal; tasks also share the same
+    context dict and their output may interleave.
     """
     
     def __init__(self, graph: WorkflowGraph, config: Optional[WorkflowConfig] = None):
@@ -27,6 +39,7 @@ class WorkflowExecutor:
         self.config = config or WorkflowConfig()
         self.context: Dict[str, Any] = {}
         self.results: Dict[str, TaskResult] = {}
+        self.layers: Dict[str, int] = {}
     
     def execute(self, initial_context: Dict[str, Any] = None) -> Dict[str, TaskResult]:
         """
@@ -53,8 +66,13 @@ class WorkflowExecutor:
         # Validate workflow
         self.graph.validate()
         
-        # Get execution order
+        # Get execution order, and the layer each task belongs to
         execution_order = self.graph.get_execution_order()
+        self.layers = {
+            task_name: layer
+            for layer, task_names in enumerate(self.graph.get_execution_layers())
+            for task_name in task_names
+        }
         
         print("\n" + "=" * 60)
         print("Starting Workflow Execution")
@@ -64,29 +82,11 @@ class WorkflowExecutor:
         print(f"Order: {' → '.join(execution_order)}")
         print("=" * 60 + "\n")
         
-        # Execute tasks in order
-        for task_name in execution_order:
-            task = self.graph[task_name]
-            
-            # Check if dependencies succeeded
-            deps = self.graph.dependencies[task_name]
-            if not self._check_dependencies(deps):
-                # Skip task if dependencies failed
-                result = TaskResult(
-                    status=TaskStatus.SKIPPED,
-                    error="Dependency failed"
-                )
-                self.results[task_name] = result
-                print(f"[{task_name}] Skipped (dependency failed)")
-                continue
-            
-            # Execute task
-            result = task.run(self.context)
-            self.results[task_name] = result
-            
-            # Add task output to context for downstream tasks
-            if result.success and result.output is not None:
-                self.context[task_name] = result.output
+        if self.config.max_parallel > 1:
+            self._execute_parallel()
+        else:
+            for task_name in execution_order:
+                self._run_task(task_name)
         
         # Save level if configured
         if self.config.save_level_after:
@@ -98,6 +98,64 @@ class WorkflowExecutor:
         
         return self.results
     
+    def _run_task(self, task_name: str):
+        """Run a single task, skipping it if any dependency didn't succeed"""
+        task = self.graph[task_name]
+        
+        # Check if dependencies succeeded
+        deps = self.graph.dependencies[task_name]
+        if not self._check_dependencies(deps):
+            # Skip task if dependencies failed
+            result = TaskResult(
+                status=TaskStatus.SKIPPED,
+                error="Dependency failed",
+                layer=self.layers[task_name]
+            )
+            self.results[task_name] = result
+            print(f"[{task_name}] Skipped (dependency failed)")
+            return
+        
+        # Execute task
+        result = task.run(self.context)
+        result.layer = self.layers[task_name]
+        self.results[task_name] = result
+        
+        # Add task output to context for downstream tasks
+        if result.status in _COMPLETED and result.output is not None:
+            self.context[task_name] = result.output
+    
+    def _execute_parallel(self):
+        """
+        Run tasks on a thread pool as soon as their dependencies finish
+        
+        Keeps a ready set of tasks with no unfinished dependencies; each
+        completion decrements the in-degree of its dependents and queues
+        the ones that reach zero.
+        """
+        in_degree = {name: len(deps) for name, deps in self.graph.dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.graph.tasks}
+        for name, deps in self.graph.dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=self.config.max_parallel) as pool:
+            while ready or running:
+                while ready and len(running) < self.config.max_parallel:
+                    task_name = ready.popleft()
+                    running[pool.submit(self._run_task, task_name)] = task_name
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_name = running.pop(future)
+                    future.result()
+                    for dependent in dependents[task_name]:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready.append(dependent)
+    
     def _clear_level(self):
         """Clear all actors from level (pre-execution)"""
         try:
@@ -121,18 +179,18 @@ class WorkflowExecutor:
     
     def _check_dependencies(self, deps: List[str]) -> bool:
         """
-        Check if all dependencies succeeded
+        Check if all dependencies succeeded, at least partially
         
         Args:
             deps: List of dependency task names
             
         Returns:
-            True if all dependencies succeeded
+            True if all dependencies succeeded or partially succeeded
         """
         for dep_name in deps:
             if dep_name not in self.results:
                 return False
-            if not self.results[dep_name].success:
+            if self.results[dep_name].status not in _COMPLETED:
                 return False
         return True
     
@@ -143,12 +201,15 @@ class WorkflowExecutor:
         print("=" * 60)
         
         success_count = sum(1 for r in self.results.values() if r.status == TaskStatus.SUCCESS)
+        partial_count = sum(1 for r in self.results.values() if r.status == TaskStatus.PARTIAL_SUCCESS)
         failed_count = sum(1 for r in self.results.values() if r.status == TaskStatus.FAILED)
         skipped_count = sum(1 for r in self.results.values() if r.status == TaskStatus.SKIPPED)
         total_time = sum(r.execution_time for r in self.results.values())
         
         print(f"Total Tasks: {len(self.results)}")
         print(f"  Success: {success_count}")
+        if partial_count:
+            print(f"  Partial: {partial_count}")
         print(f"  Failed:  {failed_count}")
         print(f"  Skipped: {skipped_count}")
         print(f"Total Time: {total_time:.3f}s")
@@ -40,6 +40,36 @@ class WorkflowGraph:
                     f"which hasn't been added to workflow yet"
                 )
     
+    def add_tasks(self, tasks: List[Task], depends_on: List[str] = None):
+        """
+        Add several tasks that share the same dependencies
+        
+        All tasks are validated before any are added, so a failure
+        leaves the workflow unchanged.
+        
+        Args:
+            tasks: Task instances to add
+            depends_on: List of task names every task depends on
+        """
+        deps = depends_on or []
+        
+        for dep_name in deps:
+            if dep_name not in self.tasks:
+                raise ValueError(
+                    f"Tasks depend on '{dep_name}' "
+                    f"which hasn't been added to workflow yet"
+                )
+        
+        names = set()
+        for task in tasks:
+            if task.name in self.tasks or task.name in names:
+                raise ValueError(f"Task '{task.name}' already exists in workflow")
+            names.add(task.name)
+        
+        for task in tasks:
+            self.tasks[task.name] = task
+            self.dependencies[task.name] = list(deps)
+    
     def get_execution_order(self) -> List[str]:
         """
         Get topologically sorted execution order
@@ -80,6 +110,30 @@ class WorkflowGraph:
         
         return execution_order
     
+    def get_execution_layers(self) -> List[List[str]]:
+        """
+        Group tasks into topological layers
+        
+        Layer 0 holds the tasks with no dependencies; every other task sits
+        one layer after its deepest dependency. Tasks in the same layer
+        don't depend on each other, so they can run at the same time.
+        
+        Returns:
+            List of layers, each a list of task names
+            
+        Raises:
+            ValueError: If circular dependency detected
+        """
+        layer_of = {}
+        for task_name in self.get_execution_order():
+            deps = self.dependencies[task_name]
+            layer_of[task_name] = 1 + max((layer_of[dep] for dep in deps), default=-1)
+        
+        layers = [[] for _ in range(max(layer_of.values(), default=-1) + 1)]
+        for task_name, layer in layer_of.items():
+            layers[layer].append(task_name)
+        return layers
+    
     def validate(self) -> bool:
         """
         Validate the workflow graph
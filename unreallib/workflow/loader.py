@@ -5,7 +5,9 @@ This module provides functionality to load workflow definitions from JSON
 files and convert them into executable workflow graphs.
 """
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -29,12 +31,32 @@ from unreallib.tasks import (
     SpawnCircleTask,
     SpawnSpiralTask,
     SetActorColorTask,
+    SetActorColorsTask,
     ColorGridTask,
     MaterialUpsertTask,
     ApplyMaterialsTask,
 )
 
 
+# orjson is optional (Unreal's bundled Python doesn't ship it); both
+# parsers accept the raw file bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=64)
+def _parse_workflow_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a workflow JSON file
+    
+    Cached across loaders; mtime_ns is part of the key so an edited file
+    is parsed again.
+    """
+    return _json_loads(Path(path).read_bytes())
+
+
 # Task type registry - maps string names to task classes
 TASK_REGISTRY = {
     # Primitive tasks
@@ -55,6 +77,7 @@ TASK_REGISTRY = {
     'SpawnCircleTask': SpawnCircleTask,
     'SpawnSpiralTask': SpawnSpiralTask,
     'SetActorColorTask': SetActorColorTask,
+    'SetActorColorsTask': SetActorColorsTask,
     'ColorGridTask': ColorGridTask,
     'MaterialUpsertTask': MaterialUpsertTask,
     'ApplyMaterialsTask': ApplyMaterialsTask,
@@ -95,20 +118,37 @@ class WorkflowLoader:
             executor = WorkflowExecutor()
             executor.execute(workflow)
         """
+        workflow_def = self._read_definition(workflow_file)
+        
+        return self._build_workflow(workflow_def)
+    
+    def _read_definition(self, workflow_file: str) -> Dict[str, Any]:
+        """
+        Read and parse a workflow JSON file
+        
+        Parsing is cached by path and modification time, so an edited
+        file is always read again. Callers get their own copy, since the
+        cached tree is shared with every other loader.
+        
+        Args:
+            workflow_file: Filename (with or without .json extension)
+        
+        Returns:
+            Parsed workflow definition
+        """
         # Add .json extension if not present
         if not workflow_file.endswith('.json'):
             workflow_file = f"{workflow_file}.json"
         
         workflow_path = self.workflows_dir / workflow_file
         
-        if not workflow_path.exists():
-            raise FileNotFoundError(f"Workflow file not found: {workflow_path}")
-        
-        # Load JSON
-        with open(workflow_path, 'r', encoding='utf-8') as f:
-            workflow_def = json.load(f)
+        try:
+            mtime_ns = workflow_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Workflow file not found: {workflow_path}") from None
         
-        return self._build_workflow(workflow_def)
+        # Load JSON (shared with other loaders until the file changes)
+        return copy.deepcopy(_parse_workflow_file(str(workflow_path), mtime_ns))
     
     def _build_workflow(self, definition: Dict[str, Any]) -> WorkflowGraph:
         """
@@ -196,6 +236,21 @@ class WorkflowLoader:
             f.name for f in self.workflows_dir.glob('*.json')
         ]
     
+    def list_workflow_infos(self) -> List[Dict[str, Any]]:
+        """
+        Get metadata for all available workflows
+        
+        Each file is parsed once; the parsed definition is kept so a
+        following load() of the same workflow doesn't read it again.
+        
+        Returns:
+            List of workflow info dictionaries (see get_workflow_info)
+        """
+        return [
+            self.get_workflow_info(workflow_file)
+            for workflow_file in self.list_workflows()
+        ]
+    
     def get_workflow_info(self, workflow_file: str) -> Dict[str, Any]:
         """
         Get metadata about a workflow without loading it
@@ -209,13 +264,7 @@ class WorkflowLoader:
         if not workflow_file.endswith('.json'):
             workflow_file = f"{workflow_file}.json"
         
-        workflow_path = self.workflows_dir / workflow_file
-        
-        if not workflow_path.exists():
-            raise FileNotFoundError(f"Workflow file not found: {workflow_path}")
-        
-        with open(workflow_path, 'r', encoding='utf-8') as f:
-            workflow_def = json.load(f)
+        workflow_def = self._read_definition(workflow_file)
         
         return {
             'name': workflow_def.get('name', 'Unnamed'),
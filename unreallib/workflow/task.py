@@ -14,6 +14,7 @@ class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
+    PARTIAL_SUCCESS = "partial_success"  # Composite task where only some items failed
     FAILED = "failed"
     SKIPPED = "skipped"
 
@@ -26,6 +27,7 @@ class TaskResult:
     error: Optional[str] = None
     execution_time: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    layer: Optional[int] = None  # Topological layer, set by WorkflowExecutor
     
     @property
     def success(self) -> bool: